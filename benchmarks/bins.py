@@ -0,0 +1,46 @@
+"""Compare binned colorization with BoundaryNorm and colorize.colorize_bins.
+
+Usage: python benchmarks/bins.py [size]
+"""
+
+import sys
+import time
+
+import numpy as np
+from matplotlib.colors import BoundaryNorm
+
+import tol_colors as tc
+from tol_colors.colorize import bin_indices, colorize_bins
+
+
+def timeit(func, repeat=5):
+    best = np.inf
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best * 1e3
+
+
+def main():
+    size = int(sys.argv[1]) if len(sys.argv) > 1 else 2048
+    rng = np.random.default_rng(0)
+    print(f"{size}x{size} values, times in ms")
+    print(f"{'cmap':>18} {'dtype':>8} {'BoundaryNorm':>13} {'bins':>7} "
+          f"{'threads':>8} {'indices':>8}")  # fmt: skip
+    for name in ["sunset_discrete", "BuRd_discrete"]:
+        cmap = tc.colormaps[name]
+        edges = np.linspace(-2, 2, cmap.N + 1)
+        norm = BoundaryNorm(edges, cmap.N)
+        for dtype in [np.float32, np.float64]:
+            data = rng.normal(0, 1, (size, size)).astype(dtype)
+            mpl = timeit(lambda: cmap(norm(data), bytes=True))  # noqa: B023
+            bins = timeit(lambda: colorize_bins(data, edges, name))  # noqa: B023
+            par = timeit(lambda: colorize_bins(data, edges, name, threads=4))  # noqa: B023
+            idx = timeit(lambda: bin_indices(data, edges))  # noqa: B023
+            print(f"{name:>18} {np.dtype(dtype).name:>8} {mpl:>13.1f} {bins:>7.1f} "
+                  f"{par:>8.1f} {idx:>8.1f}")  # fmt: skip
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,57 @@
+"""Compare colorizing many small arrays one by one and in a single call.
+
+Arrays are sparklines of 20 to 60 values, each with its own range and one of a few
+colormaps.
+
+Usage: python benchmarks/colorize_many.py [n_arrays]
+"""
+
+import sys
+import time
+
+import numpy as np
+from matplotlib.colors import Normalize
+
+import tol_colors as tc
+from tol_colors.colorize import colorize, colorize_many
+
+
+def timeit(func, repeat=3):
+    best = np.inf
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best * 1e3
+
+
+def main():
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 20_000
+    rng = np.random.default_rng(0)
+    arrays = [rng.normal(0, 1, rng.integers(20, 60)) for _ in range(n)]
+    vmin = [a.min() for a in arrays]
+    vmax = [a.max() for a in arrays]
+    names = rng.choice(["YlOrBr", "sunset", "BuRd_discrete", "iridescent"], n)
+
+    def matplotlib_loop():
+        for a, c, lo, hi in zip(arrays, names, vmin, vmax, strict=True):
+            tc.colormaps[c](Normalize(lo, hi)(a), bytes=True)
+
+    def colorize_loop():
+        for a, c, lo, hi in zip(arrays, names, vmin, vmax, strict=True):
+            colorize(a, c, lo, hi)
+
+    def batch():
+        colorize_many(arrays, list(names), vmin, vmax)
+
+    print(f"{n} arrays")
+    for name, func in [
+        ("matplotlib loop", matplotlib_loop),
+        ("colorize loop", colorize_loop),
+        ("colorize_many", batch),
+    ]:
+        print(f"{name:>16} {timeit(func):>8.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
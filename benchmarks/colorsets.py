@@ -0,0 +1,40 @@
+"""Compare looking up colorset colors by parsing hex strings and with arrays.
+
+Usage: python benchmarks/colorsets.py [n_lookups]
+"""
+
+import sys
+import time
+
+import numpy as np
+from matplotlib.colors import to_rgb, to_rgba_array
+
+import tol_colors as tc
+
+
+def timeit(func, repeat=5):
+    best = np.inf
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best * 1e3
+
+
+def main():
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+    cset = tc.land_cover
+    classes = np.random.default_rng(0).integers(0, len(cset), n)
+    print(f"{n} lookups in land_cover, times in ms")
+    for name, func in [
+        ("to_rgb loop", lambda: [to_rgb(cset[i]) for i in classes]),
+        ("to_rgba_array", lambda: to_rgba_array([cset[i] for i in classes])),
+        ("rgb[classes]", lambda: cset.rgb[classes]),
+        ("rgba8[classes]", lambda: cset.rgba8[classes]),
+        ("packed[classes]", lambda: cset.packed[classes]),
+    ]:
+        print(f"{name:>16} {timeit(func):>9.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,54 @@
+"""Measure scoring many colormaps in color vision deficiencies.
+
+Colormaps are scored one at a time, in a single batch, and again from the cache.
+
+Usage: python benchmarks/cvd.py [n_colormaps]
+"""
+
+import sys
+import time
+
+import numpy as np
+from matplotlib.colors import LinearSegmentedColormap
+
+from tol_colors import cvd
+
+
+def timeit(func, repeat=5):
+    best = np.inf
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best * 1e3
+
+
+def main():
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 500
+    rng = np.random.default_rng(0)
+    cmaps = [
+        LinearSegmentedColormap.from_list(f"user{i}", rng.random((5, 3)))
+        for i in range(n)
+    ]
+    # build lookup tables beforehand, this is done once for each colormap
+    for cmap in cmaps:
+        cmap._init()
+
+    def one_by_one():
+        cvd.clear_cache()
+        for cmap in cmaps:
+            cvd.score([cmap])
+
+    def batch():
+        cvd.clear_cache()
+        cvd.score(cmaps)
+
+    cvd.score(cmaps)
+    print(f"{n} colormaps, times in ms")
+    print(f"{'one by one':>12} {timeit(one_by_one):>9.1f}")
+    print(f"{'batch':>12} {timeit(batch):>9.1f}")
+    print(f"{'cached':>12} {timeit(lambda: cvd.score(cmaps)):>9.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,43 @@
+"""Compare building property cyclers for each figure with cached cyclers.
+
+Usage: python benchmarks/cyclers.py [n_figures]
+"""
+
+import sys
+import time
+
+import numpy as np
+from cycler import cycler
+
+import tol_colors as tc
+
+
+def timeit(func, repeat=5):
+    best = np.inf
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best * 1e3
+
+
+def main():
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 10_000
+    linestyles = ["-", "--", ":", "-."]
+
+    def rebuild():
+        for _ in range(n):
+            colors = list(tc.colorsets["bright"]) * 4
+            cycler(color=colors) + cycler(linestyle=linestyles * 7)
+
+    def cached():
+        for _ in range(n):
+            tc.cycler("bright", with_linestyles=True)
+
+    print(f"{n} figures, times in ms")
+    print(f"{'rebuild':>8} {timeit(rebuild):>9.1f}")
+    print(f"{'cached':>8} {timeit(cached):>9.1f}")
+
+
+if __name__ == "__main__":
+    main()
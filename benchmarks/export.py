@@ -0,0 +1,42 @@
+"""Compare ways of handing the lookup tables of all colormaps to another program.
+
+Serializing the tables (JSON, per-colormap bytes) is compared with building a
+single table once and exposing its buffer, which consumers read without copies.
+
+Usage: python benchmarks/export.py [N]
+"""
+
+import json
+import sys
+import time
+
+import numpy as np
+
+from tol_colors.export import colormap_table
+
+
+def timeit(func, repeat=5):
+    best = np.inf
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best * 1e3
+
+
+def main():
+    N = int(sys.argv[1]) if len(sys.argv) > 1 else 256  # noqa: N806
+    table = colormap_table(N, bytes=True)
+    luts = {name: table[name] for name in table}
+    print(f"{len(table)} colormaps, N={N}, {table.data.nbytes // 1024} kB, in ms")
+    for name, func in [
+        ("JSON", lambda: json.dumps({k: v.tolist() for k, v in luts.items()})),
+        ("bytes per cmap", lambda: {k: v.tobytes() for k, v in luts.items()}),
+        ("build table", lambda: colormap_table(N, bytes=True)),
+        ("memoryview", lambda: memoryview(table.data)),
+    ]:
+        print(f"{name:>15} {timeit(func):>9.3f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,43 @@
+"""Compare converting hex strings with tol_colors and matplotlib.
+
+Usage: python benchmarks/hexcolors.py [n_colors]
+"""
+
+import sys
+import time
+
+import numpy as np
+from matplotlib.colors import to_hex, to_rgb, to_rgba_array
+
+import tol_colors as tc
+
+
+def timeit(func, repeat=5):
+    best = np.inf
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best * 1e3
+
+
+def main():
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+    rgb = np.random.default_rng(0).random((n, 3))
+    colors = tc.rgb_to_hex(rgb)
+    as_list = colors.tolist()
+    print(f"{n} colors, times in ms")
+    for name, func in [
+        ("to_rgb loop", lambda: [to_rgb(c) for c in as_list]),
+        ("to_rgba_array", lambda: to_rgba_array(as_list)),
+        ("hex_to_rgb list", lambda: tc.hex_to_rgb(as_list)),
+        ("hex_to_rgb array", lambda: tc.hex_to_rgb(colors)),
+        ("hex_to_rgb bytes", lambda: tc.hex_to_rgb(colors, bytes=True)),
+        ("to_hex loop", lambda: [to_hex(c) for c in rgb]),
+        ("rgb_to_hex", lambda: tc.rgb_to_hex(rgb)),
+    ]:
+        print(f"{name:>18} {timeit(func, repeat=3):>9.1f}")
+
+
+if __name__ == "__main__":
+    main()
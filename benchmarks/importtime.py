@@ -0,0 +1,120 @@
+"""Measure the import time of tol_colors and check it against a budget.
+
+Fresh interpreters import tol_colors with ``-X importtime`` and instrumentation
+enabled. The import time is split between the dependencies imported by tol_colors
+(numpy, matplotlib, ...), its own modules, and the phases of its initialization
+(see tol_colors.instrumentation). Medians over all runs are reported.
+
+Exit with status 1 if the median time spent in tol_colors itself (excluding
+dependencies) exceeds --budget, or if the median total import time exceeds
+--total-budget. Budgets are in milliseconds.
+
+Usage: python benchmarks/importtime.py [--runs 10] [--budget 40]
+    [--total-budget ms] [--python python3]
+"""
+
+import argparse
+import json
+import os
+import re
+import subprocess
+import sys
+from collections import defaultdict
+
+import numpy as np
+
+LINE = re.compile(r"import time:\s+(\d+) \|\s+(\d+) \| ( *)(\S+)")
+CODE = (
+    "import json, tol_colors, tol_colors.instrumentation as i;"
+    "print(json.dumps(i.snapshot()))"
+)
+
+
+def parse(stderr):
+    """Return (self, cumulative, depth, name) for each imported module."""
+    out = []
+    for line in stderr.splitlines():
+        if m := LINE.match(line):
+            us_self, us_cumul, indent, name = m.groups()
+            out.append((int(us_self), int(us_cumul), len(indent) // 2, name))
+    return out
+
+
+def attribute(modules):
+    """Split the import time of tol_colors, in microseconds."""
+    idx = next(i for i, m in enumerate(modules) if m[3] == "tol_colors")
+    _, total, depth, _ = modules[idx]
+    groups = defaultdict(int)
+    # imports triggered by tol_colors are listed just before it, deeper
+    for us_self, us_cumul, d, name in reversed(modules[:idx]):
+        if d <= depth:
+            break
+        if name.startswith("tol_colors"):
+            groups["tol_colors (self)"] += us_self
+        elif d == depth + 1:
+            groups[name.split(".")[0]] += us_cumul
+    groups["tol_colors (self)"] += modules[idx][0]
+    groups["total"] = total
+    return groups
+
+
+def run(python):
+    env = os.environ | {"TOL_COLORS_INSTRUMENT": "1"}
+    proc = subprocess.run(
+        [python, "-X", "importtime", "-c", CODE],
+        env=env,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    groups = attribute(parse(proc.stderr))
+    phases = {
+        name: stat["time"] * 1e6
+        for name, stat in json.loads(proc.stdout).items()
+        if name.startswith("module_init")
+    }
+    return groups, phases
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--runs", type=int, default=10)
+    parser.add_argument("--budget", type=float, default=40.0)
+    parser.add_argument("--total-budget", type=float, default=None)
+    parser.add_argument("--python", default=sys.executable)
+    args = parser.parse_args()
+
+    groups = defaultdict(list)
+    phases = defaultdict(list)
+    for _ in range(args.runs):
+        g, p = run(args.python)
+        for name, us in g.items():
+            groups[name].append(us)
+        for name, us in p.items():
+            phases[name].append(us)
+
+    def median(values):
+        # modules not imported in some runs count as zero
+        return np.median(values + [0] * (args.runs - len(values))) / 1e3
+
+    print(f"Import of tol_colors, median of {args.runs} runs (ms)")
+    for name in sorted(groups, key=lambda n: -median(groups[n])):
+        print(f"{name:>30} {median(groups[name]):>8.2f}")
+    print("Initialization phases (ms)")
+    for name in sorted(phases):
+        print(f"{name:>30} {median(phases[name]):>8.2f}")
+
+    failed = False
+    own = median(groups["tol_colors (self)"])
+    if own > args.budget:
+        print(f"FAIL: tol_colors takes {own:.1f} ms, budget is {args.budget} ms")
+        failed = True
+    total = median(groups["total"])
+    if args.total_budget is not None and total > args.total_budget:
+        print(f"FAIL: import takes {total:.1f} ms, budget is {args.total_budget} ms")
+        failed = True
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,63 @@
+"""Compare indexed and RGBA PNG output, in size and encode time.
+
+Images are a classified land cover raster (14 classes) and a field colorized with
+BuRd_discrete (9 colors), rainbow_discrete(23) and YlOrBr sampled on 253 colors.
+
+Usage: python benchmarks/indexed.py [size]
+"""
+
+import sys
+import time
+
+import numpy as np
+
+import tol_colors as tc
+from tol_colors import indexed, png
+
+
+def make_field(size):
+    rng = np.random.default_rng(0)
+    x = np.linspace(0, 4 * np.pi, size, dtype=np.float32)
+    base = np.sin(x)[:, None] * np.cos(x)[None, :]
+    return base + rng.normal(0, 0.05, (size, size)).astype(np.float32)
+
+
+def timeit(func, repeat=5):
+    best = np.inf
+    for _ in range(repeat):
+        start = time.perf_counter()
+        out = func()
+        best = min(best, time.perf_counter() - start)
+    return best * 1e3, len(out)
+
+
+def main():
+    size = int(sys.argv[1]) if len(sys.argv) > 1 else 1024
+    field = make_field(size)
+    cases = {
+        "land_cover": (
+            np.digitize(field, np.linspace(-1, 1, 13)),
+            indexed.palette("land_cover"),
+        ),
+    }
+    for cmap in ["BuRd_discrete", tc.rainbow_discrete(23), tc.YlOrBr.resampled(253)]:
+        idx, table = indexed.quantize(field, cmap, -1, 1)
+        name = cmap if isinstance(cmap, str) else cmap.name
+        cases[name] = (idx, table)
+
+    print(f"{'image':>18} {'level':>5} {'rgba kB':>8} {'ms':>6} "
+          f"{'idx8 kB':>8} {'ms':>6} {'packed kB':>9} {'ms':>6}")  # fmt: skip
+    for name, (classes, table) in cases.items():
+        idx = classes.astype(np.uint8)
+        rgba = table[idx]
+        for level in [1, 6]:
+            t_rgba, s_rgba = timeit(lambda: png.encode(rgba, level))  # noqa: B023
+            t_8, s_8 = timeit(lambda: png.encode_indexed(idx, table, level, depth=8))  # noqa: B023
+            t_p, s_p = timeit(lambda: png.encode_indexed(idx, table, level))  # noqa: B023
+            print(f"{name:>18} {level:>5} {s_rgba / 1e3:>8.0f} {t_rgba:>6.1f} "
+                  f"{s_8 / 1e3:>8.0f} {t_8:>6.1f} "
+                  f"{s_p / 1e3:>9.0f} {t_p:>6.1f}")  # fmt: skip
+
+
+if __name__ == "__main__":
+    main()
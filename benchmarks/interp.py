@@ -0,0 +1,49 @@
+"""Compare time to build lookup tables with tol_colors.interp and matplotlib.
+
+Usage: python benchmarks/interp.py [N]
+"""
+
+import sys
+import timeit
+
+from matplotlib.colors import LinearSegmentedColormap
+
+from tol_colors import interp
+
+names = [
+    "sunset", "nightfall", "BuRd", "PRGn", "YlOrBr", "WhOrBr", "iridescent",
+    "incandescent", "rainbow_WhBr", "rainbow_WhRd", "rainbow_PuRd", "rainbow_PuBr",
+]  # fmt: skip
+nodes = {name: interp.nodes(name)[0] for name in names}
+
+
+def build_matplotlib(n):
+    """Build the tables with matplotlib."""
+    for name, colors in nodes.items():
+        LinearSegmentedColormap.from_list(name, colors, n)._init()
+
+
+def build_interp(n, space="srgb"):
+    """Build the tables with tol_colors.interp."""
+    for colors in nodes.values():
+        interp.interpolate(colors, n, space)
+
+
+def main():
+    """Run the benchmark."""
+    sizes = [int(sys.argv[1])] if len(sys.argv) > 1 else [256, 4096, 65536]
+    print(f"Building {len(names)} lookup tables, time in ms")
+    spaces = list(interp.SPACES)
+    print(f"{'N':>8} {'from_list':>10} " + " ".join(f"{s:>10}" for s in spaces))
+    for n in sizes:
+        times = []
+        funcs = [lambda n=n: build_matplotlib(n)]
+        funcs += [lambda n=n, space=space: build_interp(n, space) for space in spaces]
+        for func in funcs:
+            number, _ = timeit.Timer(func).autorange()
+            times.append(min(timeit.repeat(func, number=number, repeat=5)) / number)
+        print(f"{n:>8} " + " ".join(f"{t * 1e3:10.3f}" for t in times))
+
+
+if __name__ == "__main__":
+    main()
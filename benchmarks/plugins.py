@@ -0,0 +1,62 @@
+"""Measure loading a palette bundle, compiled or read from the disk cache.
+
+A bundle of random colormaps is written to a temporary directory. It is loaded
+without cache (colors parsed and lookup tables built), then from the cache of
+compiled bundles. Loading includes building the colormaps; timings are the time
+until all colormaps are usable (lookup tables built).
+
+Usage: python benchmarks/plugins.py [n_colormaps]
+"""
+
+import json
+import os
+import sys
+import tempfile
+import time
+
+import numpy as np
+
+from tol_colors import plugins
+
+
+def timeit(func, repeat=5):
+    best = np.inf
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best * 1e3
+
+
+def make_bundle(n):
+    rng = np.random.default_rng(0)
+    colormaps = {}
+    for i in range(n):
+        colors = rng.integers(0, 0xFFFFFF, rng.integers(5, 30))
+        colormaps[f"cmap_{i}"] = dict(
+            colors=[f"#{c:06X}" for c in colors], discrete=bool(i % 2)
+        )
+    return json.dumps(dict(colormaps=colormaps)).encode()
+
+
+def load(content):
+    bundle = plugins.Bundle.from_compiled(plugins._read_compiled(content))
+    for cmap in bundle.colormaps.values():
+        if not cmap._isinit:
+            cmap._init()
+
+
+def main():
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 100
+    content = make_bundle(n)
+    with tempfile.TemporaryDirectory() as tmp:
+        print(f"Bundle of {n} colormaps ({len(content) // 1024} kB), times in ms")
+        os.environ[plugins.CACHE_ENV_VAR] = "0"
+        print(f"{'no cache':>10} {timeit(lambda: load(content)):>9.1f}")
+        os.environ[plugins.CACHE_ENV_VAR] = tmp
+        load(content)
+        print(f"{'cached':>10} {timeit(lambda: load(content)):>9.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,59 @@
+"""Measure recoloring an image from viridis to tol.iridescent.
+
+The recolor table is compared with a direct search of the nearest colormap color
+for each pixel (done by chunks), which is what the table replaces.
+
+Usage: python benchmarks/recolor.py [size_of_image]
+"""
+
+import sys
+import time
+
+import matplotlib
+import numpy as np
+
+from tol_colors.recolor import _cached_table, recolor
+
+
+def timeit(func, repeat=3):
+    best = np.inf
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best * 1e3
+
+
+def nearest_search(image, chunk=1 << 16):
+    colors = matplotlib.colormaps["viridis"](np.arange(256), bytes=True)[:, :3]
+    target = matplotlib.colormaps["tol.iridescent"](np.arange(256), bytes=True)
+    pixels = image.reshape(-1, 4)[:, :3].astype(np.int32)
+    out = np.empty((len(pixels), 4), dtype=np.uint8)
+    for start in range(0, len(pixels), chunk):
+        p = pixels[start : start + chunk]
+        dist = ((p[:, None, :] - colors[None]) ** 2).sum(axis=-1)
+        out[start : start + chunk] = target.take(dist.argmin(axis=1), axis=0)
+    return out.reshape(image.shape)
+
+
+def main():
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 2048
+    x = np.random.default_rng(0).random((n, n))
+    image = matplotlib.colormaps["viridis"](x, bytes=True)
+    print(f"Image of {n}x{n}, times in ms")
+    print(f"{'nearest search':>22} {timeit(lambda: nearest_search(image), 1):>9.1f}")
+    for size in [32, 64, 256]:
+
+        def build(size=size):
+            _cached_table.cache_clear()
+            recolor(image[:1, :1], "viridis", "iridescent", size=size)
+
+        def apply(size=size):
+            recolor(image, "viridis", "iridescent", size=size)
+
+        print(f"{f'table {size}^3, build':>22} {timeit(build):>9.1f}")
+        print(f"{f'table {size}^3, apply':>22} {timeit(apply):>9.1f}")
+
+
+if __name__ == "__main__":
+    main()
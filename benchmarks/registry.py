@@ -0,0 +1,77 @@
+"""Measure loading many colorsets from a JSON file.
+
+A file of random palettes is written to a temporary directory, then loaded in a
+registry (types created on first access), and eagerly (all types and instances
+created). Creating named tuple types dominates the eager cost.
+
+Usage: python benchmarks/registry.py [n_palettes]
+"""
+
+import json
+import sys
+import tempfile
+import time
+from collections import namedtuple
+from pathlib import Path
+
+import numpy as np
+
+from tol_colors.registry import ColorsetRegistry, _read, read_json, type_name
+
+
+def timeit(func, repeat=5):
+    best = np.inf
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best * 1e3
+
+
+def palettes(n):
+    rng = np.random.default_rng(0)
+    return {
+        f"palette_{i}": {
+            f"color_{j}": f"#{rng.integers(0, 0xFFFFFF):06X}"
+            for j in range(rng.integers(4, 24))
+        }
+        for i in range(n)
+    }
+
+
+def eager(fname):
+    with open(fname) as fp:
+        data = json.load(fp)
+    return {
+        name: namedtuple(type_name(name), colors)(**colors)
+        for name, colors in data.items()
+    }
+
+
+def lazy(fname):
+    registry = ColorsetRegistry.from_json(fname)
+    return registry[next(iter(registry))]
+
+
+def main():
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 200
+    with tempfile.TemporaryDirectory() as tmp:
+        fname = Path(tmp) / "palettes.json"
+        fname.write_text(json.dumps(palettes(n)))
+
+        def cold():
+            _read.cache_clear()
+            lazy(fname)
+
+        read_json(fname)
+        print(f"{n} palettes, times in ms")
+        for name, func in [
+            ("eager namedtuples", lambda: eager(fname)),
+            ("registry, cold", cold),
+            ("registry, cached", lambda: lazy(fname)),
+        ]:
+            print(f"{name:>18} {timeit(func):>9.2f}")
+
+
+if __name__ == "__main__":
+    main()
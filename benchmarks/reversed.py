@@ -0,0 +1,57 @@
+"""Compare reversed colormaps built by matplotlib and sharing their lookup table.
+
+For all colormaps of tol_colors, measure the time to create the reversed
+colormaps, to build the lookup tables of both, and the memory they use.
+
+Usage: python benchmarks/reversed.py [N]
+"""
+
+import copy
+import sys
+import time
+
+import tol_colors as tc
+from tol_colors.compact import memory_footprint
+from tol_colors.reverse import reversed_pair
+
+
+def forwards(n):
+    cmaps = {
+        name: copy.copy(cmap)
+        for name, cmap in dict.items(tc.colormaps)
+        if not name.endswith("_r")
+    }
+    return {
+        name: cmap.resampled(n) if n and not name.endswith("discrete") else cmap
+        for name, cmap in cmaps.items()
+    }
+
+
+def build(func, n):
+    cmaps = forwards(n)
+    start = time.perf_counter()
+    out = {}
+    for name, cmap in cmaps.items():
+        out[name], out[f"{name}_r"] = func(cmap)
+    created = time.perf_counter() - start
+    start = time.perf_counter()
+    for cmap in out.values():
+        cmap(0.5)
+    inited = time.perf_counter() - start
+    return created * 1e3, inited * 1e3, sum(memory_footprint(out).values()) / 1024
+
+
+def main():
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 256
+    print(f"{len(forwards(n))} colormaps and their reverse, N={n}")
+    print(f"{'':>10} {'create ms':>10} {'init ms':>8} {'memory kiB':>11}")
+    for name, func in [
+        ("reversed", lambda c: (c, c.reversed())),
+        ("shared", reversed_pair),
+    ]:
+        created, inited, memory = min(build(func, n) for _ in range(5))
+        print(f"{name:>10} {created:>10.2f} {inited:>8.2f} {memory:>11.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,59 @@
+"""Measure choosing colorsets for many charts.
+
+Charts have between 1 and 10 series, and one of a few backgrounds. Colorsets are
+chosen by recomputing all distances for each chart, with the table of distances
+between colors cached, and with rankings cached.
+
+Usage: python benchmarks/selection.py [n_charts]
+"""
+
+import sys
+import time
+
+import numpy as np
+
+from tol_colors import selection
+
+
+def timeit(func, repeat=5):
+    best = np.inf
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best * 1e3
+
+
+def main():
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 10_000
+    rng = np.random.default_rng(0)
+    backgrounds = ["white", "black", "#FFFFF0", "#222222", "#EEEEEE"]
+    charts = [
+        (int(rng.integers(1, 11)), backgrounds[rng.integers(len(backgrounds))])
+        for _ in range(n)
+    ]
+
+    def recompute():
+        for n_series, bg in charts[: n // 100]:
+            selection.clear_cache()
+            selection.select(n_series, bg)
+
+    def table_only():
+        selection.clear_cache()
+        selection.select(1)
+        for n_series, bg in charts[: n // 10]:
+            selection._rank.cache_clear()
+            selection.select(n_series, bg)
+
+    def cached():
+        for n_series, bg in charts:
+            selection.select(n_series, bg)
+
+    print(f"{n} charts, time per chart in us")
+    print(f"{'recompute':>12} {timeit(recompute) / (n // 100) * 1e3:>9.1f}")
+    print(f"{'table':>12} {timeit(table_only) / (n // 10) * 1e3:>9.1f}")
+    print(f"{'cached':>12} {timeit(cached) / n * 1e3:>9.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,87 @@
+"""Load test of the colorization server, in requests per second.
+
+Clients send tiles to ``/colorize`` over keep-alive connections. Without --url, a
+server is started in this process for each batch delay in turn, so that batching
+can be compared.
+
+Usage: python benchmarks/server_load.py [--url http://host:port] [--clients 32]
+    [--requests 2000] [--size 64]
+"""
+
+import argparse
+import asyncio
+import time
+from urllib.parse import urlsplit
+
+import numpy as np
+
+from tol_colors.server import Server
+
+
+async def client(host, port, request, n, latencies):
+    reader, writer = await asyncio.open_connection(host, port)
+    for _ in range(n):
+        start = time.perf_counter()
+        writer.write(request)
+        await writer.drain()
+        status = int((await reader.readline()).split()[1])
+        length = 0
+        while (line := await reader.readline()) != b"\r\n":
+            if line.lower().startswith(b"content-length"):
+                length = int(line.split(b":")[1])
+        await reader.readexactly(length)
+        assert status == 200, status  # noqa: PLR2004
+        latencies.append(time.perf_counter() - start)
+    writer.close()
+
+
+async def load(host, port, args):
+    rng = np.random.default_rng(0)
+    body = rng.normal(0, 1, (args.size, args.size)).astype(np.float32).tobytes()
+    target = f"/colorize/{args.cmap}?shape={args.size},{args.size}&vmin=-2&vmax=2"
+    request = (
+        f"POST {target} HTTP/1.1\r\nHost: {host}\r\n"
+        f"Content-Length: {len(body)}\r\n\r\n".encode()
+        + body
+    )
+    latencies = []
+    per_client = args.requests // args.clients
+    start = time.perf_counter()
+    await asyncio.gather(
+        *(
+            client(host, port, request, per_client, latencies)
+            for _ in range(args.clients)
+        )
+    )
+    elapsed = time.perf_counter() - start
+    p50, p99 = np.percentile(latencies, [50, 99]) * 1e3
+    return len(latencies) / elapsed, p50, p99
+
+
+async def local(args, batch_delay):
+    async with Server(port=0, batch_delay=batch_delay) as server:
+        return await load("127.0.0.1", server.port, args)
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--url", default=None)
+    parser.add_argument("--clients", type=int, default=32)
+    parser.add_argument("--requests", type=int, default=2000)
+    parser.add_argument("--size", type=int, default=64)
+    parser.add_argument("--cmap", default="YlOrBr")
+    args = parser.parse_args()
+
+    print(f"{'batch delay':>12} {'req/s':>8} {'p50 ms':>7} {'p99 ms':>7}")
+    if args.url:
+        url = urlsplit(args.url)
+        rate, p50, p99 = asyncio.run(load(url.hostname, url.port, args))
+        print(f"{'remote':>12} {rate:>8.0f} {p50:>7.1f} {p99:>7.1f}")
+        return
+    for delay in [0.0, 0.001, 0.005]:
+        rate, p50, p99 = asyncio.run(local(args, delay))
+        print(f"{delay * 1e3:>10.0f}ms {rate:>8.0f} {p50:>7.1f} {p99:>7.1f}")
+
+
+if __name__ == "__main__":
+    main()
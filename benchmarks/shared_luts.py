@@ -0,0 +1,90 @@
+"""Measure memory used by worker processes with and without shared lookup tables.
+
+Each worker either builds the lookup tables of all colormaps itself, or attaches to
+a single shared block. Memory is reported as RSS and PSS (proportional set size,
+where shared pages are divided between the processes using them; Linux only).
+
+Usage: python benchmarks/shared_luts.py [N] [n_workers]
+"""
+
+import multiprocessing as mp
+import sys
+
+import numpy as np
+
+import tol_colors as tc
+from tol_colors.shared import SharedLUTs
+
+
+def memory() -> dict[str, int]:
+    """Return RSS and PSS of the current process in kiB."""
+    out = {}
+    with open("/proc/self/smaps_rollup") as fp:
+        for line in fp:
+            key, _, value = line.partition(":")
+            if key in ("Rss", "Pss"):
+                out[key] = int(value.split()[0])
+    return out
+
+
+def worker(n, shared_name, barrier, queue):
+    """Build or attach to the lookup tables, and report the memory used."""
+    before = memory()
+    if shared_name is None:
+        cmaps = {}
+        for name, cmap in tc.colormaps.items():
+            discrete = name.endswith(("discrete", "discrete_r"))
+            cmaps[name] = cmap if cmap.N == n or discrete else cmap.resampled(n)
+            cmaps[name](np.zeros(1))  # build the table
+    else:
+        luts = SharedLUTs.attach(shared_name)
+        cmaps = {name: luts.colormap(name) for name in luts.index}
+        for cmap in cmaps.values():
+            cmap(np.zeros(1))
+    # wait for every worker to be ready so that PSS accounts for all of them
+    barrier.wait()
+    after = memory()
+    barrier.wait()
+    queue.put({k: after[k] - before[k] for k in after})
+
+
+def run(n, n_workers, shared_name):
+    """Return the mean memory used by the workers."""
+    ctx = mp.get_context("spawn")
+    barrier = ctx.Barrier(n_workers)
+    queue = ctx.Queue()
+    procs = [
+        ctx.Process(target=worker, args=(n, shared_name, barrier, queue))
+        for _ in range(n_workers)
+    ]
+    for p in procs:
+        p.start()
+    results = [queue.get() for _ in procs]
+    for p in procs:
+        p.join()
+    return {k: sum(r[k] for r in results) / n_workers for k in results[0]}
+
+
+def main():
+    """Run the benchmark."""
+    args = sys.argv[1:]
+    n = int(args[0]) if args else 4096
+    n_workers = int(args[1]) if len(args) > 1 else 8
+
+    print(f"{n_workers} workers, N={n}")
+    own = run(n, n_workers, None)
+    print(f"own tables:    RSS {own['Rss']:8.0f} kiB  PSS {own['Pss']:8.0f} kiB")
+
+    luts = SharedLUTs.create(N=n)
+    print(f"shared block: {luts.shm.size / 1024:.0f} kiB")
+    try:
+        shared = run(n, n_workers, luts.name)
+    finally:
+        luts.close()
+        luts.unlink()
+    print(f"shared tables: RSS {shared['Rss']:8.0f} kiB  PSS {shared['Pss']:8.0f} kiB")
+    print(f"PSS saved per worker: {own['Pss'] - shared['Pss']:.0f} kiB")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,55 @@
+"""Compare drawing colormap strips with one axes per colormap and in one image.
+
+The first approach is the one previously used by ``python -m tol_colors``: one
+axes and one ``imshow`` of a gradient for each colormap. Times include drawing the
+figure.
+
+Usage: python benchmarks/strips.py
+"""
+
+import time
+
+import matplotlib.pyplot as plt
+import numpy as np
+
+from tol_colors import strips
+
+
+def timeit(func, repeat=5):
+    best = np.inf
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best * 1e3
+
+
+def main():
+    cmaps = strips.catalogue()
+
+    def per_axes():
+        gradient = np.linspace(0, 1, 256)
+        gradient = np.vstack((gradient, gradient))
+        fig, axes = plt.subplots(nrows=len(cmaps))
+        for ax, (name, cmap) in zip(axes, cmaps.items(), strict=True):
+            pos = list(ax.get_position().bounds)
+            ax.set_axis_off()
+            ax.imshow(gradient, aspect=4, cmap=cmap)
+            fig.text(pos[0] - 0.01, pos[1] + pos[3] / 2.0, name, ha="right")
+        fig.canvas.draw()
+        plt.close(fig)
+
+    def single_image():
+        fig, ax = plt.subplots()
+        strips.draw(ax, cmaps)
+        fig.canvas.draw()
+        plt.close(fig)
+
+    print(f"{len(cmaps)} colormaps, times in ms")
+    print(f"{'one axes per colormap':>22} {timeit(per_axes):>9.1f}")
+    print(f"{'single image':>22} {timeit(single_image):>9.1f}")
+    print(f"{'render image only':>22} {timeit(lambda: strips.render(cmaps)):>9.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,71 @@
+"""Measure tile rendering throughput, in tiles per second.
+
+Compare the matplotlib path (normalize, colormap, encode with Pillow) to
+tol_colors.tiles.TileRenderer, sequentially and in a thread pool.
+
+Usage: python benchmarks/tiles.py [n_tiles]
+"""
+
+import asyncio
+import io
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+from matplotlib.colors import Normalize
+from PIL import Image
+
+import tol_colors as tc
+from tol_colors.tiles import TileRenderer
+
+
+def make_tiles(n, size):
+    rng = np.random.default_rng(0)
+    # smooth fields compress like real rasters, unlike white noise
+    x = np.linspace(0, 4 * np.pi, size, dtype=np.float32)
+    base = np.sin(x)[:, None] * np.cos(x)[None, :]
+    return [base * 50 + 50 + rng.normal(0, 2, (size, size)).astype(np.float32)
+            for _ in range(n)]  # fmt: skip
+
+
+def matplotlib_render(tile, cmap, norm, compress_level):
+    rgba = cmap(norm(tile), bytes=True)
+    out = io.BytesIO()
+    Image.fromarray(rgba).save(out, format="png", compress_level=compress_level)
+    return out.getvalue()
+
+
+def rate(func, tiles):
+    start = time.perf_counter()
+    func(tiles)
+    return len(tiles) / (time.perf_counter() - start)
+
+
+def main():
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 200
+    executor = ThreadPoolExecutor()
+    print(f"{'cmap':>14} {'size':>5} {'level':>5} {'matplotlib':>11} "
+          f"{'renderer':>9} {'threads':>9}  (tiles/s)")  # fmt: skip
+    for name in ["YlOrBr", "BuRd_discrete"]:
+        cmap = tc.colormaps[name]
+        norm = Normalize(0, 100)
+        for size in [256, 512]:
+            tiles = make_tiles(n, size)
+            for level in [1, 6]:
+                renderer = TileRenderer(name, 0, 100, compress_level=level)
+                mpl = rate(
+                    lambda ts: [matplotlib_render(t, cmap, norm, level) for t in ts],  # noqa: B023
+                    tiles,
+                )
+                seq = rate(lambda ts: [renderer.render(t) for t in ts], tiles)  # noqa: B023
+                par = rate(
+                    lambda ts: asyncio.run(renderer.render_many(ts, executor)),  # noqa: B023
+                    tiles,
+                )
+                print(f"{name:>14} {size:>5} {level:>5} {mpl:>11.0f} "
+                      f"{seq:>9.0f} {par:>9.0f}")  # fmt: skip
+
+
+if __name__ == "__main__":
+    main()
@@ -7,6 +7,7 @@ from matplotlib.colors import to_rgb
 from matplotlib.patches import ConnectionPatch, RegularPolygon
 
 import tol_colors as tc
+from tol_colors import strips
 
 plt.matplotlib.rcdefaults()
 plt.rcParams["font.sans-serif"] = ["Noto Sans"]
@@ -490,57 +491,29 @@ def rainbow_discrete():
 
 
 def cmaps_condensed():
-    cmaps_names = [
-        ("sunset",),
-        ("nightfall",),
-        ("BuRd",),
-        ("PRGn",),
-        ("YlOrBr",),
-        ("iridescent",),
-        ("incandescent",),
-        ("rainbow_WhBr", "rainbow_WhRd", "rainbow_PuRd", "rainbow_PuBr"),
-        ("rainbow_discrete",),
-    ]
-    fig = plt.figure(figsize=(10, 11), dpi=100)
-    fig.subplots_adjust(left=0.20, bottom=0.01, top=0.99, right=0.99)
-    gs = plt.GridSpec(
-        len(cmaps_names), 1, figure=fig, height_ratios=[2, 2, 2, 2, 2, 1, 1, 4, 1]
-    )
-
-    ann_kw = dict(
-        xycoords="axes fraction",
-        xytext=(-3, 0),
-        textcoords="offset points",
-        ha="right",
-        va="center",
-        family="monospace",
-        size=12,
-    )
+    cmaps = {}
+    for name in [
+        "sunset",
+        "nightfall",
+        "BuRd",
+        "PRGn",
+        "YlOrBr",
+        "iridescent",
+        "incandescent",
+        "rainbow_WhBr",
+        "rainbow_WhRd",
+        "rainbow_PuRd",
+        "rainbow_PuBr",
+    ]:
+        cmaps[name] = name
+        if f"{name}_discrete" in tc.colormaps:
+            cmaps[f"{name}_discrete"] = f"{name}_discrete"
+    cmaps["rainbow_discrete"] = tc.rainbow_discrete(22)
 
-    for i, cmap_names_gs in enumerate(cmaps_names):
-        if len(cmap_names_gs) > 1:
-            axes = gs[i].subgridspec(len(cmap_names_gs), 1, hspace=0.08).subplots()
-        else:
-            axes = [fig.add_subplot(gs[i])]
-
-        for cmap_name, ax in zip(cmap_names_gs, axes, strict=False):
-            ax.set_axis_off()
-
-            if cmap_name == "rainbow_discrete":
-                plot_discrete(ax, tc.rainbow_discrete(22), (0, 1))
-                ax.annotate(cmap_name, (0, 0.5), **ann_kw)
-                continue
-
-            cmap = tc.colormaps[cmap_name]
-            if (cmap_d_name := f"{cmap_name}_discrete") in tc.colormaps:
-                cmap_d = tc.colormaps[cmap_d_name]
-                plot_linear(ax, cmap, (0.5, 1))
-                plot_discrete(ax, cmap_d, (0, 0.505))
-                ax.annotate(cmap_name, (0, 0.75), **ann_kw)
-                ax.annotate(cmap_d_name, (0, 0.25), **ann_kw)
-            else:
-                plot_linear(ax, cmap, (0, 1))
-                ax.annotate(cmap_name, (0, 0.5), **ann_kw)
+    fig = plt.figure(figsize=(10, 11), dpi=100)
+    ax = fig.add_axes((0.20, 0.01, 0.79, 0.98))
+    # all strips in a single image
+    strips.draw(ax, cmaps, width=1024, family="monospace", size=12)
 
     fig.savefig(savedir + "cmaps_condensed.svg")
     plt.close(fig)
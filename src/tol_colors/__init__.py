@@ -13,17 +13,45 @@ import functools
 import importlib.metadata
 import json
 import logging
+import math
+import operator
 import os
+import re
+import shutil
+import sys
+import tempfile
+import threading
+import time
 import warnings
 from collections import namedtuple
-from collections.abc import Sequence
+from collections.abc import Iterable, Iterator, Mapping, Sequence
+from concurrent.futures import ThreadPoolExecutor
 from importlib import resources
-from typing import Literal, NamedTuple, cast, overload
+from typing import Any, Literal, NamedTuple, cast, overload
 
 import matplotlib
-from matplotlib.colors import LinearSegmentedColormap, ListedColormap
+import numpy as np
+from cycler import Cycler
+from cycler import cycler as _cycler
+from matplotlib.colors import LinearSegmentedColormap, ListedColormap, to_rgba_array
+
+from tol_colors import instrumentation
+from tol_colors.hexcolors import hex_to_rgb, rgb_to_hex  # noqa: F401
+from tol_colors.reverse import reversed_pair
+
+_init_start = _phase_start = time.perf_counter()
+
+
+def _phase(name: str):
+    """Record the time spent in a phase of the module initialization."""
+    global _phase_start  # noqa: PLW0603
+    now = time.perf_counter()
+    instrumentation.record(f"module_init.{name}", now - _phase_start)
+    _phase_start = now
+
 
 __version__ = importlib.metadata.version("tol_colors")
+_phase("version")
 
 log = logging.getLogger(__name__)
 
@@ -31,75 +59,185 @@ log = logging.getLogger(__name__)
 
 with resources.files("tol_colors").joinpath("colors.json").open("r") as fp:
     _colors = json.load(fp)
+_phase("data")
 
 
 ## Colorsets
+
+
+@functools.cache
+def _colorset_arrays(colors: tuple[str, ...]) -> tuple[np.ndarray, ...]:
+    try:
+        rgba8 = hex_to_rgb(colors, alpha=True, bytes=True)
+    except ValueError:  # named colors
+        rgba8 = np.round(to_rgba_array(colors) * 255).astype(np.uint8)
+    rgb = rgba8[:, :3] / 255
+    packed = rgba8.view(">u4").ravel().astype(np.uint32)
+    arrays = (rgb, rgba8, packed)
+    for a in arrays:
+        a.flags.writeable = False
+    return arrays
+
+
+class _Colorset:
+    """Array representations of a colorset, built on first access and cached.
+
+    Arrays are read-only, and indexed like the colorset.
+    """
+
+    __slots__ = ()
+
+    def _arrays(self) -> tuple[np.ndarray, ...]:
+        return _colorset_arrays(tuple(cast(Sequence[str], self)))
+
+    @property
+    def rgb(self) -> np.ndarray:
+        """Colors as floats in [0, 1], array of shape ``(n, 3)``."""
+        return self._arrays()[0]
+
+    @property
+    def rgba8(self) -> np.ndarray:
+        """Colors as bytes, array of uint8 of shape ``(n, 4)``."""
+        return self._arrays()[1]
+
+    @property
+    def packed(self) -> np.ndarray:
+        """Colors packed as ``0xRRGGBBAA``, array of uint32 of shape ``(n,)``."""
+        return self._arrays()[2]
+
+
 # Colorsets are defined statically to provide robust type-checking and auto-completion
 
-Bright = namedtuple("Bright", "blue, red, green, yellow, cyan, purple, grey")
-Vibrant = namedtuple("Vibrant", "orange, blue, cyan, magenta, red, teal, grey")
-Muted = namedtuple(
-    "Muted",
-    "rose, indigo, sand, green, cyan, wine, teal, olive, purple, pale_grey",
-)
 
-HighContrast = namedtuple("HighContrast", "black, blue, red, yellow, white")
-MediumContrast = namedtuple(
-    "MediumContrast",
-    [
-        "white",
-        "light_blue",
-        "dark_blue",
-        "light_yellow",
-        "dark_yellow",
-        "light_red",
-        "dark_red",
-        "black",
-    ],
-)
+class Bright(
+    _Colorset, namedtuple("Bright", "blue, red, green, yellow, cyan, purple, grey")
+):
+    """Colors of the bright colorset."""
 
-Pale = namedtuple(
-    "Pale",
-    "pale_blue, pale_red, pale_green, pale_yellow, pale_cyan, pale_grey",
-)
-Dark = namedtuple(
-    "Dark",
-    "dark_blue, dark_red, dark_green, dark_yellow, dark_cyan, dark_grey",
-)
-Light = namedtuple(
-    "Light",
-    [
-        "light_blue",
-        "orange",
-        "light_yellow",
-        "pink",
-        "light_cyan",
-        "mint",
-        "pear",
-        "olive",
-        "pale_grey",
-    ],
-)
+    __slots__ = ()
+
+
+class Vibrant(
+    _Colorset, namedtuple("Vibrant", "orange, blue, cyan, magenta, red, teal, grey")
+):
+    """Colors of the vibrant colorset."""
+
+    __slots__ = ()
+
+
+class Muted(
+    _Colorset,
+    namedtuple(
+        "Muted",
+        "rose, indigo, sand, green, cyan, wine, teal, olive, purple, pale_grey",
+    ),
+):
+    """Colors of the muted colorset."""
+
+    __slots__ = ()
+
+
+class HighContrast(
+    _Colorset, namedtuple("HighContrast", "black, blue, red, yellow, white")
+):
+    """Colors of the high-contrast colorset."""
+
+    __slots__ = ()
+
+
+class MediumContrast(
+    _Colorset,
+    namedtuple(
+        "MediumContrast",
+        [
+            "white",
+            "light_blue",
+            "dark_blue",
+            "light_yellow",
+            "dark_yellow",
+            "light_red",
+            "dark_red",
+            "black",
+        ],
+    ),
+):
+    """Colors of the medium-contrast colorset."""
+
+    __slots__ = ()
+
+
+class Pale(
+    _Colorset,
+    namedtuple(
+        "Pale",
+        "pale_blue, pale_red, pale_green, pale_yellow, pale_cyan, pale_grey",
+    ),
+):
+    """Colors of the pale colorset."""
+
+    __slots__ = ()
+
+
+class Dark(
+    _Colorset,
+    namedtuple(
+        "Dark",
+        "dark_blue, dark_red, dark_green, dark_yellow, dark_cyan, dark_grey",
+    ),
+):
+    """Colors of the dark colorset."""
+
+    __slots__ = ()
+
+
+class Light(
+    _Colorset,
+    namedtuple(
+        "Light",
+        [
+            "light_blue",
+            "orange",
+            "light_yellow",
+            "pink",
+            "light_cyan",
+            "mint",
+            "pear",
+            "olive",
+            "pale_grey",
+        ],
+    ),
+):
+    """Colors of the light colorset."""
+
+    __slots__ = ()
+
+
+class LandCover(
+    _Colorset,
+    namedtuple(
+        "LandCover",
+        [
+            "water",  # 0
+            "evergreen_needleleaf_forest",  # 1
+            "evergreen_broadleaf_forest",  # 2
+            "deciduous_needleleaf_forest",  # 3
+            "deciduous_broadleaf_forest",  # 4
+            "mixed_forest",  # 5
+            "woodland",  # 6
+            "wooded_grassland",  # 7
+            "closed_shrubland",  # 8
+            "open_shrubland",  # 9
+            "grassland",  # 10
+            "cropland",  # 11
+            "bare_ground",  # 12
+            "urban_and_built_up",  # 13
+        ],
+    ),
+):
+    """Colors of the land-cover colorset."""
+
+    __slots__ = ()
 
-LandCover = namedtuple(
-    "LandCover",
-    [
-        "water",  # 0
-        "evergreen_needleleaf_forest",  # 1
-        "evergreen_broadleaf_forest",  # 2
-        "deciduous_needleleaf_forest",  # 3
-        "deciduous_broadleaf_forest",  # 4
-        "mixed_forest",  # 5
-        "woodland",  # 6
-        "wooded_grassland",  # 7
-        "closed_shrubland",  # 8
-        "open_shrubland",  # 9
-        "grassland",  # 10
-        "cropland",  # 11
-        "bare_ground",  # 12
-        "urban_and_built_up",  # 13
-    ],
-)
 
 bright = Bright(**_colors["colorsets"]["bright"])
 vibrant = Vibrant(**_colors["colorsets"]["vibrant"])
@@ -154,6 +292,12 @@ class ColorsetMapping(dict[str, NamedTuple]):
     def __getitem__(self, key: str) -> NamedTuple:
         return super().__getitem__(key.replace("-", "_"))
 
+    def __missing__(self, key: str) -> NamedTuple:
+        # look for the colorset in the palette bundles of other packages
+        from tol_colors import plugins  # noqa: PLC0415
+
+        return plugins.find(self, key)
+
 
 colorsets = ColorsetMapping(
     bright=bright,
@@ -167,6 +311,70 @@ colorsets = ColorsetMapping(
     land_cover=land_cover,
 )
 """Mapping of colorsets."""
+_phase("colorsets")
+
+
+def _prop_cycle_line(cset: str) -> str:
+    """Return the matplotlibrc line setting the color cycle to a colorset."""
+    colors = [f"'{c[1:]}'" for c in colorsets[cset]]
+    return f"axes.prop_cycle : cycler('color', [{', '.join(colors)}])\n"
+
+
+_PROP_CYCLE_KEY = re.compile(r"^\s*axes\.prop_cycle\s*:")
+_COLOR_CYCLER = re.compile(r"""cycler\(\s*(?:(['"])color\1|color\s*=)""")
+
+
+def _is_color_cycler(line: str) -> bool:
+    """Return True if a config line sets a color cycler (commented lines are not)."""
+    return bool(_PROP_CYCLE_KEY.match(line) and _COLOR_CYCLER.search(line))
+
+
+def _inject_line(fname: str | os.PathLike, newline: str) -> bool:
+    """Put a prop_cycle line in a config file.
+
+    An existing color cycler line is replaced, otherwise the line is appended. The
+    file is written atomically (to a temporary file then renamed), and only if its
+    content changes.
+
+    Returns
+    -------
+    True if the file was written, False if it was already up to date.
+    """
+    fname = os.fspath(fname)
+    base_dir = os.path.dirname(fname)
+    if base_dir:
+        os.makedirs(base_dir, exist_ok=True)
+
+    try:
+        with open(fname) as fp:
+            lines = fp.readlines()
+    except FileNotFoundError:
+        lines = []
+
+    for i, line in enumerate(lines):
+        if _is_color_cycler(line):
+            if line == newline:
+                return False
+            lines[i] = newline
+            break
+    else:
+        if lines and not lines[-1].endswith("\n"):
+            lines[-1] += "\n"
+        lines.append(newline)
+
+    fd, tmp = tempfile.mkstemp(dir=base_dir or None, prefix=".matplotlibrc.")
+    try:
+        with os.fdopen(fd, "w") as fp:
+            fp.writelines(lines)
+        if os.path.exists(fname):
+            shutil.copymode(fname, tmp)
+        else:
+            os.chmod(tmp, 0o644)
+        os.replace(tmp, fname)
+    except BaseException:
+        os.unlink(tmp)
+        raise
+    return True
 
 
 def set_default_colors(
@@ -177,7 +385,8 @@ def set_default_colors(
     This will modify the colors used automatically by matplotlib.
     This function will add a new line in a matplotlibrc file or stylesheet for the
     property "axes.prop_cycle". If a line setting a color cycler already exist in the
-    file, it will be overwritten.
+    file, it will be overwritten. The file is replaced atomically, and left untouched
+    if it already uses the colorset.
 
     This function can run without modifying the file and simply show the line to add
     by setting the *dry* parameter to True.
@@ -202,8 +411,7 @@ def set_default_colors(
         If set to True, the function will only print the new configuration line to
         stdout and will not modify any file. You can then copy-paste the line manually.
     """
-    colors = [f"'{c[1:]}'" for c in colorsets[cset]]
-    newline = f"axes.prop_cycle : cycler('color', [{', '.join(colors)}])\n"
+    newline = _prop_cycle_line(cset)
     print(f"New config line: {newline}", end="")
 
     if dry:
@@ -212,35 +420,178 @@ def set_default_colors(
     if fname is None:
         fname = os.path.join(matplotlib.get_configdir(), "matplotlibrc")
     print(f"Injecting line in file '{fname}'")
+    _inject_line(fname, newline)
 
-    base_dir = os.path.dirname(fname)
-    if not os.path.exists(base_dir):
-        os.makedirs(base_dir, exist_ok=True)
 
-    if os.path.exists(fname):
-        # check if cycler for color already exists in file
-        with open(fname) as fp:
-            lines = fp.readlines()
+def set_default_colors_many(
+    fnames: Iterable[str | os.PathLike],
+    cset: str = "bright",
+    max_workers: int | None = None,
+) -> dict[str, bool]:
+    """Set default colors in many matplotlibrc or stylesheet files at once.
+
+    Files are processed concurrently by a pool of threads. Each file is modified as
+    with :func:`set_default_colors`: atomically, and only if its content changes.
+
+    Parameters
+    ----------
+    fnames
+        Files to modify. They will be created, along with leading directories, if
+        necessary.
+    cset
+        Name of the colorset to set as new default. Default is "bright".
+    max_workers
+        Maximum number of threads. If None, use the default of
+        :class:`concurrent.futures.ThreadPoolExecutor`.
+
+    Returns
+    -------
+    Mapping of each file to True if it was written, False if it was already up to
+    date.
+    """
+    newline = _prop_cycle_line(cset)
+    paths = [os.fspath(f) for f in fnames]
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        written = executor.map(lambda f: _inject_line(f, newline), paths)
+        result = dict(zip(paths, written, strict=True))
+    log.info("Updated %d out of %d files.", sum(result.values()), len(result))
+    return result
+
+
+## Styles
+
+_LINESTYLES = ["-", "--", ":", "-."]
+_MARKERS = ["o", "s", "^", "D", "v", "P", "X"]
+
+
+@functools.cache
+def _make_cycler(
+    cset: str, n: int | None, with_linestyles: bool, with_markers: bool
+) -> Cycler:
+    props = {"color": list(colorsets[cset])}
+    if with_linestyles:
+        props["linestyle"] = _LINESTYLES
+    if with_markers:
+        props["marker"] = _MARKERS
+    if n is None:
+        n = math.prod(len(values) for values in props.values())
+    # colors change first, then line styles, then markers: the product of all
+    # properties is cycled, so every combination appears
+    columns = {}
+    stride = 1
+    for key, values in props.items():
+        columns[key] = [values[(i // stride) % len(values)] for i in range(n)]
+        stride *= len(values)
+    return functools.reduce(
+        operator.add, (_cycler(key, values) for key, values in columns.items())
+    )
+
+
+def cycler(
+    cset: str = "bright",
+    n: int | None = None,
+    with_linestyles: bool = False,
+    with_markers: bool = False,
+) -> Cycler:
+    """Return a property cycler using one of the colorsets.
+
+    Cyclers are built once for each combination of arguments and cached: they are
+    shared and must not be modified in place.
+
+    Parameters
+    ----------
+    cset
+        Name of the colorset. Hyphens are automatically replaced.
+    n
+        Number of entries. Entries are repeated if needed. If None, the cycler
+        holds all the colors once, or all the combinations of colors, line styles
+        and markers.
+    with_linestyles
+        If True, also cycle through line styles. All colors are used with the
+        first line style, then with the second, and so on: series are distinct
+        for the number of colors times the number of line styles (28 series for
+        the 7 colors of "bright").
+    with_markers
+        If True, also cycle through markers, in the same way. Markers change
+        after all the combinations of colors and line styles.
+
+    Examples
+    --------
+    >>> ax.set_prop_cycle(tol_colors.cycler("vibrant", with_linestyles=True))
+    """
+    if n is not None and n < 1:
+        raise ValueError("Number of entries must be at least 1.")
+    return _make_cycler(cset.replace("-", "_"), n, with_linestyles, with_markers)
+
+
+@functools.cache
+def _style(cset: str) -> dict[str, Any]:
+    return {"axes.prop_cycle": cycler(cset)}
+
+
+def style(cset: str = "bright") -> dict[str, Any]:
+    """Return a matplotlib style dictionary using one of the colorsets.
+
+    The dictionary sets the property "axes.prop_cycle" and can be passed to
+    :func:`matplotlib.style.use` or :func:`matplotlib.style.context`. It is built
+    once per colorset and cached. The first call also registers the styles in the
+    matplotlib library, see :func:`register_styles`.
+
+    Parameters
+    ----------
+    cset
+        Name of the colorset. Hyphens are automatically replaced.
+    """
+    _register_styles_once()
+    return dict(_style(cset.replace("-", "_")))
 
-        has_line = False
-        line_idx = 0
-        for i, line in enumerate(lines):
-            if line.startswith("axes.prop") and (
-                "cycler('color')" or 'cycler("color")' in line
-            ):
-                has_line = True
-                line_idx = i
-                break
-
-        if has_line:
-            lines[line_idx] = newline
-        else:
-            lines.append(newline)
-    else:
-        lines = [newline]
 
-    with open(fname, "w") as fp:
-        fp.writelines(lines)
+class _LazyStyle(Mapping[str, Any]):
+    """Style entry of the matplotlib library, only built when matplotlib reads it."""
+
+    def __init__(self, cset: str):
+        self.cset = cset
+
+    def __getitem__(self, key: str) -> Any:
+        return _style(self.cset)[key]
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(_style(self.cset))
+
+    def __len__(self) -> int:
+        return len(_style(self.cset))
+
+
+def register_styles():
+    """Register a style for each colorset in the matplotlib library.
+
+    Styles are named with a "tol." prefix, so that ``plt.style.use("tol.bright")``
+    works. Importing :mod:`matplotlib.style` reads all bundled stylesheets, so this
+    is only done when importing this module if :mod:`matplotlib.style` (or
+    :mod:`matplotlib.pyplot`) was already imported, or on the first call to
+    :func:`style`. Otherwise, call this function before using the styles by name.
+    It must also be called again if the matplotlib library is reloaded with
+    :func:`matplotlib.style.reload_library`. The style dictionaries themselves are
+    only built when first used.
+    """
+    import matplotlib.style  # noqa: PLC0415
+
+    library = matplotlib.style.library
+    for name in colorsets:
+        library.setdefault(f"tol.{name}", _LazyStyle(name))
+    matplotlib.style.available[:] = sorted(
+        name for name in library if not name.startswith("_")
+    )
+
+
+@functools.cache
+def _register_styles_once():
+    register_styles()
+
+
+if "matplotlib.style" in sys.modules:
+    _register_styles_once()
+_phase("styles")
 
 
 ## Colormaps
@@ -295,11 +646,18 @@ class ColormapMapping(dict[str, LinearSegmentedColormap | ListedColormap]):
     @overload
     def __getitem__(self, key: str) -> LinearSegmentedColormap | ListedColormap: ...
 
+    @instrumentation.timed("colormaps.getitem")
     def __getitem__(self, key: str) -> LinearSegmentedColormap | ListedColormap:
         return cast(
             LinearSegmentedColormap | ListedColormap, super().__getitem__(key).copy()
         )
 
+    def __missing__(self, key: str) -> LinearSegmentedColormap | ListedColormap:
+        # look for the colormap in the palette bundles of other packages
+        from tol_colors import plugins  # noqa: PLC0415
+
+        return plugins.find(self, key)
+
 
 colormaps = ColormapMapping()
 """Mapping of colormaps. Returns copies."""
@@ -335,18 +693,70 @@ colormaps["rainbow_PuRd"] = _make_linear_cmap(
     _rainbow_lin["bad_Pu"],
 )
 
-# Reverse colormaps
-colormaps.update({f"{name}_r": cmap.reversed() for name, cmap in colormaps.items()})
+# Reverse colormaps, sharing their lookup table with the forward ones
+for name, cmap in list(colormaps.items()):
+    colormaps[name], colormaps[f"{name}_r"] = reversed_pair(cmap)
 
 # Aliases
 colormaps["rainbow"] = colormaps["rainbow_WhBr"]
 colormaps["rainbow_r"] = colormaps["rainbow_WhBr_r"]
+_phase("colormaps")
+
+_register_lock = threading.RLock()
 
-# Register all colormaps in matplotlib
-for name, cmap in colormaps.items():
-    matplotlib.colormaps.register(cmap, name=f"tol.{name}")
 
+def register(force: bool = False):
+    """Register all colormaps in matplotlib, with the "tol." prefix.
 
+    This is done when importing this module. It is safe to call this function again,
+    from any thread: colormaps that are already registered are left as is.
+
+    Parameters
+    ----------
+    force
+        If True, replace colormaps that are already registered.
+    """
+    with _register_lock:
+        for name, cmap in colormaps.items():
+            mpl_name = f"tol.{name}"
+            if mpl_name in matplotlib.colormaps:
+                if not force:
+                    continue
+                # replacing with force=True would warn for each colormap
+                matplotlib.colormaps.unregister(mpl_name)
+            matplotlib.colormaps.register(cmap, name=mpl_name)
+
+
+def unregister():
+    """Remove all colormaps of this module from the matplotlib registry."""
+    with _register_lock:
+        for name in colormaps:
+            mpl_name = f"tol.{name}"
+            if mpl_name in matplotlib.colormaps:
+                matplotlib.colormaps.unregister(mpl_name)
+
+
+def preload():
+    """Build the lookup tables of all colormaps.
+
+    Matplotlib only builds the lookup table of a colormap when it is first used.
+    Calling this function in a parent process before forking workers (for instance
+    with the "preload" option of a WSGI server) lets all workers share the same
+    tables in memory, instead of each building its own. The colormaps registered in
+    matplotlib are replaced to hold the built tables as well.
+    """
+    with _register_lock, instrumentation.timer("lut.preload"):
+        for cmap in colormaps.values():
+            if not cmap._isinit:
+                cmap._init()
+    register(force=True)
+
+
+register()
+_phase("register")
+
+
+@instrumentation.timed("rainbow_discrete")
 def rainbow_discrete(n_colors: int = 22) -> ListedColormap:
     """Discrete rainbow colormaps.
 
@@ -381,10 +791,32 @@ def __dir__():
     attrs += list(colormaps.keys())
     attrs.append("rainbow_discrete")
     attrs.append("set_default_colors")
+    attrs.append("set_default_colors_many")
+    attrs.append("style")
+    attrs.append("cycler")
+    attrs.append("register_styles")
+    attrs.append("register")
+    attrs.append("unregister")
+    attrs.append("preload")
     attrs.sort()
     return attrs
 
 
+# Use lookup tables shared by another process
+if os.environ.get("TOL_COLORS_SHARED_LUTS"):
+    from tol_colors.shared import SharedLUTs
+
+    try:
+        _shared_luts = SharedLUTs.attach(os.environ["TOL_COLORS_SHARED_LUTS"])
+    except FileNotFoundError:
+        log.warning(
+            "Shared lookup tables '%s' not found, building them locally.",
+            os.environ["TOL_COLORS_SHARED_LUTS"],
+        )
+    else:
+        _shared_luts.install()
+
+
 # Static type-checking
 sunset: LinearSegmentedColormap
 sunset_r: LinearSegmentedColormap
@@ -548,3 +980,6 @@ def tol_cmap(
             cmaps_name,
         )
     return get_colormap(colormap, lut)
+
+
+instrumentation.record("module_init", time.perf_counter() - _init_start)
@@ -4,11 +4,11 @@ import numpy as np
 from matplotlib import pyplot as plt
 from matplotlib.patches import RegularPolygon
 
-from tol_colors import colormaps, colorsets, rainbow_discrete
+from tol_colors import colorsets, strips
 
 
 def main():
-    """Create three plots to showcase colorsets, colormaps, and rainbow_discrete."""
+    """Create two plots to showcase colorsets, and colormaps and rainbow_discrete."""
     # Show colorsets get_colorset(<scheme>).
     fig, axes = plt.subplots(
         ncols=len(colorsets), figsize=(13, 5), layout="constrained", sharey=True
@@ -38,45 +38,11 @@ def main():
         ax.set_axis_off()
         ax.set_title(cset_name, loc="left", weight="bold", size=9)
 
-    # Show colormaps
-    cmaps_names = [
-        n for n in colormaps if not (n.endswith("_r") or n.startswith("rainbow"))
-    ]
-    cmaps_names += ["rainbow_WhBr", "rainbow_WhRd", "rainbow_PuBr", "rainbow_PuRd"]
-    gradient = np.linspace(0, 1, 256)
-    gradient = np.vstack((gradient, gradient))
-    fig, axes = plt.subplots(nrows=len(cmaps_names))
-    fig.subplots_adjust(top=0.98, bottom=0.02, left=0.2, right=0.99)
-    for ax, cmap_name in zip(axes, cmaps_names, strict=False):
-        pos = list(ax.get_position().bounds)
-        ax.set_axis_off()
-        ax.imshow(gradient, aspect=4, cmap=colormaps[cmap_name])
-        fig.text(
-            pos[0] - 0.01,
-            pos[1] + pos[3] / 2.0,
-            cmap_name,
-            va="center",
-            ha="right",
-            fontsize=10,
-        )
-
-    # Show discrete rainbow.
-    gradient = np.linspace(0, 1, 256)
-    gradient = np.vstack((gradient, gradient))
-    fig, axes = plt.subplots(nrows=23)
-    fig.subplots_adjust(top=0.98, bottom=0.02, left=0.25, right=0.99)
-    for lut, ax in enumerate(axes, start=1):
-        pos = list(ax.get_position().bounds)
-        ax.set_axis_off()
-        ax.imshow(gradient, aspect=4, cmap=rainbow_discrete(lut))
-        fig.text(
-            pos[0] - 0.01,
-            pos[1] + pos[3] / 2.0,
-            "rainbow_discrete, " + str(lut),
-            va="center",
-            ha="right",
-            fontsize=10,
-        )
+    # Show colormaps and discrete rainbows, all strips in a single image
+    cmaps = strips.catalogue()
+    fig, ax = plt.subplots(figsize=(6.4, 0.2 * len(cmaps)))
+    fig.subplots_adjust(top=0.99, bottom=0.01, left=0.3, right=0.99)
+    strips.draw(ax, cmaps, fontsize=10)
 
     plt.show()
 
@@ -0,0 +1,375 @@
+"""Colorize arrays with precomputed lookup tables.
+
+Calling a matplotlib colormap on normalized data recomputes the uint8 lookup table
+and several masks at each call. Here the table is computed once per colormap and
+cached, and data is mapped to table indices in a few in-place operations.
+
+>>> rgba = colorize(data, "YlOrBr", vmin=0.0, vmax=10.0)
+
+Many small arrays are best colorized in a single call with :func:`colorize_many`.
+Data can also be classified into bins of arbitrary edges, typically with a discrete
+colormap, with :func:`colorize_bins`.
+"""
+
+# ruff: noqa: N803, N806
+
+import functools
+from collections.abc import Sequence
+from concurrent.futures import ThreadPoolExecutor
+
+import matplotlib
+import numpy as np
+from matplotlib.colors import Colormap, LinearSegmentedColormap
+
+import tol_colors
+from tol_colors import instrumentation
+
+
+def get_colormap(cmap: str | Colormap, N: int | None = None) -> Colormap:
+    """Return a colormap.
+
+    Parameters
+    ----------
+    cmap
+        Colormap, or name of a colormap of this package (the "tol." prefix is
+        optional), or of a colormap registered in matplotlib.
+    N
+        Number of colors. Only used to resample linear colormaps, discrete colormaps
+        keep their number of colors.
+    """
+    if isinstance(cmap, str):
+        name = cmap
+        try:
+            # not a membership test, so that palette bundles can be loaded
+            cmap = tol_colors.colormaps[name.removeprefix("tol.")]
+        except KeyError:
+            cmap = matplotlib.colormaps[name]
+    if N is not None and N != cmap.N and isinstance(cmap, LinearSegmentedColormap):
+        cmap = cmap.resampled(N)
+    return cmap
+
+
+@instrumentation.timed("lut.bytes")
+def _byte_lut(cmap: Colormap) -> np.ndarray:
+    n = cmap.N
+    table = np.empty((n + 3, 4), dtype=np.uint8)
+    table[0] = cmap(-1.0, bytes=True)
+    table[1 : n + 1] = cmap(np.arange(n), bytes=True)
+    table[n + 1] = cmap(np.inf, bytes=True)
+    table[n + 2] = cmap(np.nan, bytes=True)
+    table.flags.writeable = False
+    return table
+
+
+@functools.lru_cache(maxsize=128)
+def _cached_byte_lut(name: str, N: int | None) -> np.ndarray:
+    return _byte_lut(get_colormap(name, N))
+
+
+def byte_lut(cmap: str | Colormap, N: int | None = 256) -> np.ndarray:
+    """Return a lookup table of RGBA bytes, extended with the special colors.
+
+    The table has shape ``(N+3, 4)`` and is ordered as: *under* color, the *N*
+    colors of the colormap, *over* color, *bad* color. This is the order of the
+    indices returned by :func:`indices`. Tables are read-only, and cached when the
+    colormap is given by name.
+
+    Parameters
+    ----------
+    cmap
+        Colormap or colormap name, see :func:`get_colormap`.
+    N
+        Number of colors for linear colormaps.
+    """
+    if isinstance(cmap, str):
+        return _cached_byte_lut(cmap, N)
+    return _byte_lut(get_colormap(cmap, N))
+
+
+def indices(
+    data: np.ndarray,
+    vmin: float | np.ndarray,
+    vmax: float | np.ndarray,
+    N: int | np.ndarray,
+    dtype=np.intp,
+) -> np.ndarray:
+    """Return indices in an extended lookup table.
+
+    Data is normalized linearly between *vmin* and *vmax*, as a colormap would.
+    Indices correspond to the extended table returned by :func:`byte_lut`: 0 for
+    values under *vmin*, 1 to N for values in range, N+1 for values over *vmax*, and
+    N+2 for invalid (NaN or masked) values. If *vmin* equals *vmax*, all valid values
+    are given the first color.
+
+    Parameters
+    ----------
+    data
+        Array of values.
+    vmin, vmax
+        Values mapped to the first and last colors.
+    N
+        Number of colors.
+    dtype
+        Integer data type of the indices.
+
+    Notes
+    -----
+    *vmin*, *vmax*, and *N* can be arrays broadcastable against *data*, to map
+    each value with its own normalization.
+    """
+    mask = np.ma.getmask(data)
+    x = np.array(np.ma.getdata(data), dtype=np.result_type(data, np.float32))
+    x -= vmin
+    span = np.subtract(vmax, vmin)
+    flat = span == 0
+    x *= N / np.where(flat, 1, span)
+    # vmax is not out of range
+    x[x == N] -= 1
+    np.floor(x, out=x)
+    np.clip(x, -1, N, out=x)
+    if np.any(flat):
+        # like Normalize, a zero range maps all values to the first color
+        np.copyto(x, 0, where=flat & ~np.isnan(x))
+    x += 1
+    if mask is not np.ma.nomask:
+        x[mask] = np.nan
+    np.copyto(x, np.add(N, 2), where=np.isnan(x))
+    return x.astype(dtype)
+
+
+@instrumentation.timed("colorize")
+def colorize(
+    data: np.ndarray,
+    cmap: str | Colormap,
+    vmin: float,
+    vmax: float,
+    N: int | None = 256,
+) -> np.ndarray:
+    """Map data to RGBA bytes.
+
+    The result is the same as ``cmap(Normalize(vmin, vmax)(data), bytes=True)``.
+
+    Parameters
+    ----------
+    data
+        Array of values. NaN and masked values are given the *bad* color.
+    cmap
+        Colormap or colormap name, see :func:`get_colormap`.
+    vmin, vmax
+        Values mapped to the first and last colors.
+    N
+        Number of colors for linear colormaps.
+
+    Returns
+    -------
+    Array of uint8 of shape ``data.shape + (4,)``.
+    """
+    lut = byte_lut(cmap, N)
+    return lut.take(indices(data, vmin, vmax, lut.shape[0] - 3), axis=0)
+
+
+def _per_array(value, n: int, name: str) -> list:
+    if isinstance(value, str | Colormap) or np.ndim(value) == 0:
+        return [value] * n
+    value = list(value)
+    if len(value) != n:
+        raise ValueError(f"Expected one {name} per array ({len(value)} != {n}).")
+    return value
+
+
+@instrumentation.timed("colorize_many")
+def colorize_many(
+    arrays: Sequence[np.ndarray],
+    cmaps: str | Colormap | Sequence[str | Colormap],
+    vmin: float | Sequence[float],
+    vmax: float | Sequence[float],
+    N: int | None = 256,
+) -> list[np.ndarray]:
+    """Map many arrays to RGBA bytes in a single pass.
+
+    Arrays are concatenated and colorized at once against the cached tables of
+    each colormap, which avoids the overhead of a call per array. Results are
+    views in a single output buffer.
+
+    Parameters
+    ----------
+    arrays
+        Arrays of values. NaN and masked values are given the *bad* color.
+    cmaps
+        Colormap or colormap name (see :func:`get_colormap`), or one per array.
+    vmin, vmax
+        Values mapped to the first and last colors, or one per array.
+    N
+        Number of colors for linear colormaps.
+
+    Returns
+    -------
+    List of arrays of uint8 of shape ``array.shape + (4,)``.
+    """
+    n = len(arrays)
+    if n == 0:
+        return []
+    cmaps = _per_array(cmaps, n, "colormap")
+    vmins = np.asarray(_per_array(vmin, n, "vmin"), dtype=float)
+    vmaxs = np.asarray(_per_array(vmax, n, "vmax"), dtype=float)
+
+    # a single table for all colormaps, each array indexes into its part
+    tables: dict[str | int, tuple[int, np.ndarray]] = {}
+    offsets = np.empty(n, dtype=np.intp)
+    n_colors = np.empty(n, dtype=np.intp)
+    start = 0
+    for i, cmap in enumerate(cmaps):
+        key = cmap if isinstance(cmap, str) else id(cmap)
+        if key not in tables:
+            lut = byte_lut(cmap, N)
+            tables[key] = (start, lut)
+            start += lut.shape[0]
+        offsets[i], lut = tables[key]
+        n_colors[i] = lut.shape[0] - 3
+    lut = np.concatenate([table for _, table in tables.values()])
+
+    sizes = [np.size(a) for a in arrays]
+    if any(isinstance(a, np.ma.MaskedArray) for a in arrays):
+        flat = np.ma.concatenate([np.ma.ravel(a) for a in arrays])
+    else:
+        flat = np.concatenate([np.ravel(a) for a in arrays])
+    idx = indices(
+        flat,
+        np.repeat(vmins, sizes),
+        np.repeat(vmaxs, sizes),
+        np.repeat(n_colors, sizes),
+    )
+    idx += np.repeat(offsets, sizes)
+    rgba = lut.take(idx, axis=0)
+    bounds = [0, *np.cumsum(sizes).tolist()]
+    return [
+        rgba[start:end].reshape(*np.shape(a), 4)
+        for a, start, end in zip(arrays, bounds[:-1], bounds[1:], strict=True)
+    ]
+
+
+_MAX_COMPARISONS = 32
+
+
+def _bin_table(n_bins: int, N: int) -> np.ndarray:
+    """Return the index in the extended table of each bin, under and over first/last.
+
+    If there are more colors than bins, colors are picked like
+    :class:`~matplotlib.colors.BoundaryNorm` does.
+    """
+    if n_bins > N:
+        raise ValueError(f"There are more bins ({n_bins}) than colors ({N}).")
+    colors = np.arange(n_bins)
+    if N > n_bins:
+        if n_bins == 1:
+            colors[:] = (N - 1) // 2
+        else:
+            colors = ((N - 1) / (n_bins - 1) * colors).astype(np.int16)
+    return np.concatenate([[0], colors + 1, [N + 1]])
+
+
+def bin_indices(
+    data: np.ndarray,
+    edges: Sequence[float] | np.ndarray,
+    N: int | None = None,
+    dtype=np.uint8,
+    threads: int | None = None,
+) -> np.ndarray:
+    """Return indices in an extended lookup table of data classified in bins.
+
+    Bins are closed on the left: ``edges[i] <= x < edges[i+1]``, as for
+    :class:`~matplotlib.colors.BoundaryNorm`. Indices are ordered as in
+    :func:`indices`: 0 for values under the first edge, 1 to N for values in the
+    bins, N+1 for values over the last edge (included), and N+2 for invalid (NaN or
+    masked) values.
+
+    Parameters
+    ----------
+    data
+        Array of values.
+    edges
+        Increasing edges of the bins.
+    N
+        Number of colors. If None, one per bin. If there are more colors than bins,
+        colors are picked evenly as with :class:`~matplotlib.colors.BoundaryNorm`.
+    dtype
+        Integer data type of the indices. The default uint8 requires that N is at
+        most 253.
+    threads
+        If given, classify large arrays in that many threads.
+    """
+    edges = np.asarray(edges)
+    n_bins = edges.size - 1
+    if n_bins < 1 or (np.diff(edges) <= 0).any():
+        raise ValueError("Edges must be an increasing sequence of at least 2 values.")
+    if N is None:
+        N = n_bins
+    if N + 2 > np.iinfo(dtype).max:
+        raise ValueError(f"Data type {np.dtype(dtype)} cannot hold {N} colors.")
+    table = _bin_table(n_bins, N).astype(dtype)
+
+    mask = np.ma.getmask(data)
+    x = np.ascontiguousarray(np.ma.getdata(data)).ravel()
+    out = np.empty(x.shape, dtype=dtype)
+    check_nan = x.dtype.kind in "fc"
+
+    def classify(sl: slice):
+        # index of the first edge greater than each value
+        k: np.ndarray
+        if edges.size <= _MAX_COMPARISONS:
+            # a pass per edge is faster than a binary search for few edges
+            k = np.zeros(x[sl].shape, dtype=np.uint8)
+            above = np.empty(x[sl].shape, dtype=bool)
+            for edge in edges:
+                np.greater_equal(x[sl], edge, out=above)
+                k += above
+        else:
+            k = np.searchsorted(edges, x[sl], side="right")
+        np.take(table, k, out=out[sl])
+        if check_nan:
+            out[sl][np.isnan(x[sl])] = N + 2
+
+    if threads is None or threads < 2 or x.size < 2**16:  # noqa: PLR2004
+        classify(slice(None))
+    else:
+        bounds = np.linspace(0, x.size, threads + 1).astype(int)
+        with ThreadPoolExecutor(threads) as executor:
+            list(executor.map(classify, map(slice, bounds[:-1], bounds[1:])))
+
+    out = out.reshape(np.shape(data))
+    if mask is not np.ma.nomask:
+        out[mask] = N + 2
+    return out
+
+
+def colorize_bins(
+    data: np.ndarray,
+    edges: Sequence[float] | np.ndarray,
+    cmap: str | Colormap,
+    threads: int | None = None,
+) -> np.ndarray:
+    """Map data classified in bins to RGBA bytes.
+
+    The result is the same as ``cmap(BoundaryNorm(edges, cmap.N)(data),
+    bytes=True)``, except that NaN values are given the *bad* color.
+
+    Parameters
+    ----------
+    data
+        Array of values. NaN and masked values are given the *bad* color.
+    edges
+        Increasing edges of the bins, see :func:`bin_indices`.
+    cmap
+        Colormap or colormap name, see :func:`get_colormap`. Typically a discrete
+        colormap with one color per bin.
+    threads
+        If given, classify large arrays in that many threads.
+
+    Returns
+    -------
+    Array of uint8 of shape ``data.shape + (4,)``.
+    """
+    lut = byte_lut(cmap, None)
+    n = lut.shape[0] - 3
+    dtype = np.uint8 if n <= 253 else np.intp  # noqa: PLR2004
+    return lut.take(bin_indices(data, edges, n, dtype=dtype, threads=threads), axis=0)
@@ -0,0 +1,271 @@
+"""Colormaps storing their lookup table with a compact data type.
+
+Matplotlib colormaps store their lookup table as float64. :class:`CompactColormap`
+stores it as float32 (half the memory) or uint8 (an eighth), and only converts the
+colors it returns. Mapping to bytes from a uint8 table requires no conversion at all.
+
+>>> cmap = compact(tol_colors.sunset, dtype="uint8", N=4096)
+>>> cmap.nbytes
+16396
+"""
+
+# ruff: noqa: N803
+
+from collections.abc import Mapping
+from typing import cast
+
+import numpy as np
+from matplotlib.colors import Colormap, to_rgba
+
+import tol_colors
+
+_DTYPES = {"float32": np.float32, "uint8": np.uint8}
+
+
+def _from_float(lut: np.ndarray, dtype: np.dtype) -> np.ndarray:
+    lut = np.asarray(lut, dtype=np.float64)
+    if dtype == np.uint8:
+        # truncate like matplotlib does for bytes output
+        return (lut * 255).astype(np.uint8)
+    return lut.astype(dtype)
+
+
+def _to_float(lut: np.ndarray) -> np.ndarray:
+    if lut.dtype == np.uint8:
+        return lut / 255.0
+    return lut.astype(np.float64)
+
+
+class CompactColormap(Colormap):
+    """Colormap with a lookup table stored as float32 or uint8.
+
+    It can be used anywhere a matplotlib colormap is expected. Colors are converted
+    to float64 (or uint8 if requested with ``bytes=True``) only when the colormap is
+    called.
+
+    Parameters
+    ----------
+    colors
+        Array of shape ``(N, 4)`` or ``(N, 3)``. Floats in [0, 1] or uint8 values.
+    name
+        Name of the colormap.
+    dtype
+        Data type of the lookup table, either "float32" or "uint8".
+    bad, under, over
+        Colors for invalid, low out-of-range, and high out-of-range values.
+    """
+
+    def __init__(  # noqa: PLR0913
+        self,
+        colors: np.ndarray,
+        name: str = "compact",
+        dtype: str = "uint8",
+        *,
+        bad=None,
+        under=None,
+        over=None,
+    ):
+        if dtype not in _DTYPES:
+            raise ValueError(f"dtype must be one of {list(_DTYPES)}, not '{dtype}'")
+        colors = np.asarray(colors)
+        if colors.shape[-1] == 3:  # noqa: PLR2004
+            opaque = 255 if colors.dtype == np.uint8 else 1.0
+            colors = np.column_stack(
+                [colors, np.full(colors.shape[0], opaque, colors.dtype)]
+            )
+        super().__init__(name, N=colors.shape[0])
+        self._dtype = _DTYPES[dtype]
+        self._colors = colors
+        self._rgba_bad = (0.0, 0.0, 0.0, 0.0) if bad is None else to_rgba(bad)
+        self._rgba_under = None if under is None else to_rgba(under)
+        self._rgba_over = None if over is None else to_rgba(over)
+        # build the table right away, to not hold onto the original colors
+        self._init()
+
+    def _init(self):
+        storage = np.zeros((self.N + 3, 4), self._dtype)
+        if self._colors.dtype == self._dtype:
+            storage[:-3] = self._colors
+        elif self._colors.dtype == np.uint8:
+            storage[:-3] = _to_float(self._colors)
+        else:
+            storage[:-3] = _from_float(self._colors, self._dtype)
+        self._storage = storage
+        del self._colors
+        self._isinit = True
+        self._update_lut_extremes()
+
+    @property
+    def dtype(self) -> np.dtype:
+        """Data type of the lookup table."""
+        return np.dtype(self._dtype)
+
+    @property
+    def nbytes(self) -> int:
+        """Memory used by the lookup table, in bytes."""
+        self._ensure_inited()
+        return self._storage.nbytes
+
+    @property
+    def _lut(self) -> np.ndarray:
+        """Lookup table as float64, for matplotlib internals. This is a copy."""
+        return _to_float(self._storage)
+
+    def __copy__(self):
+        cls = self.__class__
+        cmapobject = cls.__new__(cls)
+        cmapobject.__dict__.update(self.__dict__)
+        if self._isinit:
+            cmapobject._storage = np.copy(self._storage)
+        return cmapobject
+
+    def with_alpha(self, alpha: float) -> "CompactColormap":
+        """Return a copy of the colormap with a new uniform transparency."""
+        if not 0 <= alpha <= 1:
+            raise ValueError("'alpha' must be between 0 and 1, inclusive")
+        new = cast(CompactColormap, self.copy())
+        new._ensure_inited()
+        new._storage[:, 3] = _from_float(np.asarray(alpha), np.dtype(self._dtype))
+        return new
+
+    def _ensure_inited(self):
+        if not self._isinit:
+            self._init()
+
+    def _update_lut_extremes(self):
+        lut = self._storage
+        lut[self._i_under] = (
+            _from_float(self._rgba_under, self._dtype) if self._rgba_under else lut[0]
+        )
+        lut[self._i_over] = (
+            _from_float(self._rgba_over, self._dtype)
+            if self._rgba_over
+            else lut[self.N - 1]
+        )
+        lut[self._i_bad] = _from_float(self._rgba_bad, self._dtype)
+
+    def __call__(self, X, alpha=None, bytes=False):  # noqa: A002
+        """Map data to colors, see :meth:`matplotlib.colors.Colormap.__call__`."""
+        rgba, _ = self._get_rgba_and_mask(X, alpha=alpha, bytes=bytes)
+        if not np.iterable(X):
+            rgba = tuple(rgba)
+        return rgba
+
+    def _get_rgba_and_mask(self, X, alpha=None, bytes=False):  # noqa: A002
+        self._ensure_inited()
+
+        xa = np.array(X, copy=True)
+        if xa.dtype.kind == "f":
+            xa *= self.N
+            xa[xa == self.N] = self.N - 1
+        mask_under = xa < 0
+        mask_over = xa >= self.N
+        mask_bad = X.mask if np.ma.is_masked(X) else np.isnan(xa)
+        with np.errstate(invalid="ignore"):
+            xa = xa.astype(int)
+        xa[mask_under] = self._i_under
+        xa[mask_over] = self._i_over
+        xa[mask_bad] = self._i_bad
+
+        rgba = self._storage.take(xa, axis=0, mode="clip")
+        if bytes:
+            if rgba.dtype != np.uint8:
+                rgba = (rgba * 255).astype(np.uint8)
+        else:
+            rgba = _to_float(rgba)
+
+        if alpha is not None:
+            alpha = np.clip(alpha, 0, 1)
+            if bytes:
+                alpha *= 255
+            if alpha.shape not in [(), xa.shape]:
+                raise ValueError(
+                    f"alpha is array-like but its shape {alpha.shape} does "
+                    f"not match that of X {xa.shape}"
+                )
+            rgba[..., -1] = alpha
+            if (self._storage[-1] == 0).all():
+                rgba[mask_bad] = (0, 0, 0, 0)
+
+        return rgba, mask_bad
+
+    def resampled(self, lutsize: int) -> "CompactColormap":
+        """Return a new colormap with *lutsize* entries."""
+        colors = self(np.linspace(0, 1, lutsize), bytes=self._dtype == np.uint8)
+        return CompactColormap(
+            colors,
+            name=self.name,
+            dtype=self.dtype.name,
+            bad=self._rgba_bad,
+            under=self._rgba_under,
+            over=self._rgba_over,
+        )
+
+    def reversed(self, name: str | None = None) -> "CompactColormap":
+        """Return a reversed instance of the colormap."""
+        if name is None:
+            name = self.name + "_r"
+        return CompactColormap(
+            self._storage[self.N - 1 :: -1],
+            name=name,
+            dtype=self.dtype.name,
+            bad=self._rgba_bad,
+            under=self._rgba_over,
+            over=self._rgba_under,
+        )
+
+
+def compact(
+    cmap: Colormap, dtype: str = "uint8", N: int | None = None
+) -> CompactColormap:
+    """Return a compact version of a colormap.
+
+    Parameters
+    ----------
+    cmap
+        Colormap to convert.
+    dtype
+        Data type of the lookup table, either "float32" or "uint8".
+    N
+        Number of colors. If None, keep the number of colors of *cmap*.
+    """
+    if N is not None and N != cmap.N:
+        cmap = cmap.resampled(N)
+    colors = cmap(np.arange(cmap.N), bytes=dtype == "uint8")
+    return CompactColormap(
+        colors,
+        name=cmap.name,
+        dtype=dtype,
+        bad=cmap._rgba_bad,  # type: ignore[attr-defined]
+        under=cmap._rgba_under,  # type: ignore[attr-defined]
+        over=cmap._rgba_over,  # type: ignore[attr-defined]
+    )
+
+
+def memory_footprint(cmaps: Mapping[str, Colormap] | None = None) -> dict[str, int]:
+    """Return the memory used by the lookup table of each colormap, in bytes.
+
+    Colormaps whose lookup table has not been built yet use no memory. Tables
+    shared between colormaps (see :mod:`tol_colors.reverse`) are counted once.
+
+    Parameters
+    ----------
+    cmaps
+        Mapping of colormaps. If None, use :data:`tol_colors.colormaps`.
+    """
+    if cmaps is None:
+        cmaps = tol_colors.colormaps
+    footprint = {}
+    seen = set()
+    # do not go through __getitem__, that might return copies
+    for name, cmap in cmaps.items():
+        if isinstance(cmap, CompactColormap):
+            footprint[name] = cmap.nbytes
+        elif not cmap._isinit:  # type: ignore[attr-defined]
+            footprint[name] = 0
+        else:
+            lut = cmap._lut  # type: ignore[attr-defined]
+            lut = lut if lut.base is None else lut.base
+            footprint[name] = 0 if id(lut) in seen else lut.nbytes
+            seen.add(id(lut))
+    return footprint
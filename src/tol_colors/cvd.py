@@ -0,0 +1,285 @@
+"""Check colormaps for color vision deficiencies (CVD).
+
+Colormaps of tol_colors are designed to keep their properties for color-blind
+readers: lightness varies monotonically for sequential colormaps, and consecutive
+colors stay distinct. :func:`score` measures these properties for many colormaps
+at once, in normal vision and in simulated protanopia, deuteranopia and tritanopia,
+and compares each colormap to the closest linear colormap of tol_colors.
+
+>>> scores = score([matplotlib.colormaps["jet"], matplotlib.colormaps["viridis"]])
+>>> scores.closest
+['sunset', 'iridescent_r']
+>>> scores.failed
+array([ True, False])
+
+Colormaps are sampled at *N* points, and all samples are processed in a single
+vectorized computation. Results are cached by the hash of the samples, so that
+scoring the same colormaps again (or a copy of them) is nearly free.
+
+Deficiencies are simulated with the model of Machado, Oliveira and Fernandes
+(2009), at full severity, as in the documentation. Lightness and distances are
+computed in OKLab.
+"""
+
+# ruff: noqa: N803
+
+import functools
+import hashlib
+import threading
+from collections import OrderedDict
+from collections.abc import Sequence
+from typing import NamedTuple, cast
+
+import numpy as np
+from matplotlib.colors import Colormap, LinearSegmentedColormap, ListedColormap
+
+import tol_colors
+from tol_colors.colorize import get_colormap
+from tol_colors.interp import linear_to_srgb, srgb_to_linear, srgb_to_oklab
+
+VISIONS = ("normal", "protanopia", "deuteranopia", "tritanopia")
+"""Visions in which colormaps are scored, in the order of the score arrays."""
+
+# Machado et al. (2009), severity 1, applied to linear-light RGB
+_MATRICES = np.array(
+    [
+        np.eye(3),
+        [
+            [0.152286, 1.052583, -0.204868],
+            [0.114503, 0.786281, 0.099216],
+            [-0.003882, -0.048116, 1.051998],
+        ],
+        [
+            [0.367322, 0.860646, -0.227968],
+            [0.280085, 0.672501, 0.047413],
+            [-0.011820, 0.042940, 0.968881],
+        ],
+        [
+            [1.255528, -0.076749, -0.178779],
+            [-0.078411, 0.930809, 0.147602],
+            [0.004733, 0.691367, 0.303900],
+        ],
+    ]
+)
+
+_CACHE_SIZE = 4096
+
+
+class _Row(NamedTuple):
+    monotonic: np.ndarray
+    min_step: np.ndarray
+    closest: str
+    distance: float
+    reference_monotonic: np.ndarray
+    reference_min_step: np.ndarray
+
+
+_cache: OrderedDict[bytes, _Row] = OrderedDict()
+_lock = threading.Lock()
+
+
+def simulate(rgb: np.ndarray, vision: str) -> np.ndarray:
+    """Return sRGB colors as seen with a color vision deficiency.
+
+    Parameters
+    ----------
+    rgb
+        Array of sRGB values in [0, 1], of shape ``(..., 3)``.
+    vision
+        One of :data:`VISIONS`.
+    """
+    matrix = _MATRICES[VISIONS.index(vision)]
+    return linear_to_srgb(srgb_to_linear(rgb) @ matrix.T)
+
+
+def _sample(cmaps: Sequence[Colormap], N: int) -> np.ndarray:
+    """Return the RGB samples of colormaps, of shape (n_cmaps, N, 3)."""
+    x = np.linspace(0.0, 1.0, N)
+    samples = np.empty((len(cmaps), N, 3))
+    for i, cmap in enumerate(cmaps):
+        if isinstance(cmap, LinearSegmentedColormap | ListedColormap):
+            # index the lookup table as Colormap.__call__, without its overhead
+            if not cmap._isinit:  # type: ignore[union-attr]
+                cmap._init()  # type: ignore[union-attr]
+            idx = np.minimum((x * cmap.N).astype(np.intp), cmap.N - 1)
+            samples[i] = cmap._lut[idx, :3]  # type: ignore[union-attr]
+        else:
+            samples[i] = cmap(x)[:, :3]
+    return samples
+
+
+def _features(samples: np.ndarray) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Return lightness monotonicity and minimum step in each vision.
+
+    Returns
+    -------
+    lab
+        Samples in OKLab for normal vision, of shape (n_cmaps, N, 3).
+    monotonic
+        Boolean array of shape (n_cmaps, n_visions).
+    min_step
+        Smallest OKLab distance between consecutive distinct samples, of shape
+        (n_cmaps, n_visions).
+    """
+    linear = srgb_to_linear(samples)
+    # (n_visions, n_cmaps, N, 3)
+    seen = linear_to_srgb(np.einsum("vij,cnj->vcni", _MATRICES, linear))
+    lab = srgb_to_oklab(seen)
+
+    steps = np.diff(lab, axis=2)
+    lightness = steps[..., 0]
+    tol = 1e-3
+    monotonic = (lightness >= -tol).all(axis=2) | (lightness <= tol).all(axis=2)
+
+    # samples falling in the same color of discrete colormaps are not steps
+    distinct = (np.diff(samples, axis=1) != 0).any(axis=-1)
+    distance = np.sqrt((steps**2).sum(axis=-1))
+    min_step = np.where(distinct, distance, np.inf).min(axis=2)
+    return lab[0], np.asarray(monotonic).T, min_step.T
+
+
+def _reference_names() -> tuple[str, ...]:
+    """Return the names of the linear colormaps of tol_colors."""
+    return tuple(
+        name
+        for name, cmap in tol_colors.colormaps.items()
+        if isinstance(cmap, LinearSegmentedColormap)
+    )
+
+
+@functools.lru_cache(maxsize=8)
+def _reference(
+    names: tuple[str, ...], N: int
+) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    cmaps = [tol_colors.colormaps[name] for name in names]
+    return _features(_sample(cmaps, N))
+
+
+def _closest(
+    lab: np.ndarray, reference: np.ndarray, chunk_size: int = 64
+) -> tuple[np.ndarray, np.ndarray]:
+    """Return the index and mean OKLab distance of the closest reference."""
+    index = np.empty(len(lab), dtype=np.intp)
+    distance = np.empty(len(lab))
+    for start in range(0, len(lab), chunk_size):
+        chunk = lab[start : start + chunk_size, None]
+        dist = np.sqrt(((chunk - reference[None]) ** 2).sum(axis=-1)).mean(axis=-1)
+        index[start : start + chunk_size] = dist.argmin(axis=1)
+        distance[start : start + chunk_size] = dist.min(axis=1)
+    return index, distance
+
+
+class Scores:
+    """Scores of colormaps.
+
+    Arrays of shape ``(n_cmaps, n_visions)`` follow the order of :data:`VISIONS`.
+
+    Attributes
+    ----------
+    names
+        Name of each colormap.
+    monotonic
+        Whether the lightness of each colormap varies monotonically.
+    min_step
+        Smallest perceptual distance (in OKLab) between consecutive colors.
+    closest
+        Name of the closest linear colormap of tol_colors.
+    distance
+        Mean distance to the closest colormap, in OKLab.
+    reference_monotonic, reference_min_step
+        Scores of the closest colormap.
+    """
+
+    def __init__(self, names: list[str], rows: list[_Row]):
+        self.names = names
+        self.monotonic = np.array([row.monotonic for row in rows]).reshape(-1, 4)
+        self.min_step = np.array([row.min_step for row in rows]).reshape(-1, 4)
+        self.closest = [row.closest for row in rows]
+        self.distance = np.array([row.distance for row in rows])
+        self.reference_monotonic = np.array(
+            [row.reference_monotonic for row in rows]
+        ).reshape(-1, 4)
+        self.reference_min_step = np.array(
+            [row.reference_min_step for row in rows]
+        ).reshape(-1, 4)
+
+    def __len__(self) -> int:
+        return len(self.names)
+
+    def failures(self, ratio: float = 0.25) -> np.ndarray:
+        """Return where colormaps fail compared to their closest tol colormap.
+
+        A colormap fails in a vision if its lightness is not monotonic while the
+        lightness of the closest colormap is, or if its minimum step is smaller
+        than *ratio* times the one of the closest colormap.
+
+        Returns
+        -------
+        Boolean array of shape ``(n_cmaps, n_visions)``.
+        """
+        lost_monotonic = self.reference_monotonic & ~self.monotonic
+        return np.asarray(
+            lost_monotonic | (self.min_step < ratio * self.reference_min_step)
+        )
+
+    @property
+    def failed(self) -> np.ndarray:
+        """Whether each colormap fails in any vision, see :meth:`failures`."""
+        return np.asarray(self.failures().any(axis=1))
+
+
+def score(cmaps: Sequence[str | Colormap], N: int = 64) -> Scores:
+    """Score colormaps in normal vision and simulated deficiencies.
+
+    Parameters
+    ----------
+    cmaps
+        Colormaps, or names of colormaps (see :func:`.colorize.get_colormap`).
+    N
+        Number of samples of each colormap.
+    """
+    colormaps = [get_colormap(cmap) for cmap in cmaps]
+    samples = _sample(colormaps, N)
+    # scores depend on the colormaps of tol_colors, that plugins can extend
+    names = _reference_names()
+    prefix = hashlib.blake2b("\0".join(names).encode(), digest_size=16)
+    keys = []
+    for s in samples:
+        h = prefix.copy()
+        h.update(s.tobytes())
+        keys.append(h.digest())
+
+    with _lock:
+        rows = [_cache.get(key) for key in keys]
+        for key, row in zip(keys, rows, strict=True):
+            if row is not None:
+                _cache.move_to_end(key)
+
+    missing = [i for i, row in enumerate(rows) if row is None]
+    if missing:
+        ref_lab, ref_monotonic, ref_min_step = _reference(names, N)
+        lab, monotonic, min_step = _features(samples[missing])
+        index, distance = _closest(lab, ref_lab)
+        with _lock:
+            for j, i in enumerate(missing):
+                k = index[j]
+                row = _Row(
+                    monotonic[j],
+                    min_step[j],
+                    names[k],
+                    distance[j],
+                    ref_monotonic[k],
+                    ref_min_step[k],
+                )
+                rows[i] = _cache[keys[i]] = row
+            while len(_cache) > _CACHE_SIZE:
+                _cache.popitem(last=False)
+
+    return Scores([cmap.name for cmap in colormaps], cast(list[_Row], rows))
+
+
+def clear_cache():
+    """Forget the scores of all colormaps."""
+    with _lock:
+        _cache.clear()
+    _reference.cache_clear()
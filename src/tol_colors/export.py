@@ -0,0 +1,154 @@
+"""Export lookup tables of colormaps and colorsets to other languages.
+
+The tables of several colormaps (or colorsets) are stored one after the other in a
+single C-contiguous array of RGBA rows, along with the name and position of each
+table. Consumers access the array through the buffer protocol (``memoryview``,
+numpy, Rust and JS bindings...) or as a PyArrow table, without copies::
+
+    table = colormap_table(N=256, bytes=True)
+    table["sunset"]          # view on the rows of sunset
+    memoryview(table.data)   # uint8 buffer of shape (n_rows, 4)
+    table.to_arrow()         # pyarrow.Table with "name" and "rgba" columns
+
+Tables of :class:`~tol_colors.shared.SharedLUTs` are exported from shared memory
+with :meth:`LUTTable.from_shared`.
+"""
+
+# ruff: noqa: N803
+
+from collections.abc import Iterator, Mapping
+from typing import Any, cast
+
+import numpy as np
+
+import tol_colors
+from tol_colors.shared import SharedLUTs, _build_lut
+
+
+class LUTTable(Mapping[str, np.ndarray]):
+    """Lookup tables stored in a single contiguous array.
+
+    This is a read-only mapping of names to views on the rows of each table.
+
+    Parameters
+    ----------
+    data
+        Array of shape ``(n_rows, 4)``, C-contiguous.
+    names
+        Name of each table.
+    offsets
+        Position of each table in *data*: table *i* spans rows ``offsets[i]`` to
+        ``offsets[i+1]``. Length is ``len(names) + 1``.
+    """
+
+    def __init__(self, data: np.ndarray, names: list[str], offsets: np.ndarray):
+        if not data.flags.c_contiguous or data.ndim != 2:  # noqa: PLR2004
+            raise ValueError("Tables must be stored in a 2D C-contiguous array.")
+        if len(offsets) != len(names) + 1:
+            raise ValueError("There must be one more offset than names.")
+        self.data = data
+        self.names = names
+        self.offsets = np.asarray(offsets, dtype=np.int64)
+        self._index = {name: i for i, name in enumerate(names)}
+
+    @classmethod
+    def from_arrays(cls, tables: Mapping[str, np.ndarray]) -> "LUTTable":
+        """Copy tables into a single array."""
+        arrays = list(tables.values())
+        offsets = np.zeros(len(arrays) + 1, dtype=np.int64)
+        np.cumsum([a.shape[0] for a in arrays], out=offsets[1:])
+        dtype = np.result_type(*arrays) if arrays else np.float64
+        data = np.empty((offsets[-1], 4), dtype=dtype)
+        if arrays:
+            np.concatenate(arrays, out=data)
+        data.flags.writeable = False
+        return cls(data, list(tables), offsets)
+
+    @classmethod
+    def from_shared(cls, luts: SharedLUTs) -> "LUTTable":
+        """Return the tables of a shared memory block, without copying them."""
+        positions = sorted(luts.index.items(), key=lambda item: item[1][0])
+        names = [name for name, _ in positions]
+        offsets = [start for _, (start, _) in positions]
+        offsets.append(luts.data.shape[0])
+        return cls(luts.data, names, np.array(offsets))
+
+    def __getitem__(self, name: str) -> np.ndarray:
+        i = self._index[name]
+        return self.data[self.offsets[i] : self.offsets[i + 1]]
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.names)
+
+    def __len__(self) -> int:
+        return len(self.names)
+
+    def __array__(self, dtype: Any = None, copy: bool | None = None) -> np.ndarray:
+        if copy:
+            return np.array(self.data, dtype=dtype)
+        return np.asarray(self.data, dtype=dtype)
+
+    def __buffer__(self, flags: int) -> memoryview:
+        # buffer protocol for Python >= 3.12, use the data attribute otherwise
+        return memoryview(self.data)  # type: ignore[arg-type]
+
+    def name_index(self) -> np.ndarray:
+        """Return the index of the table (in :attr:`names`) of each row, as int32."""
+        return np.repeat(
+            np.arange(len(self.names), dtype=np.int32), np.diff(self.offsets)
+        )
+
+    def to_arrow(self) -> Any:
+        """Return a :class:`pyarrow.Table`, sharing the memory of the tables.
+
+        The table has a "name" column (dictionary encoded), and an "rgba" column of
+        fixed size lists of 4 values. The offsets are stored in the schema metadata
+        (key "offsets", comma separated). Requires pyarrow.
+        """
+        try:
+            import pyarrow as pa  # noqa: PLC0415
+        except ImportError as err:
+            raise ImportError("Exporting to Arrow requires pyarrow.") from err
+
+        names = pa.DictionaryArray.from_arrays(self.name_index(), self.names)
+        rgba = pa.FixedSizeListArray.from_arrays(pa.array(self.data.ravel()), 4)
+        offsets = ",".join(str(o) for o in self.offsets)
+        return pa.table(dict(name=names, rgba=rgba), metadata=dict(offsets=offsets))
+
+
+def colormap_table(N: int = 256, bytes: bool = False) -> LUTTable:
+    """Return the lookup tables of all colormaps of tol_colors.
+
+    Tables are ordered as in matplotlib: the colors, then the *under*, *over* and
+    *bad* colors. Reversed colormaps are included.
+
+    Parameters
+    ----------
+    N
+        Number of colors of continuous colormaps. Discrete colormaps keep their
+        number of colors.
+    bytes
+        If True, tables hold uint8 values in [0, 255] (converted as matplotlib
+        does), otherwise float64 values in [0, 1].
+    """
+    tables = {}
+    for name, cmap in tol_colors.colormaps.items():
+        lut = _build_lut(cmap, N)
+        tables[name] = (lut * 255).astype(np.uint8) if bytes else lut
+    return LUTTable.from_arrays(tables)
+
+
+def colorset_table(bytes: bool = False) -> LUTTable:
+    """Return the colors of all colorsets, as RGBA rows.
+
+    Parameters
+    ----------
+    bytes
+        If True, tables hold uint8 values in [0, 255], otherwise float64 values in
+        [0, 1].
+    """
+    tables = {}
+    for name, cset in tol_colors.colorsets.items():
+        rgba8 = cast(tol_colors._Colorset, cset).rgba8
+        tables[name] = rgba8 if bytes else rgba8 / 255
+    return LUTTable.from_arrays(tables)
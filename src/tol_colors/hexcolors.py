@@ -0,0 +1,148 @@
+"""Convert arrays of hex strings to RGB and back.
+
+Strings are processed as arrays of characters: a whole array is converted with a
+few numpy operations, instead of one call to :func:`matplotlib.colors.to_rgb` per
+color.
+
+>>> hex_to_rgb(["#4477AA", "#EE6677"])
+array([[0.26666667, 0.46666667, 0.66666667],
+       [0.93333333, 0.4       , 0.46666667]])
+>>> rgb_to_hex([[0.0, 0.5, 1.0]])
+array(['#0080FF'], dtype='<U7')
+"""
+
+from collections.abc import Sequence
+
+import numpy as np
+
+_DIGITS = np.frombuffer(b"0123456789ABCDEF", dtype=np.uint8)
+
+_INVALID = 255
+_END = 254
+
+# value of each hex digit from its character code, padding after the end of strings
+# is marked as _END
+_NIBBLES = np.full(256, _INVALID, dtype=np.uint8)
+_NIBBLES[_DIGITS] = np.arange(16)
+_NIBBLES[np.frombuffer(b"abcdef", dtype=np.uint8)] = np.arange(10, 16)
+_NIBBLES[0] = _END
+
+
+def _characters(colors: np.ndarray) -> np.ndarray:
+    """Return character codes of an array of strings, of shape (..., length)."""
+    if colors.dtype.kind not in "US":
+        raise TypeError(f"Expected an array of strings, not {colors.dtype}.")
+    code = np.uint32 if colors.dtype.kind == "U" else np.uint8
+    length = max(colors.dtype.itemsize // np.dtype(code).itemsize, 1)
+    chars = np.ascontiguousarray(colors).view(code).reshape(*colors.shape, length)
+    return chars
+
+
+def _digits(chars: np.ndarray) -> np.ndarray:
+    """Return 8 hex digits as bytes, removing the leading '#' if present."""
+    has_hash = chars[..., 0] == ord("#")
+    if has_hash.all():
+        digits = chars[..., 1:]
+    elif not has_hash.any():
+        digits = chars
+    else:
+        padded = np.pad(chars, [(0, 0)] * (chars.ndim - 1) + [(0, 1)])
+        digits = np.where(has_hash[..., None], padded[..., 1:], padded[..., :-1])
+
+    width = digits.shape[-1]
+    too_long = None
+    if width < 8:  # noqa: PLR2004
+        digits = np.pad(digits, [(0, 0)] * (digits.ndim - 1) + [(0, 8 - width)])
+    elif width > 8:  # noqa: PLR2004
+        too_long = digits[..., 8:].any(axis=-1)
+        digits = digits[..., :8]
+
+    # invalid characters are replaced by DEL
+    out = digits.astype(np.uint8)
+    if digits.dtype != np.uint8:
+        out[digits > 127] = 127  # noqa: PLR2004
+    if too_long is not None:
+        out[too_long, 0] = 127
+    return out
+
+
+def hex_to_rgb(
+    colors: str | Sequence[str] | np.ndarray,
+    alpha: bool = False,
+    bytes: bool = False,
+) -> np.ndarray:
+    """Convert hex strings to RGB(A) colors.
+
+    Parameters
+    ----------
+    colors
+        Array of strings ``#RRGGBB`` or ``#RRGGBBAA``, of any shape. The leading
+        ``#`` is optional, digits are case-insensitive.
+    alpha
+        If True, return the alpha channel as well. It is opaque for colors with
+        6 digits.
+    bytes
+        If True, return uint8 values in [0, 255] instead of floats in [0, 1].
+
+    Returns
+    -------
+    Array of shape ``(*colors.shape, 3)``, or ``(*colors.shape, 4)`` with *alpha*.
+
+    Raises
+    ------
+    ValueError
+        If a string is not a valid hex color.
+    """
+    colors = np.asarray(colors)
+    nibbles = _NIBBLES[_digits(_characters(colors))]
+
+    # 6 digits: the last two are the end of the string, 8 digits: all are valid
+    opaque = (nibbles[..., 6] == _END) & (nibbles[..., 7] == _END)
+    invalid = nibbles[..., :6].max(axis=-1) > 15  # noqa: PLR2004
+    invalid |= ~opaque & (nibbles[..., 6:].max(axis=-1) > 15)  # noqa: PLR2004
+    if invalid.any():
+        example = colors[invalid].flat[0]
+        raise ValueError(f"Invalid hex color '{example!s}'.")
+
+    rgba = nibbles[..., 0::2] << 4 | nibbles[..., 1::2]
+    if alpha:
+        rgba[..., 3][opaque] = 255
+    else:
+        rgba = rgba[..., :3]
+    if bytes:
+        return rgba
+    return rgba / 255
+
+
+def rgb_to_hex(rgb: Sequence | np.ndarray, keep_alpha: bool = False) -> np.ndarray:
+    """Convert RGB(A) colors to hex strings.
+
+    Parameters
+    ----------
+    rgb
+        Array of shape ``(..., 3)`` or ``(..., 4)``. Arrays of uint8 are taken as
+        values in [0, 255], other arrays as values in [0, 1].
+    keep_alpha
+        If True and *rgb* has an alpha channel, return ``#RRGGBBAA`` strings.
+
+    Returns
+    -------
+    Array of strings ``#RRGGBB`` (or ``#RRGGBBAA``), with uppercase digits, of
+    shape ``rgb.shape[:-1]``.
+    """
+    rgb = np.asarray(rgb)
+    if rgb.ndim == 0 or rgb.shape[-1] not in (3, 4):
+        raise ValueError(f"Expected RGB(A) colors, got an array of shape {rgb.shape}.")
+    if not keep_alpha:
+        rgb = rgb[..., :3]
+    if rgb.dtype != np.uint8:
+        if ((rgb < 0) | (rgb > 1)).any():
+            raise ValueError("RGB values must be between 0 and 1.")
+        rgb = np.round(rgb * 255).astype(np.uint8)
+
+    n = rgb.shape[-1]
+    chars = np.empty((*rgb.shape[:-1], 1 + 2 * n), dtype=np.uint32)
+    chars[..., 0] = ord("#")
+    chars[..., 1::2] = _DIGITS[rgb >> 4]
+    chars[..., 2::2] = _DIGITS[rgb & 15]
+    return chars.view(f"U{1 + 2 * n}")[..., 0]
@@ -0,0 +1,134 @@
+"""Write indexed images with tol colors as palette.
+
+Discrete colormaps, :func:`~tol_colors.rainbow_discrete` and colorsets hold few
+colors. Images using them are stored as one index per pixel, packed on as few bits
+as possible, and the colors as a palette table: four times smaller than RGBA before
+compression, and faster to encode.
+
+>>> png_bytes = encode(classes, "land_cover")
+>>> idx, table = quantize(data, "BuRd_discrete", vmin=-1.0, vmax=1.0)
+"""
+
+# ruff: noqa: N803
+
+from collections.abc import Sequence
+from os import PathLike
+
+import numpy as np
+from matplotlib.colors import Colormap, to_rgba_array
+
+import tol_colors
+from tol_colors import png
+from tol_colors.colorize import byte_lut, get_colormap, indices
+
+
+def palette(colors: str | Colormap | Sequence[str]) -> np.ndarray:
+    """Return a palette table of RGBA bytes.
+
+    Parameters
+    ----------
+    colors
+        Name of a colorset (for instance "land_cover"), colormap or colormap name
+        (see :func:`.colorize.get_colormap`), or sequence of colors. Continuous
+        colormaps are sampled on their *N* colors.
+
+    Returns
+    -------
+    Array of uint8 of shape ``(n, 4)``.
+    """
+    if isinstance(colors, str):
+        try:
+            colors = tol_colors.colorsets[colors]
+        except KeyError:
+            pass
+    if isinstance(colors, str | Colormap):
+        cmap = get_colormap(colors)
+        return cmap(np.arange(cmap.N), bytes=True)
+    return np.round(to_rgba_array(colors) * 255).astype(np.uint8)
+
+
+def _classes(classes: np.ndarray, table: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    """Check class indices, masked values are given a transparent color."""
+    mask = np.ma.getmaskarray(classes)
+    data = np.ma.getdata(classes)
+    n = table.shape[0]
+    valid = data[~mask]
+    if valid.dtype.kind not in "biu" and not np.equal(valid, np.round(valid)).all():
+        raise ValueError("Class indices must be integers.")
+    if valid.size and ((valid < 0).any() or (valid >= n).any()):
+        raise ValueError(f"Class indices must be between 0 and {n - 1}.")
+    if mask.any() and n >= 256:  # noqa: PLR2004
+        raise ValueError(f"At most 255 colors with masked values, got {n}.")
+    idx = data.astype(np.uint8)
+    if mask.any():
+        idx[mask] = n
+        table = np.concatenate([table, np.zeros((1, 4), dtype=np.uint8)])
+    return idx, table
+
+
+def encode(
+    classes: np.ndarray,
+    colors: str | Colormap | Sequence[str],
+    compress_level: int = 6,
+) -> bytes:
+    """Encode a classified image as indexed PNG.
+
+    Parameters
+    ----------
+    classes
+        2D array of integers, index of the color of each pixel. Masked values are
+        transparent.
+    colors
+        Palette, see :func:`palette`. At most 256 colors (255 if there are masked
+        values).
+    compress_level
+        Compression level of zlib, from 0 (no compression) to 9 (slowest).
+    """
+    idx, table = _classes(classes, palette(colors))
+    return png.encode_indexed(idx, table, compress_level)
+
+
+def quantize(
+    data: np.ndarray,
+    cmap: str | Colormap,
+    vmin: float,
+    vmax: float,
+) -> tuple[np.ndarray, np.ndarray]:
+    """Map data to indices in the palette of a discrete colormap.
+
+    This is the raw indexed output: ``table[idx]`` gives the same bytes as
+    :func:`.colorize.colorize`.
+
+    Parameters
+    ----------
+    data
+        Array of values. NaN and masked values are given the *bad* color.
+    cmap
+        Colormap or colormap name, see :func:`.colorize.get_colormap`. At most 253
+        colors.
+    vmin, vmax
+        Values mapped to the first and last colors.
+
+    Returns
+    -------
+    idx
+        Array of uint8 of the shape of *data*.
+    table
+        Palette of RGBA bytes, ordered as in :func:`.colorize.byte_lut`.
+    """
+    table = byte_lut(cmap, None)
+    n = table.shape[0] - 3
+    if table.shape[0] > 256:  # noqa: PLR2004
+        raise ValueError(f"Indexed output requires at most 253 colors (got {n}).")
+    return indices(data, vmin, vmax, n, dtype=np.uint8), table
+
+
+def save(
+    fname: str | PathLike,
+    classes: np.ndarray,
+    colors: str | Colormap | Sequence[str],
+    compress_level: int = 6,
+):
+    """Write a classified image to an indexed PNG file, see :func:`encode`."""
+    with open(fname, "wb") as f:
+        f.write(encode(classes, colors, compress_level))
@@ -0,0 +1,153 @@
+"""Count calls and time spent in tol_colors.
+
+Instrumentation is disabled by default, and costs a single flag check per
+instrumented call. Enable it with :func:`enable`, or by setting the environment
+variable ``TOL_COLORS_INSTRUMENT=1`` before importing tol_colors (this is needed to
+record the module initialization)::
+
+    from tol_colors import instrumentation
+
+    instrumentation.enable()
+    ...
+    instrumentation.snapshot()
+    # {'colormaps.getitem': {'count': 120, 'time': 0.0041}, ...}
+
+Recorded events are:
+
+- ``module_init``: import of tol_colors, and ``module_init.<phase>`` for each of
+  its phases (loading data, building colormaps, registering them, ...),
+- ``colormaps.getitem``: copies returned by ``tol_colors.colormaps[name]``,
+- ``rainbow_discrete``: builds of :func:`~tol_colors.rainbow_discrete`,
+- ``lut.preload``, ``lut.bytes``, ``lut.interp``: lookup tables built by
+  :func:`~tol_colors.preload`, :func:`.colorize.byte_lut` (on cache misses), and
+  :func:`.interp.interpolate`,
+- ``colorize``, ``colorize_many``: calls of :func:`.colorize.colorize` and
+  :func:`.colorize.colorize_many`.
+"""
+
+import functools
+import logging
+import os
+import threading
+import time
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from typing import TypeVar
+
+ENV_VAR = "TOL_COLORS_INSTRUMENT"
+
+log = logging.getLogger(__name__)
+
+_enabled = os.environ.get(ENV_VAR, "") not in ("", "0")
+_lock = threading.Lock()
+_stats: dict[str, list[float]] = {}
+
+F = TypeVar("F", bound=Callable)
+
+
+def enable():
+    """Start recording."""
+    global _enabled  # noqa: PLW0603
+    _enabled = True
+
+
+def disable():
+    """Stop recording. Recorded values are kept."""
+    global _enabled  # noqa: PLW0603
+    _enabled = False
+
+
+def is_enabled() -> bool:
+    """Return True if recording."""
+    return _enabled
+
+
+def reset():
+    """Clear recorded values."""
+    with _lock:
+        _stats.clear()
+
+
+def record(name: str, seconds: float):
+    """Record a call of *name* that took *seconds*, if enabled."""
+    if not _enabled:
+        return
+    with _lock:
+        stat = _stats.setdefault(name, [0, 0.0])
+        stat[0] += 1
+        stat[1] += seconds
+
+
+@contextmanager
+def timer(name: str) -> Iterator[None]:
+    """Record the execution of a block of code."""
+    if not _enabled:
+        yield
+        return
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        record(name, time.perf_counter() - start)
+
+
+def timed(name: str) -> Callable[[F], F]:
+    """Decorate a function to record its calls."""
+
+    def decorator(func: F) -> F:
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            if not _enabled:
+                return func(*args, **kwargs)
+            start = time.perf_counter()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                record(name, time.perf_counter() - start)
+
+        return wrapper  # type: ignore[return-value]
+
+    return decorator
+
+
+def snapshot() -> dict[str, dict[str, float]]:
+    """Return the number of calls and cumulative time (in seconds) of each event."""
+    with _lock:
+        return {
+            name: dict(count=count, time=seconds)
+            for name, (count, seconds) in sorted(_stats.items())
+        }
+
+
+def log_snapshot(level: int = logging.INFO):
+    """Log recorded values."""
+    for name, stat in snapshot().items():
+        log.log(
+            level,
+            "%s: %d calls, %.3f ms",
+            name,
+            stat["count"],
+            stat["time"] * 1e3,
+        )
+
+
+def prometheus(prefix: str = "tol_colors") -> str:
+    """Return recorded values in the Prometheus text exposition format."""
+    stats = snapshot()
+    lines = [
+        f"# HELP {prefix}_calls_total Number of calls.",
+        f"# TYPE {prefix}_calls_total counter",
+    ]
+    lines += [
+        f'{prefix}_calls_total{{event="{name}"}} {stat["count"]}'
+        for name, stat in stats.items()
+    ]
+    lines += [
+        f"# HELP {prefix}_seconds_total Time spent, in seconds.",
+        f"# TYPE {prefix}_seconds_total counter",
+    ]
+    lines += [
+        f'{prefix}_seconds_total{{event="{name}"}} {stat["time"]!r}'
+        for name, stat in stats.items()
+    ]
+    return "\n".join(lines) + "\n"
@@ -0,0 +1,381 @@
+"""Interpolate colormap nodes into lookup tables.
+
+Matplotlib builds linear colormaps with
+:meth:`~matplotlib.colors.LinearSegmentedColormap.from_list`, which creates segment
+data for each channel and evaluates them separately. Here the nodes are interpolated
+for all channels in a single vectorized operation, optionally in another color
+space than sRGB: linear-light RGB, or the perceptually uniform spaces OKLab and
+CAM02-UCS.
+
+>>> lut = interpolate("sunset", N=1024, space="cam02ucs")
+>>> cmap = from_list("sunset_linear", nodes("sunset")[0], space="linear")
+"""
+
+# ruff: noqa: N803, N806
+
+import functools
+from collections.abc import Callable, Sequence
+
+import numpy as np
+from matplotlib.colors import ListedColormap, to_rgba_array
+
+import tol_colors
+from tol_colors import instrumentation
+
+
+def nodes(name: str) -> tuple[list[str], str]:
+    """Return the nodes of a linear colormap, as defined in the color data.
+
+    Parameters
+    ----------
+    name
+        Name of a linear colormap (not a discrete one). It can end with "_r".
+
+    Returns
+    -------
+    colors
+        List of hex colors of the nodes, regularly spaced between 0 and 1.
+    bad
+        Color for invalid values.
+    """
+    if name.endswith("_r"):
+        colors, bad = nodes(name[:-2])
+        return colors[::-1], bad
+
+    data = tol_colors._colors
+    if name in data["colormaps"]:
+        return data["colormaps"][name]["colors"], data["colormaps"][name]["bad"]
+
+    rainbow = data["rainbow_linear"]
+    colors = rainbow["colors"]
+    pu, rd = rainbow["Pu_index"], rainbow["Rd_index"]
+    rainbows = dict(
+        rainbow=(colors, rainbow["bad_Wh"]),
+        rainbow_WhBr=(colors, rainbow["bad_Wh"]),
+        rainbow_WhRd=(colors[:rd], rainbow["bad_Wh"]),
+        rainbow_PuBr=(colors[pu:], rainbow["bad_Pu"]),
+        rainbow_PuRd=(colors[pu:rd], rainbow["bad_Pu"]),
+    )
+    if name not in rainbows:
+        raise KeyError(f"No linear colormap named '{name}'.")
+    return rainbows[name]
+
+
+def srgb_to_linear(rgb: np.ndarray) -> np.ndarray:
+    """Convert sRGB values in [0, 1] to linear-light RGB."""
+    rgb = np.asarray(rgb, dtype=float)
+    return np.where(
+        rgb <= 0.04045,  # noqa: PLR2004
+        rgb / 12.92,
+        ((rgb + 0.055) / 1.055) ** 2.4,
+    )
+
+
+def linear_to_srgb(rgb: np.ndarray) -> np.ndarray:
+    """Convert linear-light RGB values in [0, 1] to sRGB."""
+    rgb = np.clip(rgb, 0, 1)
+    return np.where(
+        rgb <= 0.0031308,  # noqa: PLR2004
+        rgb * 12.92,
+        1.055 * rgb ** (1 / 2.4) - 0.055,
+    )
+
+
+# matrix specified in IEC 61966-2-1:1999
+_XYZ_TO_SRGB = np.array(
+    [
+        [3.2406, -1.5372, -0.4986],
+        [-0.9689, 1.8758, 0.0415],
+        [0.0557, -0.2040, 1.0570],
+    ]
+)
+_SRGB_TO_XYZ = np.linalg.inv(_XYZ_TO_SRGB)
+
+_OKLAB_M1 = np.array(
+    [
+        [0.4122214708, 0.5363325363, 0.0514459929],
+        [0.2119034982, 0.6806995451, 0.1073969566],
+        [0.0883024619, 0.2817188376, 0.6299787005],
+    ]
+)
+_OKLAB_M2 = np.array(
+    [
+        [0.2104542553, 0.7936177850, -0.0040720468],
+        [1.9779984951, -2.4285922050, 0.4505937099],
+        [0.0259040371, 0.7827717662, -0.8086757660],
+    ]
+)
+
+
+def srgb_to_oklab(rgb: np.ndarray) -> np.ndarray:
+    """Convert sRGB values in [0, 1] to OKLab."""
+    lms = srgb_to_linear(rgb) @ _OKLAB_M1.T
+    return np.cbrt(lms) @ _OKLAB_M2.T
+
+
+def oklab_to_srgb(lab: np.ndarray) -> np.ndarray:
+    """Convert OKLab values to sRGB, clipped to [0, 1]."""
+    lms = (np.asarray(lab) @ np.linalg.inv(_OKLAB_M2).T) ** 3
+    return linear_to_srgb(lms @ np.linalg.inv(_OKLAB_M1).T)
+
+
+class _CAM02:
+    """CIECAM02 model, for sRGB viewing conditions.
+
+    Parameters follow the defaults of colorspacious: D65 white point, adapting
+    luminance of 64/pi/5 cd/m2, background relative luminance of 20, average
+    surround.
+    """
+
+    M_CAT02 = np.array(
+        [[0.7328, 0.4296, -0.1624], [-0.7036, 1.6975, 0.0061], [0.0030, 0.0136, 0.9834]]
+    )
+    M_HPE = np.array(
+        [
+            [0.38971, 0.68898, -0.07868],
+            [-0.22981, 1.18340, 0.04641],
+            [0.00000, 0.00000, 1.00000],
+        ]
+    )
+    # UCS coefficients
+    c1 = 0.007
+    c2 = 0.0228
+
+    def __init__(self, xyz_w=(95.047, 100.0, 108.883), L_A=64 / np.pi / 5, Y_b=20.0):
+        F, self.c, self.N_c = 1.0, 0.69, 1.0
+        xyz_w = np.asarray(xyz_w)
+        self.D = np.clip(F * (1 - (1 / 3.6) * np.exp((-L_A - 42) / 92)), 0, 1)
+        k = 1 / (5 * L_A + 1)
+        self.F_L = 0.2 * k**4 * 5 * L_A + 0.1 * (1 - k**4) ** 2 * np.cbrt(5 * L_A)
+        self.n = Y_b / xyz_w[1]
+        self.z = 1.48 + np.sqrt(self.n)
+        self.N_bb = 0.725 * (1 / self.n) ** 0.2
+        rgb_w = self.M_CAT02 @ xyz_w
+        self.D_RGB = self.D * xyz_w[1] / rgb_w + 1 - self.D
+        # from XYZ to adapted HPE space, and back
+        self.M_fwd = (
+            self.M_HPE
+            @ np.linalg.inv(self.M_CAT02)
+            @ (np.diag(self.D_RGB) @ self.M_CAT02)
+        )
+        self.M_bwd = np.linalg.inv(self.M_fwd)
+        self.A_w = self._achromatic(self._compress(self.M_fwd @ xyz_w))
+        self.t_coef = 50000 / 13 * self.N_c * self.N_bb
+        self.C_coef = (1.64 - 0.29**self.n) ** 0.73
+
+    def _compress(self, rgb: np.ndarray) -> np.ndarray:
+        x = (self.F_L * np.abs(rgb) / 100) ** 0.42
+        return np.sign(rgb) * 400 * x / (x + 27.13) + 0.1
+
+    def _expand(self, rgb_a: np.ndarray) -> np.ndarray:
+        x = rgb_a - 0.1
+        ax = np.minimum(np.abs(x), 399.999)
+        return np.sign(x) * 100 / self.F_L * (27.13 * ax / (400 - ax)) ** (1 / 0.42)
+
+    def _achromatic(self, rgb_a: np.ndarray) -> np.ndarray:
+        r, g, b = rgb_a[..., 0], rgb_a[..., 1], rgb_a[..., 2]
+        return (2 * r + g + b / 20 - 0.305) * self.N_bb
+
+    def from_srgb(self, rgb: np.ndarray) -> np.ndarray:
+        xyz = 100 * srgb_to_linear(rgb) @ _SRGB_TO_XYZ.T
+        rgb_a = self._compress(xyz @ self.M_fwd.T)
+        r, g, b = rgb_a[..., 0], rgb_a[..., 1], rgb_a[..., 2]
+        a = r - 12 * g / 11 + b / 11
+        b_ = (r + g - 2 * b) / 9
+        h = np.arctan2(b_, a)
+        e_t = (np.cos(h + 2) + 3.8) / 4
+        J = 100 * np.maximum(self._achromatic(rgb_a) / self.A_w, 0) ** (self.c * self.z)
+        t = self.t_coef * e_t * np.hypot(a, b_) / (r + g + 21 / 20 * b)
+        M = t**0.9 * np.sqrt(J / 100) * self.C_coef * self.F_L**0.25
+        # to UCS
+        J_ = (1 + 100 * self.c1) * J / (1 + self.c1 * J)
+        M_ = np.log1p(self.c2 * M) / self.c2
+        return np.stack([J_, M_ * np.cos(h), M_ * np.sin(h)], axis=-1)
+
+    def to_srgb(self, jab: np.ndarray) -> np.ndarray:
+        jab = np.asarray(jab)
+        J_, a_, b_ = jab[..., 0], jab[..., 1], jab[..., 2]
+        J = J_ / (1 + 100 * self.c1 - self.c1 * J_)
+        M = np.expm1(self.c2 * np.hypot(a_, b_)) / self.c2
+        h = np.arctan2(b_, a_)
+        C = M / self.F_L**0.25
+        with np.errstate(divide="ignore", invalid="ignore"):
+            t = (C / (np.sqrt(J / 100) * self.C_coef)) ** (1 / 0.9)
+            t = np.nan_to_num(t)
+        e_t = (np.cos(h + 2) + 3.8) / 4
+        A = self.A_w * (np.maximum(J, 0) / 100) ** (1 / (self.c * self.z))
+        p2 = A / self.N_bb + 0.305
+        p3 = 21 / 20
+        cos, sin = np.cos(h), np.sin(h)
+        # solve for a and b given t (equivalent to the two cases of the standard)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            gamma = t / (self.t_coef * e_t)
+            denom = 1 + gamma * (
+                (2 + p3) * 220 / 1403 * cos - (27 / 1403 - p3 * 6300 / 1403) * sin
+            )
+            m = gamma * p2 * (2 + p3) * 460 / 1403 / denom
+        m = np.where(t > 0, m, 0)
+        a, b = m * cos, m * sin
+        rgb_a = np.stack(
+            [
+                (460 * p2 + 451 * a + 288 * b) / 1403,
+                (460 * p2 - 891 * a - 261 * b) / 1403,
+                (460 * p2 - 220 * a - 6300 * b) / 1403,
+            ],
+            axis=-1,
+        )
+        xyz = self._expand(rgb_a) @ self.M_bwd.T
+        return linear_to_srgb(xyz / 100 @ _XYZ_TO_SRGB.T)
+
+
+_cam02 = _CAM02()
+
+
+def srgb_to_cam02ucs(rgb: np.ndarray) -> np.ndarray:
+    """Convert sRGB values in [0, 1] to CAM02-UCS."""
+    return _cam02.from_srgb(rgb)
+
+
+def cam02ucs_to_srgb(jab: np.ndarray) -> np.ndarray:
+    """Convert CAM02-UCS values to sRGB, clipped to [0, 1]."""
+    return _cam02.to_srgb(jab)
+
+
+def _identity(rgb: np.ndarray) -> np.ndarray:
+    return rgb
+
+
+SPACES: dict[str, tuple[Callable, Callable]] = dict(
+    srgb=(_identity, _identity),
+    linear=(srgb_to_linear, linear_to_srgb),
+    oklab=(srgb_to_oklab, oklab_to_srgb),
+    cam02ucs=(srgb_to_cam02ucs, cam02ucs_to_srgb),
+)
+"""Color spaces available for interpolation.
+
+Each entry is a pair of functions converting sRGB values (array of shape ``(..., 3)``)
+to the space, and back.
+"""
+
+
+@instrumentation.timed("lut.interp")
+def interpolate(
+    colors: str | Sequence[str] | np.ndarray, N: int = 256, space: str = "srgb"
+) -> np.ndarray:
+    """Interpolate nodes into a lookup table.
+
+    Parameters
+    ----------
+    colors
+        Colors of the nodes, regularly spaced between 0 and 1. Either a sequence of
+        matplotlib colors, an array of shape ``(n, 3)`` or ``(n, 4)``, or the name of
+        a linear colormap of this package.
+    N
+        Number of colors in the lookup table.
+    space
+        Color space in which to interpolate, see :data:`SPACES`. Default is "srgb",
+        as matplotlib does.
+
+    Returns
+    -------
+    Array of RGBA values of shape ``(N, 4)``.
+    """
+    if isinstance(colors, str):
+        colors = nodes(colors)[0]
+    if space not in SPACES:
+        raise ValueError(f"Unknown space '{space}', available are {list(SPACES)}.")
+    to_space, from_space = SPACES[space]
+
+    rgba = to_rgba_array(colors)
+    values = np.empty_like(rgba)
+    values[:, :3] = to_space(rgba[:, :3])
+    values[:, 3] = rgba[:, 3]
+
+    n = values.shape[0]
+    if n == 1:
+        return np.repeat(rgba, N, axis=0)
+
+    # position of each output color between nodes
+    x = np.linspace(0, n - 1, N)
+    idx = np.minimum(x.astype(int), n - 2)
+    frac = (x - idx)[:, None]
+    out = values[idx]
+    out += frac * np.diff(values, axis=0)[idx]
+
+    out[:, :3] = from_space(out[:, :3])
+    return np.clip(out, 0, 1, out=out)
+
+
+@functools.lru_cache(maxsize=256)
+def _cached_lut(name: str, N: int, space: str) -> np.ndarray:
+    lut = interpolate(name, N, space)
+    lut.flags.writeable = False
+    return lut
+
+
+def lut(name: str, N: int = 256, space: str = "srgb") -> np.ndarray:
+    """Return the lookup table of a linear colormap of this package.
+
+    Tables are cached for each combination of parameters, and are read-only.
+
+    Parameters
+    ----------
+    name
+        Name of a linear colormap. It can end with "_r".
+    N
+        Number of colors in the lookup table.
+    space
+        Color space in which to interpolate, see :data:`SPACES`.
+
+    Returns
+    -------
+    Array of RGBA values of shape ``(N, 4)``.
+    """
+    return _cached_lut(name, N, space)
+
+
+def from_list(
+    name: str,
+    colors: Sequence[str] | np.ndarray,
+    N: int = 256,
+    space: str = "srgb",
+    bad: str | None = None,
+) -> ListedColormap:
+    """Create a colormap by interpolating nodes.
+
+    Parameters
+    ----------
+    name
+        Name of the colormap.
+    colors
+        Colors of the nodes, see :func:`interpolate`.
+    N
+        Number of colors of the colormap.
+    space
+        Color space in which to interpolate, see :data:`SPACES`.
+    bad
+        Color for invalid values.
+    """
+    cmap = ListedColormap(interpolate(colors, N, space), name=name)
+    if bad is not None:
+        cmap.set_bad(bad)
+    return cmap
+
+
+def colormap(name: str, N: int = 256, space: str = "srgb") -> ListedColormap:
+    """Create one of the linear colormaps of this package by interpolating its nodes.
+
+    The lookup table is cached, see :func:`lut`.
+
+    Parameters
+    ----------
+    name
+        Name of a linear colormap. It can end with "_r".
+    N
+        Number of colors of the colormap.
+    space
+        Color space in which to interpolate, see :data:`SPACES`.
+    """
+    cmap = ListedColormap(lut(name, N, space), name=name)
+    cmap.set_bad(nodes(name)[1])
+    return cmap
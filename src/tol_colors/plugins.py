@@ -0,0 +1,328 @@
+"""Palettes shipped by other packages.
+
+Packages provide bundles of colorsets and colormaps with an entry point in the
+``tol_colors.palettes`` group. The entry point names either a JSON file in a
+package, or an object (a mapping, or a callable returning one)::
+
+    [project.entry-points."tol_colors.palettes"]
+    corporate = "corporate_palettes:palettes.json"
+    generated = "corporate_palettes.generate:bundle"
+
+Bundles follow the format of the file bundled with tol_colors::
+
+    {
+        "colorsets": {"corporate": {"primary": "#003366", "secondary": "#FF9900"}},
+        "colormaps": {
+            "ocean": {"colors": ["#E0F3F8", "#003366"], "bad": "#FFFFFF"},
+            "steps": {"colors": ["#003366", "#FF9900", "#DDDDDD"], "discrete": true}
+        }
+    }
+
+Colormaps are linear, and also discrete (``<name>_discrete``) if "discrete" is
+true. Reversed colormaps are added as ``<name>_r``.
+
+Entry points are listed without importing anything. A bundle is loaded the first
+time one of its names is missing from :data:`tol_colors.colorsets` or
+:data:`tol_colors.colormaps`, or with :func:`load`. Its colorsets and colormaps are
+then added to these mappings, and its colormaps are registered in matplotlib.
+Names already taken are skipped with a warning. Note that any missing name, a typo
+included, imports all the bundles that are not loaded yet, and that membership
+tests (``name in tol_colors.colormaps``) do not load anything: look names up with
+``tol_colors.colormaps[name]`` or :func:`.colorize.get_colormap` instead.
+
+Bundles read from files are compiled (colors parsed, lookup tables built) and cached
+on disk, in a file named after the hash of their content. Later processes load the
+compiled bundle instead of parsing it again. The cache directory is
+``$XDG_CACHE_HOME/tol_colors`` (``~/.cache/tol_colors`` by default, so loading a
+bundle writes to the home directory), or the value of the environment variable
+``TOL_COLORS_CACHE_DIR``. Set it to "0" to disable the cache.
+"""
+
+import functools
+import hashlib
+import json
+import logging
+import os
+import tempfile
+import threading
+import warnings
+from collections.abc import Callable, Mapping
+from importlib import metadata, resources
+from pathlib import Path
+from typing import Any, cast
+
+import matplotlib
+import numpy as np
+from matplotlib.colors import (
+    Colormap,
+    LinearSegmentedColormap,
+    ListedColormap,
+    to_rgba_array,
+)
+
+import tol_colors
+from tol_colors.registry import ColorsetRegistry
+
+GROUP = "tol_colors.palettes"
+"""Entry point group of palette bundles."""
+
+CACHE_ENV_VAR = "TOL_COLORS_CACHE_DIR"
+"""Environment variable holding the directory of compiled bundles."""
+
+_CACHE_VERSION = b"1"
+
+_Cmap = LinearSegmentedColormap | ListedColormap
+
+log = logging.getLogger(__name__)
+
+_lock = threading.RLock()
+_loaded: dict[str, "Bundle"] = {}
+
+
+def cache_dir() -> Path | None:
+    """Return the directory of compiled bundles, or None if disabled."""
+    path = os.environ.get(CACHE_ENV_VAR, "")
+    if path == "0":
+        return None
+    if not path:
+        base = os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache"
+        path = os.path.join(base, "tol_colors")
+    return Path(path)
+
+
+@functools.cache
+def index() -> dict[str, metadata.EntryPoint]:
+    """Return the entry points of available bundles, by name.
+
+    Nothing is imported. The index is built once, call ``index.cache_clear()`` to
+    find newly installed bundles.
+    """
+    return {ep.name: ep for ep in metadata.entry_points(group=GROUP)}
+
+
+class Bundle:
+    """Colorsets and colormaps of a bundle.
+
+    Attributes
+    ----------
+    colorsets
+        Registry of the colorsets.
+    colormaps
+        Colormaps, including discrete and reversed ones, by name.
+    """
+
+    def __init__(self, colorsets: ColorsetRegistry, colormaps: dict[str, _Cmap]):
+        self.colorsets = colorsets
+        self.colormaps = colormaps
+
+    @classmethod
+    def from_compiled(cls, compiled: Mapping[str, Any]) -> "Bundle":
+        """Create a bundle from the output of :func:`compile_bundle`."""
+        meta = json.loads(str(compiled["meta"]))
+        colormaps: dict[str, _Cmap] = {}
+        start = row = 0
+        for name, (kind, bad, n_colors, n_lut) in meta["colormaps"].items():
+            colors = compiled["colors"][start : start + n_colors]
+            lut = compiled["luts"][row : row + n_lut + 3]
+            start += n_colors
+            row += n_lut + 3
+            # bundles have no under and over colors: the reverse is built from the
+            # reversed colors, which is faster than Colormap.reversed
+            cmap = _make_cmap(name, kind, colors, bad)
+            reverse = _make_cmap(f"{name}_r", kind, colors[::-1], bad)
+            _set_lut(cmap, reverse, lut)
+            colormaps[name] = cmap
+            colormaps[f"{name}_r"] = reverse
+        return cls(ColorsetRegistry(meta["colorsets"]), colormaps)
+
+
+def _make_cmap(name: str, kind: str, colors: np.ndarray, bad: str) -> _Cmap:
+    cmap: _Cmap
+    if kind == "discrete":
+        cmap = ListedColormap(colors, name=name)
+    else:
+        cmap = LinearSegmentedColormap.from_list(name, colors)
+    return cast(_Cmap, cmap.with_extremes(bad=bad))
+
+
+def _set_lut(cmap: Colormap, reverse: Colormap, lut: np.ndarray):
+    """Give a precomputed lookup table to a colormap and its reverse."""
+    n = cmap.N
+    if lut.shape != (n + 3, 4):
+        return
+    cmap._lut = lut  # type: ignore[attr-defined]
+    cmap._isinit = True  # type: ignore[attr-defined]
+    # the under and over colors are swapped in the reverse
+    reverse_lut = np.concatenate([lut[n - 1 :: -1], lut[[n + 1, n, n + 2]]])
+    reverse._lut = reverse_lut  # type: ignore[attr-defined]
+    reverse._isinit = True  # type: ignore[attr-defined]
+
+
+def compile_bundle(data: Mapping[str, Any]) -> dict[str, np.ndarray]:
+    """Parse the colors of a bundle and build the lookup tables of its colormaps.
+
+    Returns
+    -------
+    Arrays, as stored in the disk cache: "colors" and "luts" hold the RGBA colors
+    and lookup tables of all colormaps, one after the other; "meta" holds the
+    colorsets, and the kind, *bad* color, number of colors and *N* of each colormap
+    as JSON.
+    """
+    colorsets = dict(data.get("colorsets", {}))
+    ColorsetRegistry(colorsets)  # validate names
+    specs: dict[str, tuple[str, str, int, int]] = {}
+    colors_list: list[np.ndarray] = [np.empty((0, 4))]
+    luts: list[np.ndarray] = [np.empty((0, 4))]
+    for name, spec in data.get("colormaps", {}).items():
+        if not isinstance(spec, Mapping):
+            spec = dict(colors=spec)  # noqa: PLW2901
+        bad = spec.get("bad", "#FFFFFF")
+        colors = to_rgba_array(spec["colors"])
+        variants = [(name, "linear")]
+        if spec.get("discrete", False):
+            variants.append((f"{name}_discrete", "discrete"))
+        for cname, kind in variants:
+            cmap = _make_cmap(cname, kind, colors, bad)
+            cmap._init()  # type: ignore[union-attr]
+            specs[cname] = (kind, bad, len(colors), cmap.N)
+            colors_list.append(colors)
+            luts.append(cmap._lut)  # type: ignore[union-attr]
+    meta = dict(colorsets=colorsets, colormaps=specs)
+    return dict(
+        meta=np.array(json.dumps(meta)),
+        colors=np.concatenate(colors_list),
+        luts=np.concatenate(luts),
+    )
+
+
+def _read_compiled(content: bytes) -> dict[str, np.ndarray]:
+    """Compile a JSON bundle, or read it from the disk cache."""
+    directory = cache_dir()
+    if directory is None:
+        return compile_bundle(json.loads(content))
+
+    digest = hashlib.sha256(_CACHE_VERSION + content).hexdigest()
+    fname = directory / f"{digest}.npz"
+    try:
+        with np.load(fname, allow_pickle=False) as npz:
+            return dict(npz)
+    except FileNotFoundError:
+        pass
+    except (OSError, ValueError) as err:
+        log.warning("Ignoring invalid cache file %s: %s", fname, err)
+
+    compiled = compile_bundle(json.loads(content))
+    try:
+        directory.mkdir(parents=True, exist_ok=True)
+        fd, tmp = tempfile.mkstemp(dir=directory, prefix=".bundle.", suffix=".npz")
+        try:
+            with os.fdopen(fd, "wb") as fp:
+                np.savez(fp, **compiled)  # type: ignore[arg-type]
+            os.replace(tmp, fname)
+        except BaseException:
+            os.unlink(tmp)
+            raise
+    except OSError as err:
+        log.warning("Could not write cache file %s: %s", fname, err)
+    return compiled
+
+
+def _read_entry_point(ep: metadata.EntryPoint) -> Bundle:
+    if ep.attr is not None and ep.attr.endswith(".json"):
+        content = resources.files(ep.module).joinpath(ep.attr).read_bytes()
+        return Bundle.from_compiled(_read_compiled(content))
+    obj: Mapping[str, Any] | Callable[[], Mapping[str, Any]] = ep.load()
+    data = obj() if callable(obj) else obj
+    return Bundle.from_compiled(compile_bundle(data))
+
+
+def _install(name: str, bundle: Bundle):
+    """Add the content of a bundle to the mappings of tol_colors."""
+    colorsets = tol_colors.colorsets
+    colormaps = tol_colors.colormaps
+    for cname in bundle.colorsets:
+        if cname in colorsets:
+            warnings.warn(
+                f"Colorset '{cname}' of bundle '{name}' already exists.", stacklevel=3
+            )
+            continue
+        colorsets[cname] = bundle.colorsets[cname]
+    for cname, cmap in bundle.colormaps.items():
+        if cname in colormaps:
+            warnings.warn(
+                f"Colormap '{cname}' of bundle '{name}' already exists.", stacklevel=3
+            )
+            continue
+        colormaps[cname] = cmap
+        mpl_name = f"tol.{cname}"
+        if mpl_name not in matplotlib.colormaps:
+            matplotlib.colormaps.register(cmap, name=mpl_name)
+
+
+def load(name: str) -> Bundle:
+    """Load a bundle, if not already loaded, and return it.
+
+    Its colorsets and colormaps are added to :data:`tol_colors.colorsets` and
+    :data:`tol_colors.colormaps`.
+
+    Raises
+    ------
+    KeyError
+        If there is no bundle of this name.
+    """
+    with _lock:
+        if name not in _loaded:
+            bundle = _read_entry_point(index()[name])
+            _install(name, bundle)
+            _loaded[name] = bundle
+        return _loaded[name]
+
+
+def unload(name: str):
+    """Remove the colorsets and colormaps of a loaded bundle from tol_colors."""
+    with _lock:
+        bundle = _loaded.pop(name)
+        for cname, cset in bundle.colorsets.items():
+            if tol_colors.colorsets.get(cname) is cset:
+                del tol_colors.colorsets[cname]
+        for cname, cmap in bundle.colormaps.items():
+            if dict.get(tol_colors.colormaps, cname) is cmap:
+                del tol_colors.colormaps[cname]
+                if f"tol.{cname}" in matplotlib.colormaps:
+                    matplotlib.colormaps.unregister(f"tol.{cname}")
+
+
+def load_all() -> dict[str, Bundle]:
+    """Load all available bundles. Bundles that fail to load are logged."""
+    for name in index():
+        try:
+            load(name)
+        except Exception:
+            log.exception("Could not load palette bundle '%s'", name)
+    return dict(_loaded)
+
+
+def find(mapping: dict[str, Any], key: str) -> Any:
+    """Load bundles until *key* is in *mapping*, and return its value.
+
+    This is used when a name is missing from :data:`tol_colors.colorsets` or
+    :data:`tol_colors.colormaps`.
+
+    Raises
+    ------
+    KeyError
+        If no bundle defines *key*.
+    """
+    with _lock:
+        for name in index():
+            if key in mapping:
+                break
+            if name in _loaded:
+                continue
+            try:
+                load(name)
+            except Exception:
+                log.exception("Could not load palette bundle '%s'", name)
+        if key not in mapping:
+            raise KeyError(key)
+        return dict.__getitem__(mapping, key)
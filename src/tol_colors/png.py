@@ -0,0 +1,134 @@
+"""Minimal PNG encoder.
+
+Only what is needed to write colorized arrays is supported: 8-bit RGB or RGBA
+images, and indexed images with a palette. Indexed images with few colors are packed
+with 1, 2, or 4 bits per pixel. Compression is done by :mod:`zlib`, which
+releases the GIL, so that images can be encoded concurrently in threads.
+"""
+
+import struct
+import zlib
+
+import numpy as np
+
+_SIGNATURE = b"\x89PNG\r\n\x1a\n"
+
+# color types
+_RGB = 2
+_INDEXED = 3
+_RGBA = 6
+
+
+def _chunk(kind: bytes, data: bytes) -> bytes:
+    return (
+        struct.pack(">I", len(data))
+        + kind
+        + data
+        + struct.pack(">I", zlib.crc32(data, zlib.crc32(kind)))
+    )
+
+
+def _encode(
+    rows: np.ndarray,
+    width: int,
+    color_type: int,
+    bit_depth: int,
+    compress_level: int,
+    *chunks: bytes,
+) -> bytes:
+    """Encode image rows of bytes, each row is prefixed with a null filter byte."""
+    height = rows.shape[0]
+    if height == 0 or width == 0:
+        raise ValueError("PNG images must have a non-zero width and height.")
+    raw = np.zeros((height, 1 + rows[0].nbytes), dtype=np.uint8)
+    raw[:, 1:] = rows.reshape(height, -1)
+    header = struct.pack(">IIBBBBB", width, height, bit_depth, color_type, 0, 0, 0)
+    return b"".join(
+        [
+            _SIGNATURE,
+            _chunk(b"IHDR", header),
+            *chunks,
+            _chunk(b"IDAT", zlib.compress(raw.tobytes(), compress_level)),
+            _chunk(b"IEND", b""),
+        ]
+    )
+
+
+def encode(image: np.ndarray, compress_level: int = 6) -> bytes:
+    """Encode an image as PNG.
+
+    Parameters
+    ----------
+    image
+        Array of uint8 of shape ``(height, width, 3)`` for RGB or
+        ``(height, width, 4)`` for RGBA.
+    compress_level
+        Compression level of zlib, from 0 (no compression) to 9 (slowest).
+    """
+    image = np.asarray(image)
+    if image.dtype != np.uint8 or image.ndim != 3 or image.shape[2] not in (3, 4):  # noqa: PLR2004
+        raise ValueError("Image must be an array of uint8 of shape (h, w, 3|4).")
+    color_type = _RGB if image.shape[2] == 3 else _RGBA  # noqa: PLR2004
+    return _encode(image, image.shape[1], color_type, 8, compress_level)
+
+
+def _pack(indices: np.ndarray, bit_depth: int) -> np.ndarray:
+    """Pack indices on fewer bits, each row starting on a new byte."""
+    if bit_depth == 8:  # noqa: PLR2004
+        return indices
+    height, width = indices.shape
+    per_byte = 8 // bit_depth
+    padded = np.zeros((height, -(-width // per_byte) * per_byte), dtype=np.uint8)
+    padded[:, :width] = indices
+    padded = padded.reshape(height, -1, per_byte)
+    packed = padded[..., 0] << (8 - bit_depth)
+    for i in range(1, per_byte):
+        packed |= padded[..., i] << (8 - bit_depth * (i + 1))
+    return packed
+
+
+def bit_depth(n_colors: int) -> int:
+    """Return the smallest bit depth for an indexed image with that many colors."""
+    for depth in (1, 2, 4, 8):
+        if n_colors <= 1 << depth:
+            return depth
+    raise ValueError(f"Too many colors for an indexed image ({n_colors} > 256).")
+
+
+def encode_indexed(
+    indices: np.ndarray,
+    palette: np.ndarray,
+    compress_level: int = 6,
+    depth: int | None = None,
+) -> bytes:
+    """Encode an indexed image as PNG.
+
+    Parameters
+    ----------
+    indices
+        Array of uint8 of shape ``(height, width)``, index of each pixel color in the
+        palette.
+    palette
+        Array of uint8 of shape ``(n, 3)`` or ``(n, 4)``, with at most 256 colors. If
+        there is an alpha channel it is written as well.
+    compress_level
+        Compression level of zlib, from 0 (no compression) to 9 (slowest).
+    depth
+        Number of bits per pixel: 1, 2, 4, or 8. If None, use the smallest depth
+        that fits the palette, see :func:`bit_depth`.
+    """
+    indices = np.asarray(indices)
+    palette = np.asarray(palette)
+    if indices.dtype != np.uint8 or indices.ndim != 2:  # noqa: PLR2004
+        raise ValueError("Indices must be an array of uint8 of shape (h, w).")
+    if palette.dtype != np.uint8 or not 1 <= palette.shape[0] <= 256:  # noqa: PLR2004
+        raise ValueError("Palette must be an array of uint8 with 1 to 256 colors.")
+    chunks = [_chunk(b"PLTE", palette[:, :3].tobytes())]
+    if palette.shape[1] == 4 and (palette[:, 3] != 255).any():  # noqa: PLR2004
+        chunks.append(_chunk(b"tRNS", palette[:, 3].tobytes()))
+    if depth is None:
+        depth = bit_depth(palette.shape[0])
+    if depth not in (1, 2, 4, 8) or palette.shape[0] > 1 << depth:
+        raise ValueError(f"Invalid bit depth {depth} for {palette.shape[0]} colors.")
+    rows = _pack(indices, depth)
+    return _encode(rows, indices.shape[1], _INDEXED, depth, compress_level, *chunks)
@@ -0,0 +1,181 @@
+"""Recolor images rendered with another colormap.
+
+An image rendered with a colormap (for instance "viridis") is converted to another
+colormap (for instance "tol.iridescent") without the original data: each pixel is
+matched to the nearest color of the source colormap, which gives back the
+normalized value, then mapped with the target colormap. Pixels far from every
+color of the source colormap (axes, labels, background) are left unchanged.
+
+Both steps are combined into a single table from RGB to RGB, sampled on a regular
+grid of the RGB cube, and cached. The table is applied to images by chunks, with
+trilinear interpolation between grid points, or exactly with a full grid of 256
+points per channel.
+
+>>> image = plt.imread("map_viridis.png")
+>>> plt.imsave("map_iridescent.png", recolor(image, "viridis", "iridescent"))
+"""
+
+# ruff: noqa: N803
+
+import functools
+
+import numpy as np
+from matplotlib.colors import Colormap
+
+from tol_colors.colorize import get_colormap
+
+
+def _build_table(
+    source: Colormap, target: Colormap, size: int, max_distance: float | None
+) -> np.ndarray:
+    n = source.N
+    # colors as they appear in images
+    colors = source(np.arange(n), bytes=True)[:, :3] / 255
+    targets = target(np.linspace(0.0, 1.0, n), bytes=True)[:, :3]
+    axis = np.linspace(0.0, 1.0, size)
+
+    # find the nearest source color of each grid point, only looking at the grid
+    # points within max_distance of each color
+    limit = np.inf if max_distance is None else max_distance**2
+    best = np.full((size, size, size), limit)
+    nearest = np.full((size, size, size), -1, dtype=np.intp)
+    for i, color in enumerate(colors):
+        box: list[slice] = []
+        for c in color:
+            if max_distance is None:
+                box.append(slice(None))
+            else:
+                lo = int(np.ceil((c - max_distance) * (size - 1)))
+                hi = int(np.floor((c + max_distance) * (size - 1))) + 1
+                box.append(slice(max(lo, 0), min(hi, size)))
+        r, g, b = ((axis[sl] - c) ** 2 for sl, c in zip(box, color, strict=True))
+        dist = r[:, None, None] + g[None, :, None] + b[None, None, :]
+        region = tuple(box)
+        closer = dist < best[region]
+        best[region][closer] = dist[closer]
+        nearest[region][closer] = i
+
+    table = np.empty((size, size, size, 3), dtype=np.uint8)
+    levels = np.round(axis * 255).astype(np.uint8)
+    table[..., 0] = levels[:, None, None]
+    table[..., 1] = levels[None, :, None]
+    table[..., 2] = levels[None, None, :]
+    near = nearest >= 0
+    table[near] = targets.take(nearest[near], axis=0)
+    table.flags.writeable = False
+    return table
+
+
+@functools.lru_cache(maxsize=16)
+def _cached_table(
+    source: str, target: str, size: int, N: int | None, max_distance: float | None
+) -> np.ndarray:
+    return _build_table(
+        get_colormap(source, N), get_colormap(target, N), size, max_distance
+    )
+
+
+def recolor_table(
+    source: str | Colormap,
+    target: str | Colormap,
+    size: int = 64,
+    N: int | None = 256,
+    max_distance: float | None = 0.1,
+) -> np.ndarray:
+    """Return the table converting colors of *source* to colors of *target*.
+
+    Tables are read-only, and cached when colormaps are given by name.
+
+    Parameters
+    ----------
+    source, target
+        Colormaps or colormap names, see :func:`.colorize.get_colormap`.
+    size
+        Number of grid points along each channel, at least 2.
+    N
+        Number of colors for linear colormaps.
+    max_distance
+        Colors farther than this from the source colormap (Euclidean distance of
+        RGB values in [0, 1]) are unchanged. If None, all colors are converted.
+
+    Returns
+    -------
+    Array of uint8 of shape ``(size, size, size, 3)``: the color of grid point
+    ``(r, g, b) * (size - 1) / 255``.
+    """
+    if size < 2:  # noqa: PLR2004
+        raise ValueError(f"Size must be at least 2, got {size}.")
+    if isinstance(source, str) and isinstance(target, str):
+        return _cached_table(source, target, size, N, max_distance)
+    return _build_table(
+        get_colormap(source, N), get_colormap(target, N), size, max_distance
+    )
+
+
+def _apply(table: np.ndarray, rgb: np.ndarray) -> np.ndarray:
+    """Apply a table to an array of RGB bytes of shape (n, 3)."""
+    size = table.shape[0]
+    flat = table.reshape(-1, 3)
+    if size == 256:  # noqa: PLR2004
+        rgb = rgb.astype(np.intp)
+        idx = (rgb[:, 0] << 16) | (rgb[:, 1] << 8) | rgb[:, 2]
+        return flat.take(idx, axis=0)
+
+    pos = rgb * np.float32((size - 1) / 255)
+    base = np.minimum(pos.astype(np.intp), size - 2)
+    frac = pos - base
+    idx = (base[:, 0] * size + base[:, 1]) * size + base[:, 2]
+    out = np.zeros(rgb.shape, dtype=np.float32)
+    for corner in range(8):
+        dr, dg, db = corner >> 2, (corner >> 1) & 1, corner & 1
+        weight = np.ones(len(rgb), dtype=np.float32)
+        for channel, d in enumerate([dr, dg, db]):
+            f = frac[:, channel]
+            weight *= f if d else 1 - f
+        values = flat.take(idx + (dr * size + dg) * size + db, axis=0)
+        out += weight[:, None] * values
+    return np.round(out).astype(np.uint8)
+
+
+def recolor(  # noqa: PLR0913, PLR0917
+    image: np.ndarray,
+    source: str | Colormap,
+    target: str | Colormap,
+    size: int = 64,
+    N: int | None = 256,
+    max_distance: float | None = 0.1,
+    chunk_size: int = 1 << 18,
+) -> np.ndarray:
+    """Recolor an image rendered with *source* to *target*.
+
+    Parameters
+    ----------
+    image
+        Array of shape ``(..., 3)`` or ``(..., 4)``, of uint8 or of floats in
+        [0, 1] (as returned by :func:`matplotlib.pyplot.imread`). The alpha
+        channel is kept.
+    source, target, size, N, max_distance
+        See :func:`recolor_table`. Use a *size* of 256 for an exact conversion,
+        at the cost of a larger table (48 MiB) that is longer to build.
+    chunk_size
+        Number of pixels processed at once, to limit memory usage.
+
+    Returns
+    -------
+    Array of uint8 of the shape of *image*.
+    """
+    image = np.asarray(image)
+    if image.ndim == 0 or image.shape[-1] not in (3, 4):
+        raise ValueError(f"Expected RGB(A) image, got shape {image.shape}.")
+    if image.dtype != np.uint8:
+        image = np.round(np.clip(image, 0, 1) * 255).astype(np.uint8)
+    table = recolor_table(source, target, size, N, max_distance)
+
+    pixels = image.reshape(-1, image.shape[-1])
+    out = np.empty_like(pixels)
+    for start in range(0, len(pixels), chunk_size):
+        chunk = pixels[start : start + chunk_size]
+        out[start : start + chunk_size, :3] = _apply(table, chunk[:, :3])
+    if image.shape[-1] == 4:  # noqa: PLR2004
+        out[:, 3] = pixels[:, 3]
+    return out.reshape(image.shape)
@@ -0,0 +1,286 @@
+"""Colorsets defined in JSON files.
+
+A registry holds colorset definitions read from JSON files: the bundled file of
+tol_colors, or files of in-house palettes. Files are read once (until they are
+modified), and the type and instance of a colorset are only created when it is
+first accessed, so that loading many palettes costs little.
+
+>>> ours = ColorsetRegistry.from_json("palettes.json")
+>>> ours["corporate"].primary
+'#003366'
+
+The JSON file maps colorset names to mappings of color names and hex strings. The
+mapping can also be under a "colorsets" key, as in the bundled file::
+
+    {"corporate": {"primary": "#003366", "secondary": "#FF9900"}}
+
+Colorset types are named tuples of colors, with the array representations of
+:class:`tol_colors._Colorset`. To keep static typing, generate a stub file for
+the module defining a registry::
+
+    python -m tol_colors.registry palettes.json -o our_palettes.pyi
+
+"""
+
+import argparse
+import functools
+import json
+import keyword
+import os
+import threading
+from collections import namedtuple
+from collections.abc import Iterator, Mapping
+from importlib import resources
+from pathlib import Path
+from typing import Any, NamedTuple
+
+import tol_colors
+
+# color names that would shadow the array representations of colorsets
+_RESERVED = frozenset(dir(tol_colors._Colorset))
+
+
+def type_name(name: str) -> str:
+    """Return the name of the type of a colorset ("high_contrast" -> "HighContrast")."""
+    return "".join(part.capitalize() for part in name.replace("-", "_").split("_"))
+
+
+@functools.cache
+def colorset_type(name: str, fields: tuple[str, ...]) -> type:
+    """Return a colorset type, created once for each name and fields.
+
+    Parameters
+    ----------
+    name
+        Name of the colorset, in snake case. The type is named with
+        :func:`type_name`.
+    fields
+        Names of the colors.
+    """
+    base = namedtuple(type_name(name), fields)  # type: ignore[misc]
+
+    def reduce(self):
+        # the type cannot be found by name, pickle how to create it instead
+        return _rebuild, (name, fields, tuple(self))
+
+    return type(
+        base.__name__,
+        (tol_colors._Colorset, base),
+        dict(
+            __slots__=(),
+            __doc__=f"Colors of the {name} colorset.",
+            __reduce__=reduce,
+        ),
+    )
+
+
+def _rebuild(name: str, fields: tuple[str, ...], values: tuple[str, ...]) -> tuple:
+    return colorset_type(name, fields)(*values)
+
+
+@functools.lru_cache(maxsize=64)
+def _read(path: str, mtime_ns: int, size: int) -> dict[str, dict[str, str]]:
+    with open(path) as fp:
+        data = json.load(fp)
+    data = data.get("colorsets", data)
+    if not isinstance(data, dict) or not all(
+        isinstance(colors, dict) for colors in data.values()
+    ):
+        raise ValueError(f"{path} does not contain colorset definitions.")
+    return data
+
+
+def read_json(fname: str | os.PathLike) -> dict[str, dict[str, str]]:
+    """Return colorset definitions of a JSON file.
+
+    Files are parsed once, and again only if they are modified. The returned
+    dictionary must not be modified.
+    """
+    path = os.path.realpath(fname)
+    stat = os.stat(path)
+    return _read(path, stat.st_mtime_ns, stat.st_size)
+
+
+class ColorsetRegistry(Mapping[str, NamedTuple]):
+    """Mapping of colorsets created on first access.
+
+    As :data:`tol_colors.colorsets`, hyphens in keys are replaced by underscores.
+
+    Parameters
+    ----------
+    definitions
+        Mapping of colorset names to mappings of color names and values.
+    """
+
+    def __init__(self, definitions: Mapping[str, Mapping[str, str]] | None = None):
+        self._definitions: dict[str, Mapping[str, str]] = {}
+        self._types: dict[str, type] = {}
+        self._colorsets: dict[str, NamedTuple] = {}
+        self._lock = threading.Lock()
+        if definitions is not None:
+            self.update(definitions)
+
+    @classmethod
+    def from_json(cls, *fnames: str | os.PathLike) -> "ColorsetRegistry":
+        """Create a registry from JSON files.
+
+        Without files, the colorsets bundled with tol_colors are used, and given
+        their existing types (:class:`tol_colors.Bright`, ...).
+        """
+        registry = cls()
+        for fname in fnames:
+            registry.load(fname)
+        if not fnames:
+            with resources.as_file(
+                resources.files("tol_colors").joinpath("colors.json")
+            ) as path:
+                registry.load(path)
+            for name in registry:
+                registry._types[name] = type(tol_colors.colorsets[name])
+        return registry
+
+    def load(self, fname: str | os.PathLike, replace: bool = False) -> list[str]:
+        """Add the colorsets of a JSON file, see :func:`read_json`.
+
+        Returns
+        -------
+        Names of the colorsets added.
+        """
+        definitions = read_json(fname)
+        self.update(definitions, replace=replace)
+        return [self._key(name) for name in definitions]
+
+    def add(self, name: str, colors: Mapping[str, str], replace: bool = False):
+        """Add a colorset.
+
+        Parameters
+        ----------
+        name
+            Name of the colorset. Hyphens are replaced by underscores.
+        colors
+            Mapping of color names to color values (hex strings). Color names must
+            be valid identifiers, not start with an underscore, and not be attributes
+            of colorsets such as "rgb".
+        replace
+            If False, raise KeyError if a colorset of the same name exists.
+        """
+        key = self._key(name)
+        invalid = [
+            c
+            for c in colors
+            if not c.isidentifier()
+            or keyword.iskeyword(c)
+            or c.startswith("_")
+            or c in _RESERVED
+        ]
+        if not key.isidentifier() or invalid:
+            raise ValueError(f"Invalid names in colorset '{name}': {invalid}.")
+        with self._lock:
+            if key in self._definitions and not replace:
+                raise KeyError(f"Colorset '{key}' already exists.")
+            self._definitions[key] = colors
+            self._types.pop(key, None)
+            self._colorsets.pop(key, None)
+
+    def update(
+        self, definitions: Mapping[str, Mapping[str, str]], replace: bool = False
+    ):
+        """Add several colorsets, see :meth:`add`."""
+        for name, colors in definitions.items():
+            self.add(name, colors, replace=replace)
+
+    @staticmethod
+    def _key(name: str) -> str:
+        return name.replace("-", "_")
+
+    def get_type(self, name: str) -> type:
+        """Return the type of a colorset, created on first call."""
+        key = self._key(name)
+        cls = self._types.get(key)
+        if cls is None:
+            fields = tuple(self._definitions[key])
+            cls = self._types.setdefault(key, colorset_type(key, fields))
+        return cls
+
+    def __getitem__(self, name: str) -> NamedTuple:
+        key = self._key(name)
+        cset = self._colorsets.get(key)
+        if cset is None:
+            with self._lock:
+                cset = self._colorsets.get(key)
+                if cset is None:
+                    cset = self.get_type(key)(**self._definitions[key])
+                    self._colorsets[key] = cset
+        return cset
+
+    def __contains__(self, name: Any) -> bool:
+        return isinstance(name, str) and self._key(name) in self._definitions
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._definitions)
+
+    def __len__(self) -> int:
+        return len(self._definitions)
+
+    def stubs(self, variable: str = "colorsets") -> str:
+        """Return a stub file (``.pyi``) declaring the colorset types.
+
+        The stub is for a module defining the registry as *variable*. Indexing the
+        registry with a literal name then gives the precise colorset type.
+        """
+        lines = [
+            "# Generated by tol_colors.registry, do not edit.",
+            "",
+            "from typing import Literal, NamedTuple, overload",
+            "",
+            "import numpy as np",
+            "",
+            "from tol_colors.registry import ColorsetRegistry",
+        ]
+        for name, colors in self._definitions.items():
+            lines += ["", "", f"class {type_name(name)}(NamedTuple):"]
+            lines += [f"    {field}: str" for field in colors]
+            lines += [
+                f"    @property\n    def {attr}(self) -> np.ndarray: ..."
+                for attr in ["rgb", "rgba8", "packed"]
+            ]
+        lines += ["", "", "class _Registry(ColorsetRegistry):"]
+        for name in self._definitions:
+            keys = sorted({name, name.replace("_", "-")})
+            literal = ", ".join(f'"{k}"' for k in keys)
+            lines += [
+                "    @overload",
+                f"    def __getitem__(self, name: Literal[{literal}])"
+                f" -> {type_name(name)}: ...",
+            ]
+        lines += [
+            "    @overload",
+            "    def __getitem__(self, name: str) -> NamedTuple: ...",
+            "",
+            "",
+            f"{variable}: _Registry",
+        ]
+        return "\n".join(lines) + "\n"
+
+    def write_stubs(self, fname: str | os.PathLike, variable: str = "colorsets"):
+        """Write a stub file, see :meth:`stubs`."""
+        Path(fname).write_text(self.stubs(variable))
+
+
+def main(argv: list[str] | None = None):
+    """Generate a stub file from the command line."""
+    parser = argparse.ArgumentParser(description="Generate colorset stubs.")
+    parser.add_argument("fnames", nargs="*", help="JSON files. Default: bundled.")
+    parser.add_argument("-o", "--output", help="Stub file. Default: stdout.")
+    parser.add_argument("--variable", default="colorsets")
+    args = parser.parse_args(argv)
+
+    registry = ColorsetRegistry.from_json(*args.fnames)
+    if args.output is None:
+        print(registry.stubs(args.variable), end="")
+    else:
+        registry.write_stubs(args.output, args.variable)
+
+
+if __name__ == "__main__":
+    main()
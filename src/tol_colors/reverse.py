@@ -0,0 +1,156 @@
+"""Reversed colormaps sharing the lookup table of their forward colormap.
+
+A colormap and its reverse hold the same colors, in opposite orders. Here both
+lookup tables are views into a single buffer: the reversed table indexes the
+colors backwards, and each colormap keeps its own rows for the *under*, *over* and
+*bad* colors. The buffer is built on first use of either colormap, so that the
+colors are only computed once.
+
+The buffer holds the three special rows of the reversed colormap (in reverse
+order), the colors, and the three special rows of the forward colormap::
+
+    bad_r, over_r, under_r, c_0, ..., c_N-1, under, over, bad
+                            |---- forward table ----------------|
+    |---- reversed table (read backwards) -----|
+
+The definition of the reversed colormap (its segments or list of colors) is only
+computed when needed, for instance to resample it: until then, it holds a reference
+to the forward colormap.
+
+Copies of these colormaps (as returned by :data:`tol_colors.colormaps`) are
+independent colormaps with their own table. Colormaps are pickled without the
+shared buffer.
+"""
+
+import threading
+from typing import TypeVar, cast
+
+import numpy as np
+from matplotlib.colors import Colormap, LinearSegmentedColormap, ListedColormap
+
+C = TypeVar("C", bound=Colormap)
+
+
+class _Pair:
+    """Build the shared lookup table of a colormap and its reverse."""
+
+    def __init__(self, forward: Colormap, reverse: Colormap):
+        self.forward = forward
+        self.reverse = reverse
+        self._lock = threading.Lock()
+
+    def init(self):
+        with self._lock:
+            forward, reverse = self.forward, self.reverse
+            if forward._isinit and reverse._isinit:
+                return
+            n = forward.N
+            # compute the colors with the parent class of the forward colormap
+            super(_SharedReverse, forward)._init()
+            buffer = np.zeros((n + 6, 4), dtype=forward._lut.dtype)
+            buffer[3:] = forward._lut
+            forward._lut = buffer[3:]
+            reverse._lut = buffer[n + 2 :: -1]
+            reverse._isinit = True
+            reverse._update_lut_extremes()
+
+
+class _SharedReverse:
+    """Mixin for colormaps that share their lookup table with their reverse."""
+
+    _pair: _Pair | None = None
+    # attribute defining the colors, built lazily for reversed colormaps
+    _definition: str
+
+    def _init(self):
+        if self._pair is None:
+            super()._init()  # type: ignore[misc]
+        else:
+            self._pair.init()
+
+    def __getattr__(self, name: str):
+        source = self.__dict__.get("_reverse_of")
+        if name == self._definition and source is not None:
+            value = getattr(source.reversed(), name)
+            self.__dict__.setdefault(name, value)
+            self.__dict__.pop("_reverse_of", None)
+            return self.__dict__[name]
+        raise AttributeError(
+            f"'{type(self).__name__}' object has no attribute '{name}'"
+        )
+
+    def __copy__(self):
+        new = super().__copy__()  # type: ignore[misc]
+        new.__dict__.pop("_pair", None)
+        return new
+
+    def __getstate__(self):
+        # the pair holds a lock and the other colormap, do not pickle it
+        getattr(self, self._definition)
+        state = self.__dict__.copy()
+        state.pop("_pair", None)
+        state.pop("_reverse_of", None)
+        return state
+
+
+class SharedLinearSegmentedColormap(_SharedReverse, LinearSegmentedColormap):
+    """Linear colormap sharing its lookup table with its reverse."""
+
+    _definition = "_segmentdata"
+
+
+class SharedListedColormap(_SharedReverse, ListedColormap):
+    """Discrete colormap sharing its lookup table with its reverse."""
+
+    _definition = "colors"
+
+
+_SHARED = {
+    LinearSegmentedColormap: SharedLinearSegmentedColormap,
+    ListedColormap: SharedListedColormap,
+}
+
+
+def _as_shared(cmap: C) -> C:
+    cls = _SHARED[type(cmap)]
+    new = cls.__new__(cls)  # type: ignore[call-overload]
+    new.__dict__.update(cmap.__dict__)
+    return cast(C, new)
+
+
+def _lazy_reversed(cmap: C) -> C:
+    """Return the reverse of *cmap*, whose definition is computed when needed."""
+    new = _as_shared(cmap)
+    del new.__dict__[new._definition]  # type: ignore[attr-defined]
+    new.name = f"{cmap.name}_r"
+    new._rgba_under = cmap._rgba_over  # type: ignore[attr-defined]
+    new._rgba_over = cmap._rgba_under  # type: ignore[attr-defined]
+    new._reverse_of = cmap  # type: ignore[attr-defined]
+    return new
+
+
+def reversed_pair(cmap: C) -> tuple[C, C]:
+    """Return a colormap and its reverse, sharing their lookup table.
+
+    Parameters
+    ----------
+    cmap
+        A :class:`~matplotlib.colors.LinearSegmentedColormap` or
+        :class:`~matplotlib.colors.ListedColormap`, whose lookup table is not built
+        yet. Other colormaps are returned with a regular reversed colormap.
+
+    Returns
+    -------
+    forward
+        Copy of *cmap*.
+    reverse
+        Its reverse. The colors and the special colors are the same as
+        ``cmap.reversed()``.
+    """
+    if type(cmap) not in _SHARED or cmap._isinit:  # type: ignore[attr-defined]
+        return cmap, cast(C, cmap.reversed())
+    forward = _as_shared(cmap)
+    reverse = _lazy_reversed(cmap)
+    pair = _Pair(forward, reverse)
+    forward._pair = reverse._pair = pair  # type: ignore[attr-defined]
+    return forward, reverse
@@ -0,0 +1,154 @@
+"""Choose a colorset for a number of series and a background.
+
+Candidates are the colorsets of :data:`tol_colors.colorsets` (their first *n*
+colors), and the discrete rainbow of *n* colors. Colors that are not meant for
+data series are left out: the pale grey for bad data, and the black and white of
+the contrast colorsets. The land cover colorset is not a candidate.
+
+Each candidate is scored by the smallest perceptual distance (in OKLab) between
+two of its colors, or by the smallest difference of lightness between one of its
+colors and the background if lower. Both are measured in normal vision and in
+simulated protanopia and deuteranopia (see :mod:`.cvd`), the deficiencies the
+colorsets are designed for. Distances between colors do not depend on the
+background and are computed once for all candidates. Rankings are cached for each
+number of colors and background (as bytes), so that choosing the colors of a chart
+takes a few microseconds.
+
+>>> select(4, background="black")
+['#6699CC', '#004488', '#EECC66', '#997700']
+>>> rank(4, background="black")[:3]
+['medium_contrast', 'rainbow_discrete', 'vibrant']
+"""
+
+import functools
+from collections.abc import Sequence
+from typing import NamedTuple
+
+import numpy as np
+from matplotlib.colors import to_rgb, to_rgba_array
+
+import tol_colors
+from tol_colors.cvd import simulate
+from tol_colors.interp import srgb_to_oklab
+
+EXCLUDED = dict(
+    muted={"pale_grey"},
+    light={"pale_grey"},
+    high_contrast={"black", "white"},
+    medium_contrast={"black", "white"},
+    land_cover=None,
+)
+"""Colors left out of each colorset, or None to leave out the whole colorset."""
+
+_VISIONS = ("normal", "protanopia", "deuteranopia")
+_RAINBOW = "rainbow_discrete"
+_RAINBOW_MAX = 23
+
+
+class _Table(NamedTuple):
+    names: list[str]
+    colors: list[list[str]]
+    lab: np.ndarray  # colors of all candidates, (n_visions, n_colors, 3)
+    offsets: np.ndarray  # start of each candidate in lab
+    distinct: np.ndarray  # smallest distance between colors of each candidate
+
+
+def _lab(rgb: np.ndarray) -> np.ndarray:
+    """Return colors in OKLab in each vision, of shape (n_visions, n_colors, 3)."""
+    return srgb_to_oklab(np.stack([simulate(rgb, vision) for vision in _VISIONS]))
+
+
+def _distinct(lab: np.ndarray) -> float:
+    """Return the smallest distance between two colors, in any vision."""
+    dist = np.sqrt(((lab[:, :, None] - lab[:, None, :]) ** 2).sum(axis=-1))
+    i, j = np.triu_indices(lab.shape[1], k=1)
+    return float(dist[:, i, j].min(initial=np.inf))
+
+
+def candidates(n: int) -> dict[str, list[str]]:
+    """Return the colorsets that can be chosen for *n* series.
+
+    Returns
+    -------
+    Mapping of candidate names to their first *n* colors, as hex strings.
+    """
+    out = {}
+    for name, cset in tol_colors.colorsets.items():
+        excluded = EXCLUDED.get(name, set())
+        if excluded is None:
+            continue
+        colors = [c for field, c in cset._asdict().items() if field not in excluded]
+        if len(colors) >= n:
+            out[name] = colors[:n]
+    if n <= _RAINBOW_MAX:
+        data = tol_colors._colors["rainbow_discrete"]
+        out[_RAINBOW] = [data["colors"][i] for i in data["indexes"][n - 1]]
+    return out
+
+
+@functools.lru_cache(maxsize=64)
+def _table(n: int, colorsets: tuple) -> _Table:
+    cands = candidates(n)
+    if not cands:
+        raise ValueError(f"No colorset has {n} colors.")
+    names = list(cands)
+    colors = list(cands.values())
+    lab = _lab(to_rgba_array(sum(colors, []))[:, :3])
+    offsets = np.arange(0, n * len(names), n)
+    distinct = np.array([_distinct(lab[:, i : i + n]) for i in offsets])
+    return _Table(names, colors, lab, offsets, distinct)
+
+
+@functools.lru_cache(maxsize=1024)
+def _rank(
+    n: int, background: tuple[int, int, int], colorsets: tuple
+) -> tuple[list[str], list[str]]:
+    table = _table(n, colorsets)
+    bg = _lab(np.array([background]) / 255)
+    contrast = np.abs(table.lab[..., 0] - bg[..., 0]).min(axis=0)
+    contrast = np.minimum.reduceat(contrast, table.offsets)
+    scores = np.minimum(table.distinct, contrast)
+    order = np.argsort(-scores, kind="stable")
+    return [table.names[i] for i in order], table.colors[order[0]]
+
+
+def _key(
+    n: int, background: str | Sequence[float]
+) -> tuple[int, tuple[int, int, int], tuple]:
+    if n < 1:
+        raise ValueError("Number of colors must be at least 1.")
+    r, g, b = (round(c * 255) for c in to_rgb(background))  # type: ignore[arg-type]
+    return n, (r, g, b), tuple(tol_colors.colorsets.items())
+
+
+def rank(n: int, background: str | Sequence[float] = "white") -> list[str]:
+    """Return the candidates for *n* series, the best first.
+
+    Parameters
+    ----------
+    n
+        Number of series.
+    background
+        Background color, as a matplotlib color (RGB values in [0, 1], hex string,
+        name).
+
+    Raises
+    ------
+    ValueError
+        If no candidate has *n* colors.
+    """
+    return list(_rank(*_key(n, background))[0])
+
+
+def select(n: int, background: str | Sequence[float] = "white") -> list[str]:
+    """Return the *n* colors of the best candidate, as hex strings.
+
+    See :func:`rank` for parameters.
+    """
+    return list(_rank(*_key(n, background))[1])
+
+
+def clear_cache():
+    """Forget the scores of candidates and the rankings."""
+    _table.cache_clear()
+    _rank.cache_clear()
@@ -0,0 +1,344 @@
+"""Serve colorization over HTTP.
+
+A small HTTP/1.1 server based on :mod:`asyncio` streams, without dependencies
+outside the standard library. It exposes:
+
+``POST /colorize/{cmap}?shape=H,W&vmin=..&vmax=..``
+    Colorize the array sent as body (raw bytes, ``dtype=float32`` by default).
+    Optional parameters: ``N`` (number of colors, at most 65536), ``format``
+    (``png`` or ``raw`` RGBA bytes).
+``GET /palette/{name}``
+    Colors of a colorset or colormap, as JSON.
+``GET /metrics``
+    Counters of :mod:`.instrumentation` in the Prometheus text format.
+
+Colorization and PNG encoding run in an executor (a thread pool by default, since
+NumPy and zlib release the GIL). Requests that arrive within *batch_delay* are
+colorized together in a single call, see :func:`.colorize.colorize_many`.
+
+Run with ``python -m tol_colors.server --port 8000``.
+"""
+
+# ruff: noqa: N803, N806
+
+import argparse
+import asyncio
+import json
+import logging
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from http import HTTPStatus
+from urllib.parse import parse_qs, unquote, urlsplit
+
+import numpy as np
+from matplotlib.colors import to_hex
+
+import tol_colors
+from tol_colors import instrumentation, png
+from tol_colors.colorize import colorize_many, get_colormap
+
+log = logging.getLogger(__name__)
+
+_MAX_BODY = 64 * 1024 * 1024
+_MAX_N = 65536
+
+
+class _HTTPError(Exception):
+    def __init__(self, status: HTTPStatus, message: str = ""):
+        super().__init__(message or status.phrase)
+        self.status = status
+
+
+def _render_batch(key: tuple, items: list[tuple]) -> list[bytes]:
+    N, fmt, compress_level = key
+    arrays, cmaps, vmin, vmax = zip(*items, strict=True)
+    images = colorize_many(arrays, cmaps, vmin, vmax, N)
+    if fmt == "png":
+        return [png.encode(image, compress_level) for image in images]
+    return [image.tobytes() for image in images]
+
+
+def _render(key: tuple, items: list[tuple]) -> list[bytes | Exception]:
+    """Colorize arrays in a single pass and encode each of them.
+
+    *key* holds the number of colors, output format and compression level. Each
+    item holds an array, the colormap name, vmin and vmax.
+
+    If the batch fails, items are rendered one at a time so that an error only
+    affects its own item: the exception is returned in place of its result.
+    """
+    try:
+        return list(_render_batch(key, items))
+    except Exception:  # noqa: BLE001
+        pass
+    results: list[bytes | Exception] = []
+    for item in items:
+        try:
+            results += _render_batch(key, [item])
+        except Exception as e:  # noqa: BLE001
+            results.append(e)
+    return results
+
+
+class _Batcher:
+    """Group arrays with the same output parameters."""
+
+    def __init__(self, executor: Executor | None, delay: float, max_size: int):
+        self.executor = executor
+        self.delay = delay
+        self.max_size = max_size
+        self.pending: dict[tuple, list[tuple[tuple, asyncio.Future]]] = {}
+
+    async def submit(self, key: tuple, item: tuple) -> bytes:
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        batch = self.pending.setdefault(key, [])
+        batch.append((item, future))
+        if len(batch) >= self.max_size or self.delay <= 0:
+            self.flush(key)
+        elif len(batch) == 1:
+            loop.call_later(self.delay, self.flush, key)
+        return await future
+
+    def flush(self, key: tuple):
+        batch = self.pending.pop(key, None)
+        if not batch:
+            return
+        loop = asyncio.get_running_loop()
+        items = [item for item, _ in batch]
+        task = loop.run_in_executor(self.executor, _render, key, items)
+        task.add_done_callback(lambda t: self._dispatch(t, batch))
+
+    @staticmethod
+    def _dispatch(task: asyncio.Future, batch: list):
+        if task.cancelled():
+            for _, future in batch:
+                future.cancel()
+            return
+        error = task.exception()
+        results = [None] * len(batch) if error else task.result()
+        for (_, future), result in zip(batch, results, strict=True):
+            if future.done():
+                continue
+            if error:
+                future.set_exception(error)
+            elif isinstance(result, Exception):
+                future.set_exception(result)
+            else:
+                future.set_result(result)
+
+
+class Server:
+    """HTTP server for colorization.
+
+    Parameters
+    ----------
+    host, port
+        Address to listen on. If *port* is 0, a free port is chosen, see
+        :attr:`port` once started.
+    executor
+        Executor for colorization and encoding. If None, a thread pool.
+    batch_delay
+        Time in seconds to wait for other requests before colorizing them
+        together. If 0, requests are not batched.
+    max_batch
+        Maximum number of arrays colorized together.
+    compress_level
+        Compression level of PNG output.
+    """
+
+    def __init__(  # noqa: PLR0913
+        self,
+        host: str = "127.0.0.1",
+        port: int = 8000,
+        *,
+        executor: Executor | None = None,
+        batch_delay: float = 0.002,
+        max_batch: int = 64,
+        compress_level: int = 1,
+    ):
+        self.host = host
+        self.port = port
+        self.compress_level = compress_level
+        self.batcher = _Batcher(executor, batch_delay, max_batch)
+        self._server: asyncio.Server | None = None
+
+    async def start(self):
+        """Start listening."""
+        self._server = await asyncio.start_server(self._handle, self.host, self.port)
+        self.port = self._server.sockets[0].getsockname()[1]
+        log.info("Serving on http://%s:%d", self.host, self.port)
+
+    async def serve_forever(self):
+        """Start listening (if not already) and serve until cancelled."""
+        if self._server is None:
+            await self.start()
+        assert self._server is not None
+        await self._server.serve_forever()
+
+    async def close(self):
+        """Stop listening."""
+        if self._server is not None:
+            self._server.close()
+            await self._server.wait_closed()
+            self._server = None
+
+    async def __aenter__(self):
+        await self.start()
+        return self
+
+    async def __aexit__(self, *exc):
+        await self.close()
+
+    async def _handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        try:
+            while True:
+                line = await reader.readline()
+                if not line:
+                    break
+                keep_alive = False
+                try:
+                    method, target, version = line.decode("latin-1").split()
+                    headers = {}
+                    while (header := await reader.readline()) not in (b"\r\n", b""):
+                        key, _, value = header.decode("latin-1").partition(":")
+                        headers[key.strip().lower()] = value.strip()
+                    length = int(headers.get("content-length", 0))
+                    if length > _MAX_BODY:
+                        raise _HTTPError(HTTPStatus.REQUEST_ENTITY_TOO_LARGE)
+                    body = await reader.readexactly(length)
+                    keep_alive = (
+                        version == "HTTP/1.1"
+                        and headers.get("connection", "").lower() != "close"
+                    )
+                    status, ctype, payload = await self.dispatch(method, target, body)
+                except _HTTPError as e:
+                    status, ctype, payload = e.status, "text/plain", str(e).encode()
+                except ValueError:
+                    status, ctype = HTTPStatus.BAD_REQUEST, "text/plain"
+                    payload = b"Malformed request"
+                except Exception:  # noqa: BLE001
+                    log.exception("Error processing request %r", line)
+                    status, ctype = HTTPStatus.INTERNAL_SERVER_ERROR, "text/plain"
+                    payload = b"Internal error"
+                writer.write(
+                    f"HTTP/1.1 {status.value} {status.phrase}\r\n"
+                    f"Content-Type: {ctype}\r\n"
+                    f"Content-Length: {len(payload)}\r\n"
+                    f"Connection: {'keep-alive' if keep_alive else 'close'}\r\n"
+                    "\r\n".encode("latin-1")
+                    + payload
+                )
+                await writer.drain()
+                if not keep_alive:
+                    break
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        finally:
+            writer.close()
+
+    async def dispatch(
+        self, method: str, target: str, body: bytes
+    ) -> tuple[HTTPStatus, str, bytes]:
+        """Process a request.
+
+        Returns
+        -------
+        Status, content type and payload of the response.
+
+        Raises
+        ------
+        _HTTPError
+            For invalid requests.
+        """
+        url = urlsplit(target)
+        query = {k: v[-1] for k, v in parse_qs(url.query).items()}
+        parts = [unquote(p) for p in url.path.strip("/").split("/")]
+        match parts, method:
+            case ["colorize", name], "POST":
+                return await self.colorize(name, query, body)
+            case ["palette", name], "GET":
+                return self.palette(name)
+            case ["metrics"], "GET":
+                payload = instrumentation.prometheus().encode()
+                return HTTPStatus.OK, "text/plain; version=0.0.4", payload
+            case ["colorize" | "palette", _], _:
+                raise _HTTPError(HTTPStatus.METHOD_NOT_ALLOWED)
+        raise _HTTPError(HTTPStatus.NOT_FOUND)
+
+    async def colorize(
+        self, name: str, query: dict[str, str], body: bytes
+    ) -> tuple[HTTPStatus, str, bytes]:
+        """Colorize an array, see module documentation."""
+        try:
+            get_colormap(name)
+        except KeyError as e:
+            raise _HTTPError(HTTPStatus.NOT_FOUND, f"Unknown colormap '{name}'") from e
+        try:
+            shape = tuple(int(s) for s in query["shape"].split(","))
+            vmin, vmax = float(query["vmin"]), float(query["vmax"])
+            N = int(query["N"]) if "N" in query else 256
+            dtype = np.dtype(query.get("dtype", "float32"))
+            fmt = query.get("format", "png")
+        except (KeyError, ValueError, TypeError) as e:
+            raise _HTTPError(HTTPStatus.BAD_REQUEST, f"Invalid parameters: {e}") from e
+        if dtype.kind not in "fiu" or fmt not in ("png", "raw") or len(shape) > 2:  # noqa: PLR2004
+            raise _HTTPError(HTTPStatus.BAD_REQUEST, "Invalid parameters")
+        if not shape or min(shape) < 1:
+            raise _HTTPError(HTTPStatus.BAD_REQUEST, "Shape must not be empty")
+        if not 1 <= N <= _MAX_N:
+            raise _HTTPError(
+                HTTPStatus.BAD_REQUEST, f"N must be between 1 and {_MAX_N}"
+            )
+        if np.prod(shape) * dtype.itemsize != len(body):
+            raise _HTTPError(HTTPStatus.BAD_REQUEST, "Body does not match shape")
+        if len(shape) == 1:
+            shape = (1, *shape)
+        array = np.frombuffer(body, dtype=dtype).reshape(shape)
+        key = (N, fmt, self.compress_level)
+        payload = await self.batcher.submit(key, (array, name, vmin, vmax))
+        ctype = "image/png" if fmt == "png" else "application/octet-stream"
+        return HTTPStatus.OK, ctype, payload
+
+    def palette(self, name: str) -> tuple[HTTPStatus, str, bytes]:
+        """Return colors of a colorset or colormap as JSON."""
+        try:
+            colors = list(tol_colors.colorsets[name])
+        except KeyError:
+            try:
+                cmap = get_colormap(name)
+            except KeyError as e:
+                raise _HTTPError(HTTPStatus.NOT_FOUND, f"Unknown name '{name}'") from e
+            colors = [to_hex(c).upper() for c in cmap(np.arange(cmap.N))]
+        payload = json.dumps(dict(name=name, colors=colors)).encode()
+        return HTTPStatus.OK, "application/json", payload
+
+
+def main(argv: list[str] | None = None):
+    """Run the server from the command line."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8000)
+    parser.add_argument("--workers", type=int, default=None)
+    parser.add_argument("--processes", action="store_true", help="Use a process pool.")
+    parser.add_argument("--batch-delay", type=float, default=0.002)
+    parser.add_argument("--compress-level", type=int, default=1)
+    args = parser.parse_args(argv)
+
+    pool = ProcessPoolExecutor if args.processes else ThreadPoolExecutor
+    logging.basicConfig(level=logging.INFO)
+    with pool(args.workers) as executor:
+        server = Server(
+            args.host,
+            args.port,
+            executor=executor,
+            batch_delay=args.batch_delay,
+            compress_level=args.compress_level,
+        )
+        try:
+            asyncio.run(server.serve_forever())
+        except KeyboardInterrupt:
+            pass
+
+
+if __name__ == "__main__":
+    main()
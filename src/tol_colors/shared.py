@@ -0,0 +1,191 @@
+"""Share colormap lookup tables between processes.
+
+The lookup tables of all colormaps are stored in a single block of shared memory,
+along with a small index. Other processes attach to this block and use zero-copy
+views on it instead of building their own tables::
+
+    # parent process
+    luts = SharedLUTs.create(N=4096)
+    os.environ["TOL_COLORS_SHARED_LUTS"] = luts.name
+
+    # child processes: done automatically when importing tol_colors if the
+    # environment variable is set, otherwise
+    SharedLUTs.attach(name).install()
+
+The shared tables are read-only. Setting the special colors of a colormap using
+them (with ``set_bad`` for instance) first copies its table, so that other processes
+are not affected. Memory is only saved for the module attributes
+(``tol_colors.sunset``) and the colormaps of :meth:`SharedLUTs.colormap`:
+colormaps obtained from :data:`tol_colors.colormaps` are copies with their own
+table, and so are the colormaps registered in matplotlib.
+"""
+
+# ruff: noqa: N803
+
+import json
+import struct
+import sys
+from multiprocessing import resource_tracker
+from multiprocessing.shared_memory import SharedMemory
+
+import numpy as np
+from matplotlib.colors import Colormap, LinearSegmentedColormap, ListedColormap
+
+import tol_colors
+
+ENV_VAR = "TOL_COLORS_SHARED_LUTS"
+"""Environment variable holding the name of a shared block to attach to on import."""
+
+_HEADER = struct.Struct("<Q")
+_ALIGN = 64
+
+
+def _data_offset(index_size: int) -> int:
+    offset = _HEADER.size + index_size
+    return -(-offset // _ALIGN) * _ALIGN
+
+
+class _CopyOnWrite:
+    """Mixin for colormaps with a read-only lookup table, copied when modified."""
+
+    def _update_lut_extremes(self):
+        if not self._lut.flags.writeable:  # type: ignore[attr-defined]
+            self._lut = self._lut.copy()  # type: ignore[attr-defined]
+        super()._update_lut_extremes()  # type: ignore[misc]
+
+
+class _SharedLinearSegmentedColormap(_CopyOnWrite, LinearSegmentedColormap):
+    """Linear colormap using a shared lookup table."""
+
+
+class _SharedListedColormap(_CopyOnWrite, ListedColormap):
+    """Discrete colormap using a shared lookup table."""
+
+
+class SharedLUTs:
+    """Lookup tables of all colormaps stored in a shared memory block.
+
+    Use :meth:`create` to publish the tables, and :meth:`attach` to access them from
+    another process. The memory block is released when all processes have called
+    :meth:`close`, and the creating process has called :meth:`unlink`.
+    """
+
+    def __init__(self, shm: SharedMemory, index: dict):
+        self.shm = shm
+        self.N: int = index["N"]
+        self.index: dict[str, tuple[int, int]] = {
+            name: tuple(pos) for name, pos in index["luts"].items()
+        }
+        offset = _data_offset(_HEADER.unpack_from(shm.buf)[0])  # type: ignore[arg-type]
+        n_rows = max((start + size for start, size in self.index.values()), default=0)
+        self.data = np.ndarray(
+            (n_rows, 4), dtype=np.float64, buffer=shm.buf, offset=offset
+        )
+        self.data.flags.writeable = False
+
+    @property
+    def name(self) -> str:
+        """Name of the shared memory block."""
+        return self.shm.name
+
+    @classmethod
+    def create(cls, N: int = 256, name: str | None = None) -> "SharedLUTs":
+        """Publish the lookup tables of all colormaps in a new shared memory block.
+
+        Parameters
+        ----------
+        N
+            Number of colors of continuous colormaps. Discrete colormaps keep their
+            number of colors.
+        name
+            Name of the shared memory block. If None, a unique name is generated.
+        """
+        luts: list[np.ndarray] = []
+        positions: dict[str, list[int]] = {}
+        n_rows = 0
+        for cname, cmap in tol_colors.colormaps.items():
+            luts.append(_build_lut(cmap, N))
+            positions[cname] = [n_rows, luts[-1].shape[0]]
+            n_rows += luts[-1].shape[0]
+
+        index = json.dumps(dict(N=N, luts=positions)).encode()
+        offset = _data_offset(len(index))
+        shm = SharedMemory(name=name, create=True, size=offset + n_rows * 4 * 8)
+        _HEADER.pack_into(shm.buf, 0, len(index))  # type: ignore[arg-type]
+        shm.buf[_HEADER.size : _HEADER.size + len(index)] = index  # type: ignore[index]
+        data = np.ndarray((n_rows, 4), dtype=np.float64, buffer=shm.buf, offset=offset)
+        np.concatenate(luts, out=data)
+        del data
+        return cls(shm, dict(N=N, luts=positions))
+
+    @classmethod
+    def attach(cls, name: str) -> "SharedLUTs":
+        """Attach to an existing block of lookup tables."""
+        if sys.version_info >= (3, 13):
+            shm = SharedMemory(name=name, track=False)
+        else:
+            shm = SharedMemory(name=name)
+            # Only the creating process should unlink the block when exiting
+            resource_tracker.unregister(shm._name, "shared_memory")  # type: ignore
+        size = _HEADER.unpack_from(shm.buf)[0]  # type: ignore[arg-type]
+        index = json.loads(bytes(shm.buf[_HEADER.size : _HEADER.size + size]))  # type: ignore[index]
+        return cls(shm, index)
+
+    def lut(self, name: str) -> np.ndarray:
+        """Return a read-only view on the lookup table of a colormap.
+
+        The table has shape ``(N+3, 4)``, with the last three rows containing the
+        "under", "over", and "bad" colors, as in matplotlib.
+        """
+        start, size = self.index[name]
+        return self.data[start : start + size]
+
+    def colormap(self, name: str) -> Colormap:
+        """Return a colormap using the shared lookup table.
+
+        The table is copied if the special colors of the colormap are modified.
+        """
+        lut = self.lut(name)
+        cmap: Colormap = dict.__getitem__(tol_colors.colormaps, name)
+        if cmap.N != lut.shape[0] - 3:
+            cmap = cmap.resampled(lut.shape[0] - 3)
+        if isinstance(cmap, LinearSegmentedColormap):
+            cls: type[Colormap] = _SharedLinearSegmentedColormap
+        else:
+            cls = _SharedListedColormap
+        new = cls.__new__(cls)
+        # complete definition, without the link to the reversed colormap
+        new.__dict__.update(cmap.__getstate__())  # type: ignore[call-overload]
+        new._lut = lut  # type: ignore[attr-defined]
+        new._isinit = True  # type: ignore[attr-defined]
+        return new
+
+    def install(self):
+        """Replace the colormaps of the module by ones using the shared tables.
+
+        Both :data:`tol_colors.colormaps` and module attributes are replaced, and
+        the colormaps registered in matplotlib are updated (matplotlib stores
+        copies, so only module attributes use the shared memory).
+        """
+        for name in self.index:
+            cmap = self.colormap(name)
+            dict.__setitem__(tol_colors.colormaps, name, cmap)
+            setattr(tol_colors, name, cmap)
+        tol_colors.register(force=True)
+
+    def close(self):
+        """Close access to the shared memory from this instance."""
+        self.data = None  # type: ignore
+        self.shm.close()
+
+    def unlink(self):
+        """Request the shared memory block to be destroyed."""
+        self.shm.unlink()
+
+
+def _build_lut(cmap: Colormap, N: int) -> np.ndarray:
+    if isinstance(cmap, LinearSegmentedColormap) and cmap.N != N:
+        cmap = cmap.resampled(N)
+    if not cmap._isinit:  # type: ignore[attr-defined]
+        cmap._init()  # type: ignore[attr-defined]
+    return cmap._lut  # type: ignore[attr-defined]
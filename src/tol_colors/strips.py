@@ -0,0 +1,142 @@
+"""Render colormaps as strips, in a single image.
+
+Colorbars and legends showing many colormaps are usually drawn with one axes and
+one ``imshow`` per colormap, which makes figures long to build. Here all strips are
+written into a single RGBA image from the cached byte lookup tables (see
+:func:`.colorize.byte_lut`), which is shown with a single ``imshow`` or written
+directly to a PNG file.
+
+>>> fig, ax = plt.subplots()
+>>> draw(ax, ["sunset", "sunset_discrete", "iridescent"])
+>>> save("catalogue.png", catalogue())
+"""
+
+from collections.abc import Mapping, Sequence
+from os import PathLike
+from typing import Any
+
+import numpy as np
+from matplotlib.axes import Axes
+from matplotlib.colors import Colormap
+from matplotlib.image import AxesImage
+
+import tol_colors
+from tol_colors import png
+from tol_colors.colorize import byte_lut
+
+Strips = Mapping[str, str | Colormap] | Sequence[str | Colormap]
+"""Colormaps to show: a mapping of labels to colormaps, or a sequence of colormaps
+labelled by their names."""
+
+
+def _labelled(cmaps: Strips) -> dict[str, str | Colormap]:
+    if isinstance(cmaps, Mapping):
+        return dict(cmaps)
+    return {cmap if isinstance(cmap, str) else cmap.name: cmap for cmap in cmaps}
+
+
+def catalogue() -> dict[str, Colormap]:
+    """Return the colormaps of tol_colors, as shown by ``python -m tol_colors``.
+
+    These are the colormaps that are not reversed, then the discrete rainbows of 1
+    to 23 colors.
+    """
+    out: dict[str, Colormap] = {
+        name: cmap
+        for name, cmap in tol_colors.colormaps.items()
+        if not (name.endswith("_r") or name == "rainbow")
+    }
+    for n in range(1, 24):
+        out[f"rainbow_discrete, {n}"] = tol_colors.rainbow_discrete(n)
+    return out
+
+
+def render(
+    cmaps: Strips, width: int = 256, height: int = 16, gap: int = 4
+) -> np.ndarray:
+    """Return an image of colormap strips, stacked from top to bottom.
+
+    Parameters
+    ----------
+    cmaps
+        Colormaps or colormap names (see :func:`.colorize.get_colormap`).
+    width
+        Width of the strips, in pixels. Each column takes the color of its
+        center.
+    height
+        Height of each strip, in pixels.
+    gap
+        Transparent space between strips, in pixels.
+
+    Returns
+    -------
+    Array of uint8 of shape ``(n * (height + gap) - gap, width, 4)``.
+    """
+    cmaps = list(_labelled(cmaps).values())
+    pitch = height + gap
+    image = np.zeros((max(len(cmaps) * pitch - gap, 0), width, 4), dtype=np.uint8)
+    x = (np.arange(width) + 0.5) / width
+    for i, cmap in enumerate(cmaps):
+        lut = byte_lut(cmap, N=None)
+        n = lut.shape[0] - 3
+        # the first row of the table is the under color
+        image[i * pitch : i * pitch + height] = lut[(x * n).astype(np.intp) + 1]
+    return image
+
+
+def draw(  # noqa: PLR0913, PLR0917
+    ax: Axes,
+    cmaps: Strips,
+    width: int = 256,
+    height: int = 16,
+    gap: int = 4,
+    **kwargs: Any,
+) -> AxesImage:
+    """Draw colormap strips in an axes, with their labels on the left.
+
+    The strips are drawn with a single :meth:`~matplotlib.axes.Axes.imshow`, that
+    fills the axes. The axes are hidden.
+
+    Parameters
+    ----------
+    ax
+        Axes to draw in.
+    cmaps, width, height, gap
+        See :func:`render`.
+    kwargs
+        Passed to :meth:`~matplotlib.axes.Axes.annotate` for the labels.
+    """
+    labels = list(_labelled(cmaps))
+    image = render(cmaps, width, height, gap)
+    pitch = height + gap
+    im = ax.imshow(
+        image,
+        extent=(0, 1, image.shape[0], 0),
+        aspect="auto",
+        interpolation="nearest",
+    )
+    ann_kw: dict[str, Any] = dict(
+        xycoords=("axes fraction", "data"),
+        xytext=(-3, 0),
+        textcoords="offset points",
+        ha="right",
+        va="center",
+    )
+    ann_kw.update(kwargs)
+    for i, label in enumerate(labels):
+        ax.annotate(label, (0, i * pitch + height / 2), **ann_kw)
+    ax.set_axis_off()
+    return im
+
+
+def save(  # noqa: PLR0913, PLR0917
+    fname: str | PathLike,
+    cmaps: Strips,
+    width: int = 256,
+    height: int = 16,
+    gap: int = 4,
+    compress_level: int = 6,
+):
+    """Write colormap strips to a PNG file, without labels, see :func:`render`."""
+    with open(fname, "wb") as f:
+        f.write(png.encode(render(cmaps, width, height, gap), compress_level))
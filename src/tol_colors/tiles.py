@@ -0,0 +1,108 @@
+"""Render scalar raster tiles to PNG.
+
+A :class:`TileRenderer` holds a colormap and a fixed normalization. It maps tiles of
+data (typically 256x256 or 512x512 for XYZ/WMTS servers) to colors with a
+precomputed lookup table and encodes them as PNG directly::
+
+    renderer = TileRenderer("YlOrBr", vmin=0.0, vmax=100.0)
+    png_bytes = renderer.render(tile)
+    png_bytes = await renderer.render_async(tile)
+
+For discrete colormaps (with at most 253 colors) the tiles are written as indexed
+PNG, with the colors of the colormap as palette.
+"""
+
+# ruff: noqa: N803
+
+import asyncio
+from collections.abc import Iterable
+from concurrent.futures import Executor
+
+import numpy as np
+from matplotlib.colors import Colormap, ListedColormap
+
+from tol_colors import png
+from tol_colors.colorize import byte_lut, get_colormap, indices
+
+_MAX_PALETTE = 256 - 3
+
+
+class TileRenderer:
+    """Colorize tiles of data and encode them as PNG.
+
+    Parameters
+    ----------
+    cmap
+        Colormap or colormap name, see :func:`.colorize.get_colormap`.
+    vmin, vmax
+        Values mapped to the first and last colors.
+    N
+        Number of colors for linear colormaps.
+    compress_level
+        Compression level of zlib, from 0 (no compression) to 9 (slowest). Low
+        levels are much faster, for slightly larger files.
+    palette
+        If True, write indexed PNG. If None (default), do so for discrete colormaps
+        (:class:`~matplotlib.colors.ListedColormap`).
+    """
+
+    def __init__(  # noqa: PLR0913
+        self,
+        cmap: str | Colormap,
+        vmin: float,
+        vmax: float,
+        N: int | None = 256,
+        *,
+        compress_level: int = 6,
+        palette: bool | None = None,
+    ):
+        cmap = get_colormap(cmap, N)
+        self.lut = byte_lut(cmap)
+        self.N = cmap.N
+        self.vmin = vmin
+        self.vmax = vmax
+        self.compress_level = compress_level
+
+        if palette is None:
+            palette = isinstance(cmap, ListedColormap) and self.N <= _MAX_PALETTE
+        if palette and self.N > _MAX_PALETTE:
+            raise ValueError(
+                f"Palette PNG require at most {_MAX_PALETTE} colors (got {self.N})."
+            )
+        self.palette = palette
+
+    def colorize(self, tile: np.ndarray) -> np.ndarray:
+        """Return the RGBA bytes of a tile."""
+        return self.lut.take(indices(tile, self.vmin, self.vmax, self.N), axis=0)
+
+    def render(self, tile: np.ndarray) -> bytes:
+        """Return a tile as PNG.
+
+        Parameters
+        ----------
+        tile
+            2D array of data. NaN or masked values are given the *bad* color.
+        """
+        if self.palette:
+            idx = indices(tile, self.vmin, self.vmax, self.N, dtype=np.uint8)
+            return png.encode_indexed(idx, self.lut, self.compress_level)
+        return png.encode(self.colorize(tile), self.compress_level)
+
+    async def render_async(
+        self, tile: np.ndarray, executor: Executor | None = None
+    ) -> bytes:
+        """Return a tile as PNG, rendered in an executor.
+
+        NumPy and zlib release the GIL, so a thread pool (the default executor of the
+        event loop, if *executor* is None) renders tiles in parallel.
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(executor, self.render, tile)
+
+    async def render_many(
+        self, tiles: Iterable[np.ndarray], executor: Executor | None = None
+    ) -> list[bytes]:
+        """Render tiles concurrently, see :meth:`render_async`."""
+        return await asyncio.gather(
+            *(self.render_async(tile, executor) for tile in tiles)
+        )
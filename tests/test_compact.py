@@ -0,0 +1,68 @@
+"""Test compact colormaps."""
+
+import matplotlib.pyplot as plt
+import numpy as np
+import pytest
+
+import tol_colors as tc
+from tol_colors.compact import CompactColormap, compact, memory_footprint
+
+x = np.array([-1.0, 0.0, 0.1, 0.5, 0.99, 1.0, 2.0, np.nan])
+
+
+@pytest.mark.parametrize("dtype", ["float32", "uint8"])
+def test_values(dtype):
+    ref = tc.colormaps["sunset"].with_extremes(under="k", over="w")
+    cmap = compact(ref, dtype=dtype, N=512)
+    ref = ref.resampled(512)
+    assert isinstance(cmap, CompactColormap)
+    assert cmap.dtype == np.dtype(dtype)
+    assert cmap.nbytes == 515 * 4 * np.dtype(dtype).itemsize
+
+    np.testing.assert_allclose(cmap(x), ref(x), atol=1 / 255)
+    if dtype == "uint8":
+        np.testing.assert_array_equal(cmap(x, bytes=True), ref(x, bytes=True))
+    assert cmap(x).dtype == np.float64
+    assert cmap(x, bytes=True).dtype == np.uint8
+    assert len(cmap(0.5)) == 4  # noqa: PLR2004
+
+    masked = np.ma.masked_array(x, mask=[1, 0, 0, 0, 0, 0, 0, 0])
+    np.testing.assert_allclose(cmap(masked)[0], ref.get_bad(), atol=1 / 255)
+
+
+def test_extremes():
+    cmap = compact(tc.colormaps["BuRd_discrete"])
+    assert cmap.N == tc.BuRd_discrete.N
+    np.testing.assert_allclose(cmap.get_bad(), tc.BuRd_discrete.get_bad(), atol=1e-2)
+
+    new = cmap.with_extremes(over="r")
+    np.testing.assert_array_equal(new.get_over(), [1, 0, 0, 1])
+    assert not np.array_equal(cmap.get_over(), new.get_over())
+
+    transparent = cmap.with_alpha(0.0)
+    assert (transparent(x)[:, 3] == 0).all()
+    assert (cmap(x[1:-1])[:, 3] == 1).all()
+
+    rev = cmap.reversed()
+    np.testing.assert_array_equal(rev(np.arange(cmap.N)), cmap(np.arange(cmap.N))[::-1])
+    assert rev.resampled(64).N == 64  # noqa: PLR2004
+
+
+def test_matplotlib():
+    cmap = compact(tc.YlOrBr, dtype="float32")
+    fig, ax = plt.subplots()
+    ax.imshow(np.random.rand(8, 8), cmap=cmap)
+    fig.colorbar(ax.images[0])
+    fig.canvas.draw()
+    plt.close(fig)
+
+
+def test_footprint():
+    cmaps = dict(
+        a=compact(tc.sunset, N=1024),
+        b=tc.sunset.resampled(1024),
+        c=tc.sunset.resampled(1024),
+    )
+    cmaps["b"](0.5)
+    assert memory_footprint(cmaps) == dict(a=1027 * 4, b=1027 * 4 * 8, c=0)
+    assert set(memory_footprint()) == set(tc.colormaps)
@@ -0,0 +1,67 @@
+"""Test scoring of colormaps in color vision deficiencies."""
+
+import matplotlib
+import numpy as np
+import pytest
+from matplotlib.colors import ListedColormap
+
+import tol_colors as tc
+from tol_colors import cvd
+
+
+def test_simulate():
+    rgb = np.random.default_rng(0).random((10, 3))
+    np.testing.assert_allclose(cvd.simulate(rgb, "normal"), rgb, atol=1e-12)
+    # grays are unchanged
+    gray = np.linspace(0, 1, 5)[:, None].repeat(3, axis=1)
+    for vision in cvd.VISIONS:
+        np.testing.assert_allclose(cvd.simulate(gray, vision), gray, atol=2e-3)
+    # red and green are confused in deuteranopia
+    red, green = cvd.simulate(
+        np.array([[0.8, 0.3, 0.2], [0.4, 0.5, 0.2]]), "deuteranopia"
+    )
+    assert np.abs(red - green).max() < 0.2  # noqa: PLR2004
+    with pytest.raises(ValueError):
+        cvd.simulate(rgb, "achromatopsia")
+
+
+def test_score():
+    cvd.clear_cache()
+    scores = cvd.score(["tol.iridescent", "tol.sunset_r", "jet", "viridis", "gray"])
+    assert len(scores) == 5  # noqa: PLR2004
+    assert scores.names == ["iridescent", "sunset_r", "jet", "viridis", "gray"]
+    assert scores.monotonic.shape == scores.min_step.shape == (5, len(cvd.VISIONS))
+
+    # tol colormaps are their own closest
+    assert scores.closest[:2] == ["iridescent", "sunset_r"]
+    np.testing.assert_allclose(scores.distance[:2], 0, atol=1e-12)
+    np.testing.assert_array_equal(scores.min_step[:2], scores.reference_min_step[:2])
+    assert scores.monotonic[0].all() and not scores.monotonic[1].any()
+    assert scores.monotonic[[3, 4]].all()
+
+    assert scores.failed.tolist() == [False, False, True, False, False]
+    assert scores.failures(ratio=2.0)[:2].all()
+
+
+def test_discrete():
+    # steps inside a color of a discrete colormap are ignored
+    cmap = ListedColormap(["#000000", "#777777", "#FFFFFF"])
+    scores = cvd.score([cmap, tc.colormaps["BuRd_discrete"]])
+    assert scores.monotonic[0].all()
+    assert (scores.min_step > 0.05).all()  # noqa: PLR2004
+
+
+def test_cache():
+    cvd.clear_cache()
+    jet = matplotlib.colormaps["jet"]
+    first = cvd.score([jet, "viridis"])
+    assert len(cvd._cache) == 2  # noqa: PLR2004
+    # copies have the same samples, and are not scored again
+    second = cvd.score([jet.copy(), "viridis", "magma"])
+    assert len(cvd._cache) == 3  # noqa: PLR2004
+    np.testing.assert_array_equal(second.min_step[:2], first.min_step)
+    assert second.closest[:2] == first.closest
+
+    # samples depend on N
+    cvd.score([jet], N=32)
+    assert len(cvd._cache) == 4  # noqa: PLR2004
@@ -0,0 +1,84 @@
+"""Test export of lookup tables."""
+
+import sys
+
+import numpy as np
+import pytest
+
+import tol_colors as tc
+from tol_colors.export import LUTTable, colormap_table, colorset_table
+from tol_colors.shared import SharedLUTs
+
+
+def test_colormap_table():
+    table = colormap_table(N=64)
+    assert list(table) == list(tc.colormaps)
+    assert table.data.flags.c_contiguous and not table.data.flags.writeable
+    assert table.offsets[-1] == table.data.shape[0]
+
+    sunset = table["sunset"]
+    assert sunset.shape == (64 + 3, 4)
+    assert np.shares_memory(sunset, table.data)
+    x = np.linspace(0, 1, 64)
+    np.testing.assert_allclose(sunset[:64], tc.sunset.resampled(64)(x))
+    np.testing.assert_allclose(sunset[-1], tc.sunset.get_bad())
+    discrete = table["BuRd_discrete_r"]
+    n = tc.BuRd_discrete_r.N
+    np.testing.assert_allclose(discrete[:n], tc.BuRd_discrete_r(np.arange(n)))
+
+    table = colormap_table(N=64, bytes=True)
+    assert table.data.dtype == np.uint8
+    np.testing.assert_array_equal(
+        table["sunset"][:64], tc.sunset.resampled(64)(x, bytes=True)
+    )
+
+
+def test_colorset_table():
+    table = colorset_table(bytes=True)
+    for name, cset in tc.colorsets.items():
+        np.testing.assert_array_equal(table[name], cset.rgba8)
+    assert table.name_index().tolist()[:8] == [0] * 7 + [1]
+    np.testing.assert_allclose(colorset_table()["bright"][:, :3], tc.bright.rgb)
+
+
+def test_buffer():
+    table = colorset_table(bytes=True)
+    view = memoryview(table.data)
+    assert view.format == "B" and view.shape == table.data.shape
+    assert view.c_contiguous and view.readonly
+    assert np.asarray(table) is table.data
+    if sys.version_info >= (3, 12):
+        assert memoryview(table).shape == view.shape
+
+    with pytest.raises(ValueError):
+        LUTTable(table.data[:, :3], table.names, table.offsets)
+    with pytest.raises(ValueError):
+        LUTTable(table.data, table.names, table.offsets[:-1])
+
+
+def test_shared():
+    luts = SharedLUTs.create(N=32)
+    try:
+        table = LUTTable.from_shared(luts)
+        assert sorted(table) == sorted(tc.colormaps)
+        assert np.shares_memory(table.data, luts.data)
+        for name in table:
+            np.testing.assert_array_equal(table[name], luts.lut(name))
+    finally:
+        del table
+        luts.close()
+        luts.unlink()
+
+
+def test_arrow():
+    pa = pytest.importorskip("pyarrow")
+    table = colormap_table(N=16, bytes=True)
+    arrow = table.to_arrow()
+    assert isinstance(arrow, pa.Table)
+    assert arrow.num_rows == table.data.shape[0]
+    names = arrow.column("name").to_pylist()
+    assert names[0] == table.names[0] and names[-1] == table.names[-1]
+    rgba = arrow.column("rgba").chunk(0).flatten().to_numpy()
+    assert np.shares_memory(rgba, table.data)
+    offsets = arrow.schema.metadata[b"offsets"].decode().split(",")
+    assert [int(o) for o in offsets] == table.offsets.tolist()
@@ -0,0 +1,53 @@
+"""Test conversions of hex strings."""
+
+import numpy as np
+import pytest
+from matplotlib.colors import to_hex, to_rgba
+
+import tol_colors as tc
+
+
+def test_hex_to_rgb():
+    colors = list(tc.land_cover)
+    np.testing.assert_allclose(tc.hex_to_rgb(colors), tc.land_cover.rgb)
+    assert tc.hex_to_rgb(colors, bytes=True).dtype == np.uint8
+
+    # any shape, str or bytes, optional hash and alpha, lowercase
+    colors = np.array([["#4477AA", "ee667780"], ["#228833FF", "ccbb44"]])
+    rgba = tc.hex_to_rgb(colors, alpha=True)
+    assert rgba.shape == (2, 2, 4)
+    expected = [to_rgba(c if c[0] == "#" else f"#{c}") for c in colors.flat]
+    np.testing.assert_allclose(rgba.reshape(-1, 4), expected)
+    np.testing.assert_array_equal(
+        tc.hex_to_rgb(colors.astype("S"), alpha=True, bytes=True),
+        np.round(rgba * 255),
+    )
+    assert tc.hex_to_rgb("#FFFFFF").tolist() == [1.0, 1.0, 1.0]
+
+    for bad in ["#12345", "#1234567", "#123456789", "#12345G", "#12345é", "red", ""]:
+        with pytest.raises(ValueError, match="Invalid hex color"):
+            tc.hex_to_rgb(["#000000", bad])
+    with pytest.raises(TypeError):
+        tc.hex_to_rgb([0.0, 1.0])
+
+
+def test_rgb_to_hex():
+    rgb = np.random.default_rng(0).random((50, 4))
+    assert tc.rgb_to_hex(rgb).tolist() == [to_hex(c).upper() for c in rgb]
+    assert tc.rgb_to_hex(rgb, keep_alpha=True).tolist() == [
+        to_hex(c, keep_alpha=True).upper() for c in rgb
+    ]
+    assert tc.rgb_to_hex(tc.bright.rgba8).tolist() == list(tc.bright)
+    assert tc.rgb_to_hex(tc.bright.rgb.reshape(7, 1, 3)).shape == (7, 1)
+    assert tc.rgb_to_hex([0.0, 0.5, 1.0]) == "#0080FF"
+
+    # round trip
+    colors = tc.rgb_to_hex(rgb, keep_alpha=True)
+    np.testing.assert_array_equal(
+        tc.hex_to_rgb(colors, alpha=True, bytes=True), np.round(rgb * 255)
+    )
+
+    with pytest.raises(ValueError):
+        tc.rgb_to_hex([[0.0, 0.5]])
+    with pytest.raises(ValueError):
+        tc.rgb_to_hex([[0.0, 0.5, 2.0]])
@@ -0,0 +1,76 @@
+"""Test indexed output."""
+
+import io
+
+import numpy as np
+import pytest
+from PIL import Image
+
+import tol_colors as tc
+from tol_colors import indexed
+from tol_colors.colorize import colorize
+
+rng = np.random.default_rng(0)
+
+
+def decode(b: bytes) -> np.ndarray:
+    return np.asarray(Image.open(io.BytesIO(b)).convert("RGBA"))
+
+
+def test_palette():
+    table = indexed.palette("land_cover")
+    assert table.shape == (len(tc.land_cover), 4)
+    assert tuple(table[0, :3]) == tuple(
+        int(tc.land_cover[0][i : i + 2], 16) for i in (1, 3, 5)
+    )
+    np.testing.assert_array_equal(indexed.palette(tc.land_cover), table)
+
+    cmap = tc.rainbow_discrete(7)
+    np.testing.assert_array_equal(indexed.palette(cmap), cmap(np.arange(7), bytes=True))
+    assert indexed.palette("BuRd_discrete").shape == (tc.BuRd_discrete.N, 4)
+    assert indexed.palette("YlOrBr").shape == (256, 4)
+
+
+@pytest.mark.parametrize("colors", ["land_cover", "bright", "BuRd_discrete"])
+def test_encode(colors, tmp_path):
+    table = indexed.palette(colors)
+    classes = rng.integers(0, table.shape[0], (20, 30))
+    out = indexed.encode(classes, colors)
+    assert Image.open(io.BytesIO(out)).mode == "P"
+    np.testing.assert_array_equal(decode(out), table[classes])
+
+    masked = np.ma.masked_where(classes == 0, classes)
+    ref = table[classes]
+    ref[classes == 0] = 0
+    np.testing.assert_array_equal(decode(indexed.encode(masked, colors)), ref)
+
+    indexed.save(tmp_path / "out.png", classes, colors)
+    assert (tmp_path / "out.png").read_bytes() == out
+
+    with pytest.raises(ValueError):
+        indexed.encode(classes + 1, colors)
+    with pytest.raises(ValueError):
+        indexed.encode(classes - 1, colors)
+    with pytest.raises(ValueError):
+        indexed.encode(classes + 0.5, colors)
+    # integer values in a float array are accepted
+    assert indexed.encode(classes.astype(float), colors) == out
+
+
+def test_encode_full_palette():
+    classes = rng.integers(0, 256, (20, 30))
+    out = indexed.encode(classes, "YlOrBr")
+    np.testing.assert_array_equal(decode(out), indexed.palette("YlOrBr")[classes])
+    with pytest.raises(ValueError, match="255"):
+        indexed.encode(np.ma.masked_where(classes == 0, classes), "YlOrBr")
+
+
+def test_quantize():
+    data = rng.normal(0, 3, (16, 16))
+    data[0, 0] = np.nan
+    idx, table = indexed.quantize(data, "BuRd_discrete", -2, 2)
+    assert idx.dtype == np.uint8
+    np.testing.assert_array_equal(table[idx], colorize(data, "BuRd_discrete", -2, 2))
+
+    with pytest.raises(ValueError):
+        indexed.quantize(data, "YlOrBr", -2, 2)
@@ -0,0 +1,78 @@
+"""Test instrumentation."""
+
+import os
+import subprocess
+import sys
+
+import numpy as np
+import pytest
+
+import tol_colors as tc
+from tol_colors import instrumentation
+from tol_colors.colorize import colorize, colorize_many
+
+
+@pytest.fixture
+def enabled():
+    instrumentation.reset()
+    instrumentation.enable()
+    yield
+    instrumentation.disable()
+    instrumentation.reset()
+
+
+def test_disabled():
+    instrumentation.reset()
+    assert not instrumentation.is_enabled()
+    tc.colormaps["sunset"]
+    assert instrumentation.snapshot() == {}
+
+
+def test_counts(enabled):
+    for _ in range(3):
+        tc.colormaps["sunset"]
+    tc.rainbow_discrete(5)
+    colorize(np.zeros(4), "PRGn", 0, 1, N=17)
+    colorize_many([np.zeros(4)], "PRGn", 0, 1)
+    with instrumentation.timer("custom"):
+        pass
+
+    stats = instrumentation.snapshot()
+    assert stats["colormaps.getitem"]["count"] >= 3  # noqa: PLR2004
+    assert stats["rainbow_discrete"]["count"] == 1
+    assert stats["lut.bytes"]["count"] == 2  # noqa: PLR2004
+    assert stats["colorize"]["count"] == 1
+    assert stats["colorize_many"]["count"] == 1
+    assert stats["custom"]["count"] == 1
+    assert all(s["time"] >= 0 for s in stats.values())
+
+    text = instrumentation.prometheus()
+    assert "# TYPE tol_colors_calls_total counter" in text
+    assert 'tol_colors_calls_total{event="rainbow_discrete"} 1' in text
+
+    instrumentation.disable()
+    tc.rainbow_discrete(5)
+    assert instrumentation.snapshot()["rainbow_discrete"]["count"] == 1
+
+
+def test_logging(enabled, caplog):
+    tc.rainbow_discrete(5)
+    with caplog.at_level("INFO", logger="tol_colors.instrumentation"):
+        instrumentation.log_snapshot()
+    assert "rainbow_discrete: 1 calls" in caplog.text
+
+
+def test_env_var():
+    code = (
+        "import tol_colors.instrumentation as i, tol_colors;"
+        "s = i.snapshot();"
+        "print(s['module_init']['count'], s['module_init.colormaps']['count'])"
+    )
+    out = subprocess.run(
+        [sys.executable, "-c", code],
+        env=os.environ | {"TOL_COLORS_INSTRUMENT": "1"},
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    assert out.stdout.split() == ["1", "1"]
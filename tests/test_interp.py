@@ -0,0 +1,86 @@
+"""Test interpolation engine."""
+
+import numpy as np
+import pytest
+from matplotlib.colors import ListedColormap
+
+import tol_colors as tc
+from tol_colors import interp
+
+linear = [
+    "sunset", "nightfall", "BuRd", "PRGn", "YlOrBr", "WhOrBr", "iridescent",
+    "incandescent", "rainbow", "rainbow_WhBr", "rainbow_WhRd", "rainbow_PuRd",
+    "rainbow_PuBr",
+]  # fmt: skip
+
+
+@pytest.mark.parametrize("name", linear + [f"{n}_r" for n in linear])
+def test_same_as_matplotlib(name):
+    for n in [2, 256, 1000]:
+        cmap = tc.colormaps[name].resampled(n)
+        np.testing.assert_allclose(
+            interp.interpolate(name, n), cmap(np.arange(n)), rtol=0, atol=1e-12
+        )
+
+
+def test_nodes():
+    colors, bad = interp.nodes("BuRd_r")
+    assert colors[0] == tc._colors["colormaps"]["BuRd"]["colors"][-1]
+    assert bad == tc._colors["colormaps"]["BuRd"]["bad"]
+    with pytest.raises(KeyError):
+        interp.nodes("BuRd_discrete")
+
+
+def test_spaces():
+    rgb = np.linspace(0, 1, 11)
+    np.testing.assert_allclose(interp.linear_to_srgb(interp.srgb_to_linear(rgb)), rgb)
+
+    # endpoints are kept, midpoint is brighter in linear-light space
+    lut = interp.interpolate(["black", "white"], 3, space="linear")
+    np.testing.assert_allclose(lut[[0, -1], :3], [[0, 0, 0], [1, 1, 1]])
+    assert lut[1, 0] > 0.5  # noqa: PLR2004
+
+    with pytest.raises(ValueError):
+        interp.interpolate("sunset", space="unknown")
+
+
+def test_colormap():
+    cmap = interp.colormap("YlOrBr_r", N=64, space="linear")
+    assert isinstance(cmap, ListedColormap)
+    assert cmap.N == 64  # noqa: PLR2004
+    assert cmap.name == "YlOrBr_r"
+    np.testing.assert_allclose(cmap.get_bad(), tc.YlOrBr_r.get_bad())
+
+    cmap = interp.from_list("single", ["red"], N=4)
+    np.testing.assert_array_equal(cmap(np.arange(4)), [[1, 0, 0, 1]] * 4)
+
+
+@pytest.mark.parametrize("space", ["oklab", "cam02ucs"])
+def test_perceptual(space):
+    to_space, from_space = interp.SPACES[space]
+    rgb = np.random.default_rng(0).random((100, 3))
+    np.testing.assert_allclose(from_space(to_space(rgb)), rgb, atol=1e-10)
+
+    # steps are more uniform than when interpolating in sRGB
+    def steps(lut):
+        return np.linalg.norm(np.diff(to_space(lut[:, :3]), axis=0), axis=1)
+
+    for name in ["sunset", "nightfall", "iridescent"]:
+        uniform = steps(interp.lut(name, 1024, space))
+        srgb = steps(interp.lut(name, 1024))
+        assert uniform.std() < srgb.std()
+
+
+def test_cam02ucs_reference():
+    cspace_convert = pytest.importorskip("colorspacious").cspace_convert
+    rgb = np.random.default_rng(0).random((100, 3))
+    np.testing.assert_allclose(
+        interp.srgb_to_cam02ucs(rgb), cspace_convert(rgb, "sRGB1", "CAM02-UCS")
+    )
+
+
+def test_cache():
+    lut = interp.lut("sunset", 512, "oklab")
+    assert interp.lut("sunset", 512, "oklab") is lut
+    assert not lut.flags.writeable
+    assert interp.colormap("sunset", 512, "oklab").N == 512  # noqa: PLR2004
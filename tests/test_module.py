@@ -1,10 +1,15 @@
 """Test all module."""
 
 import os
+import subprocess
+import sys
+import warnings
+from concurrent.futures import ThreadPoolExecutor
 
 import matplotlib.pyplot as plt
+import numpy as np
 import pytest
-from matplotlib.colors import LinearSegmentedColormap, ListedColormap
+from matplotlib.colors import LinearSegmentedColormap, ListedColormap, to_rgb
 
 import tol_colors as tc
 
@@ -49,6 +54,25 @@ class TestColorsets:
         assert tc.dark.dark_green == "#225522"
         assert tc.land_cover.mixed_forest == "#55AA22"
 
+    def test_arrays(self):
+        for cset in tc.colorsets.values():
+            n = len(cset)
+            assert cset.rgb.shape == (n, 3)
+            assert cset.rgba8.shape == (n, 4) and cset.rgba8.dtype == np.uint8
+            assert cset.packed.shape == (n,) and cset.packed.dtype == np.uint32
+            np.testing.assert_allclose(cset.rgb, [to_rgb(c) for c in cset])
+            for color, rgba, packed in zip(cset, cset.rgba8, cset.packed, strict=True):
+                assert color == f"#{bytes(rgba[:3]).hex().upper()}"
+                assert packed == int(color[1:], 16) << 8 | 0xFF
+            # built once, read-only
+            assert cset.rgba8 is cset.rgba8
+            with pytest.raises(ValueError):
+                cset.rgb[0, 0] = 1.0
+
+        red = tc.bright.rgba8[tc.Bright._fields.index("red")]
+        assert red.tolist() == [238, 102, 119, 255]
+        assert tc.bright._replace(red="#000000").rgba8[1].tolist() == [0, 0, 0, 255]
+
     def test_set_default(self, capfd, tmp_path):
         def config_line(cset):
             colors = [f"'{c[1:]}'" for c in tc.colorsets[cset]]
@@ -91,6 +115,101 @@ class TestColorsets:
             lines = fd.readlines()
             assert lines == [config_line("pale") + "\n", "\n", "font.size : 9\n"]
 
+        # commented lines and other cyclers are not replaced
+        lines = [
+            "#axes.prop_cycle : cycler('color', ['000000'])\n",
+            "axes.prop_cycle : cycler('linestyle', ['-', '--'])\n",
+        ]
+        with open(fname, "w") as fd:
+            fd.writelines(lines)
+        tc.set_default_colors("muted", fname=fname)
+        with open(fname) as fd:
+            assert fd.readlines() == lines + [config_line("muted") + "\n"]
+
+    def test_set_default_many(self, tmp_path):
+        fnames = [tmp_path / f"dir{i}" / "matplotlibrc" for i in range(8)]
+        written = tc.set_default_colors_many(fnames, "vibrant", max_workers=4)
+        assert list(written.values()) == [True] * 8
+        line = tc._prop_cycle_line("vibrant")
+        for fname in fnames:
+            with open(fname) as fd:
+                assert fd.readlines() == [line]
+
+        # unchanged files are not rewritten
+        mtime = os.stat(fnames[0]).st_mtime_ns
+        fnames[1].write_text("font.size : 9")
+        written = tc.set_default_colors_many(fnames, "vibrant")
+        assert written[str(fnames[0])] is False
+        assert written[str(fnames[1])] is True
+        assert os.stat(fnames[0]).st_mtime_ns == mtime
+        assert fnames[1].read_text() == "font.size : 9\n" + line
+        assert not [f for f in tmp_path.rglob(".matplotlibrc.*")]
+
+    def test_styles(self):
+        for name in self.csets_type:
+            style = tc.style(name)
+            assert f"tol.{name}" in plt.style.available
+            assert style["axes.prop_cycle"].by_key()["color"] == list(
+                tc.colorsets[name]
+            )
+
+        with plt.style.context("tol.high_contrast"):
+            cycle = plt.rcParams["axes.prop_cycle"].by_key()["color"]
+            assert cycle == list(tc.high_contrast)
+
+        # cached style is not modified
+        tc.style("bright")["axes.prop_cycle"] = None
+        assert tc.style("bright")["axes.prop_cycle"] is not None
+
+        plt.style.reload_library()
+        assert "tol.bright" not in plt.style.available
+        tc.register_styles()
+        assert "tol.bright" in plt.style.available
+
+        # stylesheets are not read on import, only on first use
+        cmd = (
+            "import sys, tol_colors as tc;"
+            "assert 'matplotlib.style' not in sys.modules;"
+            "tc.style();"
+            "import matplotlib.pyplot as plt;"
+            "plt.style.use('tol.muted')"
+        )
+        subprocess.run([sys.executable, "-c", cmd], check=True)
+
+    def test_cycler(self):
+        for name in self.csets_type:
+            assert tc.cycler(name).by_key()["color"] == list(tc.colorsets[name])
+        assert tc.cycler("high-contrast") is tc.cycler("high_contrast")
+        assert tc.style("bright")["axes.prop_cycle"] is tc.cycler("bright")
+
+        cycle = tc.cycler("vibrant", n=10)
+        assert len(cycle) == 10  # noqa: PLR2004
+        assert cycle.by_key()["color"][7:] == list(tc.vibrant)[:3]
+
+        # all combinations of colors and line styles
+        cycle = tc.cycler("bright", with_linestyles=True)
+        assert len(cycle) == 28  # noqa: PLR2004
+        combos = {(p["color"], p["linestyle"]) for p in cycle}
+        assert len(combos) == 28  # noqa: PLR2004
+
+        # even when the numbers of values have common factors
+        for name in ["muted", "vibrant"]:
+            n_colors = len(tc.colorsets[name])
+            cycle = tc.cycler(name, with_linestyles=True, with_markers=True)
+            assert len(cycle) == n_colors * 4 * 7
+            combos = {(p["color"], p["linestyle"], p["marker"]) for p in cycle}
+            assert len(combos) == len(cycle)
+            cycle = tc.cycler(name, with_markers=True)
+            assert len({(p["color"], p["marker"]) for p in cycle}) == n_colors * 7
+
+        cycle = tc.cycler("muted", n=12, with_linestyles=True, with_markers=True)
+        assert cycle.keys == {"color", "linestyle", "marker"}
+        assert [p["linestyle"] for p in cycle] == ["-"] * 10 + ["--"] * 2
+        assert {p["marker"] for p in cycle} == {"o"}
+
+        with pytest.raises(ValueError):
+            tc.cycler("bright", n=0)
+
 
 class TestColormaps:
     cmaps_discrete = ["sunset", "nightfall", "BuRd", "PRGn", "YlOrBr", "WhOrBr"]
@@ -148,6 +267,30 @@ class TestColormaps:
         for name in self.get_all():
             assert f"tol.{name}" in plt.colormaps
 
+    def test_register(self):
+        tc.register()  # already registered, does not raise
+        tc.unregister()
+        for name in self.get_all():
+            assert f"tol.{name}" not in plt.colormaps
+        with ThreadPoolExecutor(4) as executor:
+            for _ in range(8):
+                executor.submit(tc.register)
+        self.test_registered()
+        with warnings.catch_warnings():
+            warnings.simplefilter("error", UserWarning)
+            tc.register(force=True)
+        self.test_registered()
+
+        # module can be reloaded
+        cmd = "import importlib, tol_colors; importlib.reload(tol_colors)"
+        subprocess.run([sys.executable, "-c", cmd], check=True)
+
+    def test_preload(self):
+        tc.preload()
+        for name in self.get_all():
+            assert tc.colormaps[name]._isinit
+            assert plt.colormaps[f"tol.{name}"]._isinit
+
     def test_discrete_rainbow(self):
         for i in range(1, 24):
             cmap = tc.rainbow_discrete(i)
@@ -0,0 +1,159 @@
+"""Test palette bundles of other packages."""
+
+import json
+import sys
+
+import matplotlib.pyplot as plt
+import numpy as np
+import pytest
+
+import tol_colors as tc
+from tol_colors import indexed, plugins
+from tol_colors.colorize import get_colormap
+from tol_colors.server import Server
+
+bundle = {
+    "colorsets": {"corporate": {"primary": "#003366", "secondary": "#FF9900"}},
+    "colormaps": {
+        "ocean": {"colors": ["#E0F3F8", "#003366"], "bad": "#FF0000"},
+        "steps": {"colors": ["#003366", "#FF9900", "#DDDDDD"], "discrete": True},
+    },
+}
+
+
+@pytest.fixture
+def installed(tmp_path, monkeypatch):
+    """Install a distribution with two bundles: a JSON file and a callable."""
+    package = tmp_path / "corporate_palettes"
+    package.mkdir()
+    (package / "__init__.py").write_text(
+        "def generate():\n"
+        "    mono = {'black': '#000000'}\n"
+        "    return {'colorsets': {'mono': mono, 'bright': mono},"
+        " 'colormaps': {'sunset': ['#000000', '#FFFFFF']}}\n"
+    )
+    (package / "palettes.json").write_text(json.dumps(bundle))
+    dist = tmp_path / "corporate_palettes-1.0.dist-info"
+    dist.mkdir()
+    (dist / "METADATA").write_text("Name: corporate_palettes\nVersion: 1.0\n")
+    (dist / "entry_points.txt").write_text(
+        "[tol_colors.palettes]\n"
+        "corporate = corporate_palettes:palettes.json\n"
+        "generated = corporate_palettes:generate\n"
+    )
+    monkeypatch.syspath_prepend(str(tmp_path))
+    monkeypatch.setenv(plugins.CACHE_ENV_VAR, str(tmp_path / "cache"))
+    plugins.index.cache_clear()
+    yield tmp_path
+    for name in list(plugins._loaded):
+        plugins.unload(name)
+    plugins.index.cache_clear()
+    sys.modules.pop("corporate_palettes", None)
+
+
+def test_index(installed):
+    assert list(plugins.index()) == ["corporate", "generated"]
+    assert "corporate_palettes" not in sys.modules
+    assert not plugins._loaded
+
+
+def test_lazy_loading(installed):
+    n_colormaps = len(tc.colormaps)
+    cset = tc.colorsets["corporate"]
+    assert cset.primary == "#003366"
+    assert list(plugins._loaded) == ["corporate"]
+    assert "corporate" in tc.colorsets
+
+    cmap = tc.colormaps["ocean"]
+    assert tc.colormaps["ocean"] is not cmap
+    assert "tol.ocean" in plt.colormaps
+    names = ["ocean", "ocean_r", "steps", "steps_r", "steps_discrete"]
+    assert all(name in tc.colormaps for name in names + ["steps_discrete_r"])
+    assert len(tc.colormaps) == n_colormaps + 6
+    assert tc.colormaps["steps_discrete"].N == 3  # noqa: PLR2004
+
+    # callables are loaded when needed, conflicting names are skipped
+    with pytest.warns(UserWarning, match="Colorset 'bright' of bundle 'generated'"):
+        assert tc.colorsets["mono"].black == "#000000"
+    assert tc.colorsets["bright"] is tc.bright
+    assert tc.colormaps["sunset"].N == tc.sunset.N
+
+    with pytest.raises(KeyError):
+        tc.colormaps["missing"]
+    with pytest.raises(KeyError):
+        tc.colorsets["missing"]
+
+    plugins.unload("corporate")
+    assert "ocean" not in tc.colormaps
+    assert "tol.ocean" not in plt.colormaps
+    assert "corporate" not in tc.colorsets
+
+
+def test_lookups(installed):
+    # lookups by name load bundles
+    assert get_colormap("tol.ocean").name == "ocean"
+    assert "corporate" in plugins._loaded
+    plugins.unload("corporate")
+    assert indexed.palette("corporate").shape == (2, 4)
+    plugins.unload("corporate")
+    _, _, payload = Server().palette("corporate")
+    assert json.loads(payload)["colors"] == ["#003366", "#FF9900"]
+
+
+def test_colormaps(installed):
+    values = np.array([-1.0, 0.0, 0.3, 0.5, 1.0, 2.0, np.nan])
+    reference = tc._make_linear_cmap("ocean", ["#E0F3F8", "#003366"], "#FF0000")
+    loaded = plugins.load("corporate").colormaps
+    np.testing.assert_allclose(loaded["ocean"](values), reference(values))
+    np.testing.assert_allclose(loaded["ocean_r"](values), reference.reversed()(values))
+    discrete = tc._make_discrete_cmap(
+        "steps", bundle["colormaps"]["steps"]["colors"], "#FFFFFF"
+    )
+    np.testing.assert_allclose(
+        loaded["steps_discrete_r"](values), discrete.reversed()(values)
+    )
+
+
+def test_cache(installed, monkeypatch):
+    cache = installed / "cache"
+    first = plugins.load("corporate")
+    files = list(cache.glob("*.npz"))
+    assert len(files) == 1
+
+    # second process: the cached bundle is read, without compiling it
+    plugins.unload("corporate")
+
+    def fail(data):
+        raise AssertionError("bundle compiled again")
+
+    with monkeypatch.context() as m:
+        m.setattr(plugins, "compile_bundle", fail)
+        second = plugins.load("corporate")
+    assert second is not first
+    assert second.colormaps["ocean"]._isinit
+    np.testing.assert_array_equal(
+        second.colormaps["ocean"]._lut, first.colormaps["ocean"]._lut
+    )
+    assert second.colorsets["corporate"] == first.colorsets["corporate"]
+
+    # corrupted files and modified bundles are compiled again
+    plugins.unload("corporate")
+    files[0].write_bytes(b"not a zip")
+    plugins.load("corporate")
+    plugins.unload("corporate")
+    bundle["colorsets"]["corporate"]["primary"] = "#000000"
+    try:
+        (installed / "corporate_palettes" / "palettes.json").write_text(
+            json.dumps(bundle)
+        )
+        assert plugins.load("corporate").colorsets["corporate"].primary == "#000000"
+    finally:
+        bundle["colorsets"]["corporate"]["primary"] = "#003366"
+    assert len(list(cache.glob("*.npz"))) == 2  # noqa: PLR2004
+
+
+def test_no_cache(installed, monkeypatch):
+    monkeypatch.setenv(plugins.CACHE_ENV_VAR, "0")
+    assert plugins.cache_dir() is None
+    plugins.load("corporate")
+    assert not (installed / "cache").exists()
@@ -0,0 +1,74 @@
+"""Test recoloring of images."""
+
+import matplotlib
+import numpy as np
+import pytest
+
+import tol_colors as tc
+from tol_colors.recolor import recolor, recolor_table
+
+rng = np.random.default_rng(0)
+x = rng.random((64, 48))
+
+
+def render(cmap):
+    return matplotlib.colormaps[cmap](x, bytes=True)
+
+
+def test_recolor():
+    image = render("viridis")
+    image[:4] = [255, 255, 255, 255]  # background
+    image[-4:, :, 3] = 128
+    expected = tc.iridescent(x, bytes=True)
+
+    for size in [32, 256]:
+        out = recolor(image, "viridis", "iridescent", size=size)
+        assert out.shape == image.shape and out.dtype == np.uint8
+        assert (out[:4] == 255).all()  # noqa: PLR2004
+        assert (out[-4:, :, 3] == 128).all()  # noqa: PLR2004
+        diff = np.abs(out[4:-4].astype(int) - expected[4:-4]).max(axis=-1)
+        # neighbouring colors of viridis can be equal once rounded to bytes
+        assert diff.max() <= 2  # noqa: PLR2004
+
+    # exact table: colors of the source colormap are mapped exactly, except
+    # duplicates
+    colors = matplotlib.colormaps["viridis"](np.arange(256), bytes=True)[:, :3]
+    out = recolor(colors[None], "viridis", "tol.iridescent", size=256)
+    target = tc.iridescent(np.arange(256), bytes=True)[:, :3]
+    n_unique = len(np.unique(colors, axis=0))
+    assert (out[0] == target).all(axis=-1).sum() == n_unique
+
+    # floats, chunks, and RGB without alpha give the same result
+    ref = recolor(image, "viridis", "iridescent")
+    np.testing.assert_array_equal(
+        recolor(image / 255, "viridis", "iridescent", chunk_size=100), ref
+    )
+    np.testing.assert_array_equal(
+        recolor(image[..., :3], "viridis", "iridescent"), ref[..., :3]
+    )
+
+    # all colors are converted without max_distance
+    out = recolor(image, "viridis", "iridescent", max_distance=None)
+    assert (out[:4, :, :3] == tc.iridescent(1.0, bytes=True)[:3]).all()
+
+    with pytest.raises(ValueError):
+        recolor(image[..., :2], "viridis", "iridescent")
+    for size in [0, 1]:
+        with pytest.raises(ValueError):
+            recolor(image, "viridis", "iridescent", size=size)
+
+
+def test_table():
+    table = recolor_table("viridis", "iridescent", size=16)
+    assert table.shape == (16, 16, 16, 3)
+    assert not table.flags.writeable
+    assert recolor_table("viridis", "iridescent", size=16) is table
+
+    # colormap instances are not cached, but give the same table
+    viridis = matplotlib.colormaps["viridis"]
+    other = recolor_table(viridis, tc.iridescent, size=16)
+    assert other is not table
+    np.testing.assert_array_equal(other, table)
+
+    # grid points far from the source are unchanged
+    assert table[0, 15, 0].tolist() == [0, 255, 0]
@@ -0,0 +1,109 @@
+"""Test colorsets defined in JSON files."""
+
+import ast
+import json
+import os
+import pickle
+
+import pytest
+
+import tol_colors as tc
+from tol_colors import registry as reg
+from tol_colors.registry import ColorsetRegistry, colorset_type, read_json, type_name
+
+palettes = {
+    "corporate": {"primary": "#003366", "secondary": "#FF9900"},
+    "sea-side": {"sand": "#DDCC77", "sea": "#0077BB", "foam": "#EEEEEE"},
+}
+
+
+@pytest.fixture
+def fname(tmp_path):
+    fname = tmp_path / "palettes.json"
+    fname.write_text(json.dumps(palettes))
+    return fname
+
+
+def test_registry(fname):
+    registry = ColorsetRegistry.from_json(fname)
+    assert list(registry) == ["corporate", "sea_side"]
+    assert len(registry) == 2  # noqa: PLR2004
+    assert "sea-side" in registry and "sea_side" in registry
+    assert 0 not in registry
+
+    # types and instances are created on first access
+    assert not registry._types and not registry._colorsets
+    cset = registry["sea-side"]
+    assert list(registry._colorsets) == ["sea_side"]
+    assert type(cset).__name__ == "SeaSide"
+    assert cset._fields == ("sand", "sea", "foam")
+    assert cset.sea == "#0077BB"
+    assert cset.rgba8[1].tolist() == [0, 119, 187, 255]
+    assert registry["sea_side"] is cset
+    assert registry.get_type("corporate") is type(registry["corporate"])
+    # types are shared between registries
+    other = ColorsetRegistry(palettes)
+    assert type(other["corporate"]) is type(registry["corporate"])
+
+    with pytest.raises(KeyError):
+        registry["missing"]
+    with pytest.raises(KeyError):
+        registry.add("corporate", {"primary": "#000000"})
+    registry.add("corporate", {"primary": "#000000"}, replace=True)
+    assert registry["corporate"]._fields == ("primary",)
+    with pytest.raises(ValueError):
+        registry.add("bad", {"not valid": "#000000"})
+    with pytest.raises(ValueError):
+        registry.add("bad", {"class": "#000000"})
+    for reserved in ["rgb", "rgba8", "packed"]:
+        with pytest.raises(ValueError):
+            registry.add("bad", {"primary": "#000000", reserved: "#FFFFFF"})
+    with pytest.raises(ValueError):
+        registry.add("bad", {"_private": "#000000"})
+    assert "bad" not in registry
+
+    # instances can be sent to other processes
+    for cset in [registry["sea_side"], registry["corporate"]]:
+        new = pickle.loads(pickle.dumps(cset))
+        assert new == cset and type(new) is type(cset)
+
+
+def test_bundled():
+    registry = ColorsetRegistry.from_json()
+    assert sorted(registry) == sorted(tc.colorsets)
+    for name, cset in tc.colorsets.items():
+        assert registry[name] == cset
+        assert type(registry[name]) is type(cset)
+    assert type_name("high-contrast") == "HighContrast"
+    cls = colorset_type("high_contrast", tc.HighContrast._fields)
+    assert cls is not tc.HighContrast and cls.__name__ == "HighContrast"
+
+
+def test_read_json(fname, tmp_path):
+    assert read_json(fname) is read_json(fname)
+    assert read_json(fname)["corporate"] == palettes["corporate"]
+
+    # modified files are read again
+    wrapped = {"colorsets": {"mono": {"black": "#000000"}}}
+    fname.write_text(json.dumps(wrapped))
+    os.utime(fname, ns=(0, 0))
+    assert list(read_json(fname)) == ["mono"]
+
+    bad = tmp_path / "bad.json"
+    bad.write_text(json.dumps({"mono": ["#000000"]}))
+    with pytest.raises(ValueError):
+        read_json(bad)
+
+
+def test_stubs(fname, tmp_path):
+    registry = ColorsetRegistry.from_json(fname)
+    stubs = registry.stubs("palettes")
+    tree = ast.parse(stubs)
+    classes = [node.name for node in tree.body if isinstance(node, ast.ClassDef)]
+    assert classes == ["Corporate", "SeaSide", "_Registry"]
+    assert 'Literal["sea-side", "sea_side"]) -> SeaSide' in stubs
+    assert stubs.endswith("palettes: _Registry\n")
+
+    output = tmp_path / "palettes.pyi"
+    reg.main([str(fname), "-o", str(output)])
+    assert output.read_text() == registry.stubs()
@@ -0,0 +1,102 @@
+"""Test reversed colormaps sharing their lookup table."""
+
+import copy
+import pickle
+
+import matplotlib.pyplot as plt
+import numpy as np
+import pytest
+from matplotlib.colors import LinearSegmentedColormap, ListedColormap
+
+import tol_colors as tc
+from tol_colors.compact import memory_footprint
+from tol_colors.reverse import reversed_pair
+
+x = np.array([-1.0, 0.0, 0.1, 0.5, 0.99, 1.0, 2.0, np.nan])
+
+
+def make(kind):
+    if kind == "linear":
+        return LinearSegmentedColormap.from_list("test", ["r", "g", "b"], N=64)
+    return ListedColormap(["r", "g", "b"], name="test")
+
+
+@pytest.mark.parametrize("kind", ["linear", "listed"])
+@pytest.mark.parametrize("first", ["forward", "reverse"])
+def test_pair(kind, first):
+    cmap = make(kind).with_extremes(under="k", over="w", bad="y")
+    ref = cmap.reversed()
+    forward, reverse = reversed_pair(cmap)
+    assert isinstance(reverse, type(cmap))
+    assert reverse.name == ref.name
+
+    (forward if first == "forward" else reverse)(0.5)
+    assert forward._isinit and reverse._isinit
+    assert np.shares_memory(forward._lut, reverse._lut)
+    np.testing.assert_allclose(reverse(x), ref(x), atol=1e-15)
+    np.testing.assert_allclose(forward(x), cmap(x), atol=1e-15)
+    np.testing.assert_array_equal(reverse(x, bytes=True), ref(x, bytes=True))
+    assert memory_footprint(dict(f=forward, r=reverse)) == dict(
+        f=(cmap.N + 6) * 4 * 8, r=0
+    )
+
+
+def test_copies():
+    forward, reverse = reversed_pair(make("linear"))
+    for cmap in [reverse, forward]:
+        new = copy.copy(cmap).with_extremes(under="k")
+        new(0.5)
+        assert not forward._isinit and not reverse._isinit
+        assert pickle.loads(pickle.dumps(new)).N == new.N
+
+    reverse(0.5)
+    new = copy.copy(reverse)
+    assert not np.shares_memory(new._lut, forward._lut)
+    new = new.with_extremes(bad="r")
+    np.testing.assert_array_equal(reverse.get_bad(), [0, 0, 0, 0])
+    np.testing.assert_array_equal(reverse(np.arange(64)), forward(np.arange(64))[::-1])
+
+
+def test_registered():
+    for name in ["sunset", "BuRd_discrete", "rainbow_PuRd"]:
+        stored = dict.__getitem__(tc.colormaps, f"{name}_r")
+        stored(0.5)
+        np.testing.assert_allclose(
+            tc.colormaps[f"{name}_r"](x), tc.colormaps[name].reversed()(x), atol=1e-15
+        )
+        assert stored._isinit
+        assert np.shares_memory(stored._lut, dict.__getitem__(tc.colormaps, name)._lut)
+
+
+def test_lazy():
+    forward, reverse = reversed_pair(make("linear"))
+    assert "_segmentdata" not in reverse.__dict__
+    ref = make("linear").reversed()
+    np.testing.assert_array_equal(reverse.resampled(16)(x), ref.resampled(16)(x))
+    assert "_segmentdata" in reverse.__dict__
+    assert not forward._isinit
+
+    _, reverse = reversed_pair(make("listed"))
+    assert copy.copy(reverse).colors == ["b", "g", "r"]
+    assert reverse.colors == ["b", "g", "r"]
+    with pytest.raises(AttributeError):
+        reverse._segmentdata  # noqa: B018
+
+
+@pytest.mark.parametrize("name", ["sunset", "sunset_r", "BuRd_discrete_r"])
+def test_pickle(name):
+    cmap = getattr(tc, name)
+    for new in [pickle.loads(pickle.dumps(cmap)), copy.deepcopy(cmap)]:
+        assert new.name == cmap.name
+        np.testing.assert_array_equal(new(x), cmap(x))
+    # once the table is built
+    new = copy.deepcopy(cmap)
+    assert not np.shares_memory(new._lut, cmap._lut)
+    np.testing.assert_array_equal(pickle.loads(pickle.dumps(cmap))(x), cmap(x))
+
+    fig, ax = plt.subplots()
+    ax.imshow(np.arange(6.0).reshape(2, 3), cmap=cmap)
+    new = pickle.loads(pickle.dumps(fig))
+    assert new.axes[0].images[0].cmap.name == cmap.name
+    plt.close(fig)
+    plt.close(new)
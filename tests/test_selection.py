@@ -0,0 +1,59 @@
+"""Test the choice of colorsets."""
+
+import pytest
+
+import tol_colors as tc
+from tol_colors import selection
+
+
+def test_candidates():
+    cands = selection.candidates(4)
+    assert "land_cover" not in cands
+    assert cands["bright"] == list(tc.bright)[:4]
+    hc = tc.high_contrast
+    assert selection.candidates(3)["high_contrast"] == [hc.blue, hc.red, hc.yellow]
+    assert "rainbow_discrete" in cands
+    assert all(len(colors) == 4 for colors in cands.values())  # noqa: PLR2004
+
+    # muted has 9 colors besides pale grey
+    assert "muted" in selection.candidates(9)
+    assert "muted" not in selection.candidates(10)
+    assert list(selection.candidates(23)) == ["rainbow_discrete"]
+    assert selection.candidates(24) == {}
+
+
+def test_rank():
+    for n in [1, 3, 7, 12]:
+        names = selection.rank(n)
+        assert sorted(names) == sorted(selection.candidates(n))
+        assert selection.select(n) == selection.candidates(n)[names[0]]
+
+    # with one color, only the contrast with the background counts
+    white = selection.rank(1, "white")
+    black = selection.rank(1, "black")
+    assert white[0] == black[-1] == "dark"
+    assert white[-1] == black[0] == "pale"
+
+    # backgrounds are given as any matplotlib color
+    assert selection.rank(1, (0.0, 0.0, 0.0)) == black
+    assert selection.rank(1, "#000000") == black
+
+    with pytest.raises(ValueError):
+        selection.rank(0)
+    with pytest.raises(ValueError):
+        selection.rank(24)
+
+
+def test_cache():
+    selection.clear_cache()
+    selection.select(4, "white")
+    selection.select(4, (1.0, 1.0, 1.0))
+    assert selection._rank.cache_info().hits == 1
+    assert selection._table.cache_info().currsize == 1
+    selection.select(4, "black")
+    assert selection._table.cache_info().currsize == 1
+
+    # results can be modified without changing the cache
+    colors = selection.select(4)
+    colors.clear()
+    assert len(selection.select(4)) == 4  # noqa: PLR2004
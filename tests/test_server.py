@@ -0,0 +1,134 @@
+"""Test the colorization server."""
+
+import asyncio
+import io
+import json
+
+import numpy as np
+from PIL import Image
+
+import tol_colors as tc
+from tol_colors.colorize import colorize
+from tol_colors.server import Server, _Batcher, _render
+
+rng = np.random.default_rng(0)
+
+
+async def request(port, method, target, body=b""):
+    reader, writer = await asyncio.open_connection("127.0.0.1", port)
+    writer.write(
+        f"{method} {target} HTTP/1.1\r\nContent-Length: {len(body)}\r\n"
+        "Connection: close\r\n\r\n".encode()
+        + body
+    )
+    await writer.drain()
+    status = int((await reader.readline()).split()[1])
+    response = await reader.read()
+    writer.close()
+    return status, response.partition(b"\r\n\r\n")[2]
+
+
+def run(coro_func, **kwargs):
+    async def main():
+        async with Server(port=0, **kwargs) as server:
+            return await coro_func(server.port)
+
+    return asyncio.run(main())
+
+
+def test_colorize():
+    data = rng.normal(0, 1, (3, 16, 12)).astype(np.float32)
+
+    async def main(port):
+        target = "/colorize/{}?shape=16,12&vmin=-1&vmax=1"
+        return await asyncio.gather(
+            request(port, "POST", target.format("YlOrBr"), data[0].tobytes()),
+            request(port, "POST", target.format("YlOrBr"), data[1].tobytes()),
+            request(
+                port, "POST", target.format("sunset") + "&format=raw", data[2].tobytes()
+            ),
+        )
+
+    for batch_delay in [0.0, 0.05]:
+        (s1, png1), (s2, png2), (s3, raw) = run(main, batch_delay=batch_delay)
+        assert s1 == s2 == s3 == 200  # noqa: PLR2004
+        for out, array in [(png1, data[0]), (png2, data[1])]:
+            image = np.asarray(Image.open(io.BytesIO(out)).convert("RGBA"))
+            np.testing.assert_array_equal(image, colorize(array, "YlOrBr", -1, 1))
+        np.testing.assert_array_equal(
+            np.frombuffer(raw, np.uint8).reshape(16, 12, 4),
+            colorize(data[2], "sunset", -1, 1),
+        )
+
+
+def test_palette():
+    async def main(port):
+        return await asyncio.gather(
+            request(port, "GET", "/palette/bright"),
+            request(port, "GET", "/palette/BuRd_discrete"),
+            request(port, "GET", "/metrics"),
+        )
+
+    (s1, bright), (s2, burd), (s3, metrics) = run(main)
+    assert s1 == s2 == s3 == 200  # noqa: PLR2004
+    assert metrics.startswith(b"# HELP")
+    assert json.loads(bright)["colors"] == list(tc.bright)
+    assert len(json.loads(burd)["colors"]) == tc.BuRd_discrete.N
+
+
+def test_errors():
+    body = np.zeros((4, 4), np.float32).tobytes()
+
+    async def main(port):
+        return [
+            status
+            for status, _ in await asyncio.gather(
+                request(port, "GET", "/nothing"),
+                request(port, "GET", "/palette/unknown"),
+                request(port, "GET", "/colorize/YlOrBr"),
+                request(
+                    port, "POST", "/colorize/unknown?shape=4,4&vmin=0&vmax=1", body
+                ),
+                request(port, "POST", "/colorize/YlOrBr?shape=4,4", body),
+                request(port, "POST", "/colorize/YlOrBr?shape=4,5&vmin=0&vmax=1", body),
+                request(port, "BAD", ""),
+            )
+        ]
+
+    assert run(main) == [404, 404, 405, 404, 400, 400, 400]
+
+
+def test_invalid_in_batch():
+    body = np.zeros((4, 4), np.float32).tobytes()
+    target = "/colorize/YlOrBr?vmin=0&vmax=1"
+
+    async def main(port):
+        return [
+            status
+            for status, _ in await asyncio.gather(
+                request(port, "POST", target + "&shape=4,4", body),
+                request(port, "POST", target + "&shape=0,4", b""),
+                request(port, "POST", target + "&shape=4,4&N=0", body),
+                request(port, "POST", target + "&shape=4,4&N=100000000", body),
+                request(port, "POST", target + "&shape=4,4", body),
+            )
+        ]
+
+    assert run(main, batch_delay=0.05) == [200, 400, 400, 400, 200]
+
+    # an error in a batch only affects its own item
+    good = (np.zeros((2, 2)), "YlOrBr", 0, 1)
+    out = _render((256, "raw", 1), [good, (np.zeros((2, 2)), "unknown", 0, 1), good])
+    assert out[0] == out[2] == colorize(good[0], "YlOrBr", 0, 1).tobytes()
+    assert isinstance(out[1], KeyError)
+
+
+def test_cancelled_batch():
+    async def main():
+        loop = asyncio.get_running_loop()
+        task, future = loop.create_future(), loop.create_future()
+        task.cancel()
+        _Batcher._dispatch(task, [(None, future)])
+        return future.cancelled()
+
+    assert asyncio.run(main())
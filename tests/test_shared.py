@@ -0,0 +1,84 @@
+"""Test shared lookup tables."""
+
+import os
+import subprocess
+import sys
+
+import numpy as np
+import pytest
+
+import tol_colors as tc
+from tol_colors.shared import ENV_VAR, SharedLUTs
+
+
+@pytest.fixture
+def shared():
+    luts = SharedLUTs.create(N=512)
+    yield luts
+    luts.close()
+    luts.unlink()
+
+
+def test_create(shared):
+    assert set(shared.index) == set(tc.colormaps)
+
+    lut = shared.lut("sunset")
+    assert lut.shape == (515, 4)
+    cmap = tc.colormaps["sunset"].resampled(512)
+    cmap._init()
+    np.testing.assert_array_equal(lut, cmap._lut)
+
+    # discrete colormaps are not resampled
+    assert shared.lut("BuRd_discrete").shape == (tc.BuRd_discrete.N + 3, 4)
+
+
+def run_attached(shared, code):
+    """Run code in another process, attached to the shared block."""
+    code = (
+        "import numpy as np, pytest, tol_colors as tc\n"
+        "from tol_colors.shared import SharedLUTs\n"
+        f"attached = SharedLUTs.attach('{shared.name}')\n"
+    ) + code
+    subprocess.run([sys.executable, "-c", code], check=True)
+
+
+def test_attach(shared):
+    code = """
+assert set(attached.index) == set(tc.colormaps)
+cmap = attached.colormap("YlOrBr_r")
+assert cmap.N == 512
+assert np.shares_memory(cmap._lut, attached.data)
+x = np.linspace(0, 1, 5)
+np.testing.assert_array_equal(cmap(x), tc.YlOrBr_r.resampled(512)(x))
+
+# the shared table is copied when modified
+cmap.set_bad("r")
+assert not np.shares_memory(cmap._lut, attached.data)
+np.testing.assert_array_equal(cmap(np.nan), [1, 0, 0, 1])
+assert attached.colormap("YlOrBr_r")(np.nan) != cmap(np.nan)
+"""
+    run_attached(shared, code)
+
+
+def test_install(shared):
+    code = (
+        "import numpy as np, tol_colors as tc;"
+        "assert tc.sunset.N == 512;"
+        "assert not tc.sunset._lut.flags.writeable;"
+        "assert tc.colormaps['sunset']._lut.flags.writeable;"
+        "import matplotlib;"
+        "assert matplotlib.colormaps['tol.sunset'].N == 512;"
+        "tc.sunset.set_under('k');"
+        "assert tc.sunset(-1.0) == (0, 0, 0, 1)"
+    )
+    env = dict(os.environ, **{ENV_VAR: shared.name})
+    subprocess.run([sys.executable, "-c", code], env=env, check=True)
+
+
+def test_install_missing():
+    code = "import tol_colors as tc; assert not tc.sunset._isinit"
+    env = dict(os.environ, **{ENV_VAR: "tol_colors_missing"})
+    proc = subprocess.run(
+        [sys.executable, "-c", code], env=env, check=True, capture_output=True
+    )
+    assert b"not found, building them locally" in proc.stderr
@@ -0,0 +1,51 @@
+"""Test rendering of colormap strips."""
+
+import matplotlib
+import matplotlib.pyplot as plt
+import numpy as np
+
+import tol_colors as tc
+from tol_colors import strips
+
+
+def test_render():
+    image = strips.render(["sunset", tc.colormaps["BuRd_discrete"]], 64, 5, 2)
+    assert image.shape == (12, 64, 4) and image.dtype == np.uint8
+    # gaps are transparent
+    assert (image[5:7] == 0).all()
+    assert (image[:5, :, 3] == 255).all()  # noqa: PLR2004
+
+    x = (np.arange(64) + 0.5) / 64
+    np.testing.assert_array_equal(image[0], tc.sunset(x, bytes=True))
+    np.testing.assert_array_equal(image[4], image[0])
+    np.testing.assert_array_equal(image[7], tc.BuRd_discrete(x, bytes=True))
+
+    assert strips.render([]).shape == (0, 256, 4)
+
+
+def test_catalogue():
+    cmaps = strips.catalogue()
+    assert "sunset_discrete" in cmaps
+    assert not any(name.endswith("_r") for name in cmaps)
+    assert cmaps["rainbow_discrete, 23"].N == 23  # noqa: PLR2004
+    assert len(cmaps) == 18 + 23
+
+
+def test_draw():
+    fig, ax = plt.subplots()
+    im = strips.draw(ax, {"first": "viridis", "second": "tol.iridescent"}, height=8)
+    assert len(ax.images) == 1
+    assert im.get_array().shape == (20, 256, 4)
+    labels = [t.get_text() for t in ax.texts]
+    assert labels == ["first", "second"]
+    assert ax.texts[1].xy[1] == 16  # noqa: PLR2004
+    plt.close(fig)
+
+
+def test_save(tmp_path):
+    fname = tmp_path / "strips.png"
+    strips.save(fname, strips.catalogue(), width=100)
+    image = matplotlib.image.imread(fname)
+    np.testing.assert_array_equal(
+        np.round(image * 255), strips.render(strips.catalogue(), width=100)
+    )
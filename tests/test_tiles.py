@@ -0,0 +1,185 @@
+"""Test colorization and rendering of tiles."""
+
+import asyncio
+import io
+
+import numpy as np
+import pytest
+from matplotlib.colors import BoundaryNorm, Normalize
+from PIL import Image
+
+import tol_colors as tc
+from tol_colors import png
+from tol_colors.colorize import (
+    bin_indices,
+    byte_lut,
+    colorize,
+    colorize_bins,
+    colorize_many,
+    get_colormap,
+)
+from tol_colors.tiles import TileRenderer
+
+rng = np.random.default_rng(0)
+data = rng.normal(0, 3, (64, 48))
+data[0, :4] = [np.nan, -2.0, 2.0, 2.1]
+
+
+def decode(b: bytes) -> np.ndarray:
+    return np.asarray(Image.open(io.BytesIO(b)).convert("RGBA"))
+
+
+@pytest.mark.parametrize("name", ["YlOrBr", "BuRd_discrete", "sunset_r", "tol.PRGn"])
+def test_colorize(name):
+    cmap = get_colormap(name)
+    norm = Normalize(-2, 2)
+    np.testing.assert_array_equal(
+        colorize(data, name, -2, 2), cmap(norm(data), bytes=True)
+    )
+    masked = np.ma.masked_where(~(data <= 1.0), data)
+    np.testing.assert_array_equal(
+        colorize(masked, name, -2, 2), cmap(norm(masked), bytes=True)
+    )
+
+    cmap = cmap.with_extremes(under="k", over="w")
+    ref = cmap(norm(data), bytes=True)
+    np.testing.assert_array_equal(colorize(data, cmap, -2, 2), ref)
+
+    # computations in float32 might fall in neighbouring bins
+    out = colorize(data.astype(np.float32), cmap, -2, 2)
+    assert (out != ref).any(axis=-1).mean() < 1e-3  # noqa: PLR2004
+
+
+def test_colorize_flat():
+    # zero range, all valid values get the first color
+    x = np.array([-1.0, 2.0, 5.0, np.nan])
+    with np.errstate(all="raise"):
+        out = colorize(x, "sunset", 2, 2)
+    np.testing.assert_array_equal(out[:3], [[54, 75, 154, 255]] * 3)
+    np.testing.assert_array_equal(out[3], byte_lut("sunset")[-1])
+
+
+def test_byte_lut():
+    lut = byte_lut("sunset", 512)
+    assert lut.shape == (515, 4)
+    assert byte_lut("sunset", 512) is lut
+    assert not lut.flags.writeable
+    assert byte_lut("BuRd_discrete").shape == (tc.BuRd_discrete.N + 3, 4)
+
+
+def test_colorize_many():
+    arrays = [data, data[0], data[:3, :5], np.array([]), np.float64(0.5)]
+    cmaps = ["YlOrBr", "BuRd_discrete", tc.sunset.with_extremes(under="k"), "YlOrBr"]
+    cmaps.append(cmaps[2])
+    vmin = [-2, -1, 0, 0, -1]
+    vmax = [2, 1, 1, 1, 1]
+    out = colorize_many(arrays, cmaps, vmin, vmax)
+    for a, c, lo, hi, rgba in zip(arrays, cmaps, vmin, vmax, out, strict=True):
+        np.testing.assert_array_equal(rgba, colorize(a, c, lo, hi))
+        assert rgba.shape == (*np.shape(a), 4)
+    assert all(rgba.base is out[0].base for rgba in out)
+
+    masked = np.ma.masked_where(~(data <= 1.0), data)
+    out = colorize_many([data, masked], "BuRd_discrete", -2, 2)
+    np.testing.assert_array_equal(out[1], colorize(masked, "BuRd_discrete", -2, 2))
+    assert colorize_many([], "YlOrBr", 0, 1) == []
+
+    # constant arrays, with a zero range
+    arrays = [np.full(3, 2.0), data[:2, :2], np.array([1.0, np.nan])]
+    with np.errstate(all="raise"):
+        out = colorize_many(arrays, "sunset", [2, -1, 1], [2, 1, 1])
+    for a, lo, hi, rgba in zip(arrays, [2, -1, 1], [2, 1, 1], out, strict=True):
+        np.testing.assert_array_equal(rgba, colorize(a, "sunset", lo, hi))
+    np.testing.assert_array_equal(out[0], [[54, 75, 154, 255]] * 3)
+    with pytest.raises(ValueError):
+        colorize_many([data, data], "YlOrBr", [0], 1)
+
+
+@pytest.mark.parametrize("n_bins", [1, 4, 9])
+@pytest.mark.parametrize("name", ["BuRd_discrete", "YlOrBr"])
+def test_colorize_bins(name, n_bins):
+    cmap = get_colormap(name)
+    edges = np.linspace(-2, 2, n_bins + 1)
+    ref = cmap(BoundaryNorm(edges, cmap.N)(data[1:]), bytes=True)
+    np.testing.assert_array_equal(colorize_bins(data[1:], edges, name), ref)
+    big = np.tile(data[1:], (30, 30))
+    np.testing.assert_array_equal(
+        colorize_bins(big, edges, cmap, threads=3), np.tile(ref, (30, 30, 1))
+    )
+
+    masked = np.ma.masked_where(~(data <= 1.0), data)
+    ref = cmap(BoundaryNorm(edges, cmap.N)(masked), bytes=True)
+    np.testing.assert_array_equal(colorize_bins(masked, edges, name), ref)
+
+
+def test_bin_indices():
+    idx = bin_indices([-1.0, 0.0, 0.5, 1.0, 2.0, 3.0, np.nan], [0, 1, 2])
+    assert idx.dtype == np.uint8
+    np.testing.assert_array_equal(idx, [0, 1, 1, 2, 3, 3, 4])
+    for n in [5, 50]:
+        edges = np.linspace(-3, 3, n)
+        ref = np.searchsorted(edges, data, side="right")
+        ref[np.isnan(data)] = n + 1
+        np.testing.assert_array_equal(bin_indices(data, edges), ref)
+    with pytest.raises(ValueError):
+        bin_indices(data, [0, 0, 1])
+    with pytest.raises(ValueError):
+        bin_indices(data, [0, 1, 2], N=1)
+    with pytest.raises(ValueError):
+        bin_indices(data, [0, 1], N=300)
+
+
+def test_png():
+    image = rng.integers(0, 256, (5, 7, 4), dtype=np.uint8)
+    np.testing.assert_array_equal(decode(png.encode(image)), image)
+    rgb = decode(png.encode(image[..., :3], compress_level=1))
+    np.testing.assert_array_equal(rgb[..., :3], image[..., :3])
+
+    idx = rng.integers(0, 5, (5, 7), dtype=np.uint8)
+    palette = rng.integers(0, 256, (5, 4), dtype=np.uint8)
+    np.testing.assert_array_equal(
+        decode(png.encode_indexed(idx, palette)), palette[idx]
+    )
+
+    with pytest.raises(ValueError):
+        png.encode(image.astype(float))
+    with pytest.raises(ValueError):
+        png.encode_indexed(idx, np.zeros((300, 3), np.uint8))
+    with pytest.raises(ValueError):
+        png.encode_indexed(idx, palette, depth=2)
+    for shape in [(0, 7, 4), (5, 0, 4)]:
+        with pytest.raises(ValueError):
+            png.encode(np.zeros(shape, np.uint8))
+    with pytest.raises(ValueError):
+        png.encode_indexed(idx[:0], palette)
+
+
+@pytest.mark.parametrize("n", [2, 3, 16, 17, 256])
+@pytest.mark.parametrize("width", [1, 7, 8, 9])
+def test_png_depth(n, width):
+    idx = rng.integers(0, n, (3, width), dtype=np.uint8)
+    palette = rng.integers(0, 256, (n, 3), dtype=np.uint8)
+    out = png.encode_indexed(idx, palette)
+    assert out[24] == png.bit_depth(n)  # bit depth in header
+    assert Image.open(io.BytesIO(out)).mode == "P"
+    np.testing.assert_array_equal(decode(out)[..., :3], palette[idx])
+    np.testing.assert_array_equal(
+        decode(png.encode_indexed(idx, palette, depth=8)), decode(out)
+    )
+
+
+@pytest.mark.parametrize("name", ["YlOrBr", "BuRd_discrete"])
+def test_renderer(name):
+    renderer = TileRenderer(name, -2, 2, compress_level=1)
+    assert renderer.palette == name.endswith("discrete")
+    out = renderer.render(data)
+    assert Image.open(io.BytesIO(out)).mode == ("P" if renderer.palette else "RGBA")
+    np.testing.assert_array_equal(decode(out), colorize(data, name, -2, 2))
+
+    out = asyncio.run(renderer.render_async(data))
+    np.testing.assert_array_equal(decode(out), colorize(data, name, -2, 2))
+    outs = asyncio.run(renderer.render_many([data, data[::2]]))
+    assert len(outs) == 2  # noqa: PLR2004
+
+    with pytest.raises(ValueError):
+        TileRenderer("YlOrBr", 0, 1, palette=True)